@@ -0,0 +1,122 @@
+"""
+Compares reporting workers reading a columnar store with workers loading a snapshot.
+
+Builds a synthetic school in memory and writes it both as a snapshot and as a
+columnar store. Then starts worker processes that each open the data and
+answer the same reads: a few lookups with their relations, a search, and a
+page of students. Reports, per worker, the time until the data could be used,
+the time for the reads, and the private (anonymous) memory of the process,
+which on Linux excludes the page cache the columnar workers share.
+
+Run from the repository root:
+    python -m benchmarks.columnar [students] [workers]
+"""
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.csv_parallel import build_school
+from src.sms.data.dm.columnar import ColumnarDataManager, write_columnar_store
+from src.sms.data.dm.file import FileManager
+
+logging.disable(logging.WARNING)
+
+DEFAULT_STUDENTS = 100_000
+DEFAULT_WORKERS = 4
+COURSES_PER_STUDENT = 5
+LOOKUPS = 1_000
+
+
+def private_memory() -> int:
+    """
+    Reads the anonymous resident memory of the current process.
+
+    :return: The memory, in bytes, or 0 where /proc is not available.
+    :rtype: int
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def reads(get_student, search_courses, iter_students, students: int) -> int:
+    """
+    Runs the reads of a reporting worker.
+
+    :param get_student: Looks up a student by ID.
+    :param search_courses: Finds the courses whose ID contains a lowercase query.
+    :param iter_students: Returns a page of students after an ID.
+    :param students: The number of students in the school.
+    :type students: int
+    :return: A count derived from the results, so that nothing is skipped.
+    :rtype: int
+    """
+    total = 0
+    for n in range(0, students, max(1, students // LOOKUPS)):
+        student = get_student(f"{n:09d}")
+        total += sum(len(course.enrolled_students) for course in student.registered_courses)
+    total += len(search_courses("crse01"))
+    total += len(iter_students(f"{students // 2:09d}", 500))
+    return total
+
+
+def worker(mode: str, path: str, students: int, results):
+    """
+    Opens the data one way, runs the reads, and reports the timings and memory.
+
+    :param mode: "snapshot" or "columnar".
+    :param path: The path of the snapshot or store.
+    :param students: The number of students in the school.
+    :param results: The queue receiving (open time, read time, private memory, read result).
+    """
+    start = time.perf_counter()
+    if mode == "snapshot":
+        fm = FileManager.from_snapshot(path)
+        opened = time.perf_counter()
+        total = reads(fm.students.__getitem__,
+                      lambda q: [c for c in fm.courses.values() if q in c.course_id.lower()],
+                      lambda after, limit: sorted(k for k in fm.students if k > after)[:limit], students)
+    else:
+        ColumnarDataManager.open(path)
+        opened = time.perf_counter()
+        total = reads(ColumnarDataManager.get_student, ColumnarDataManager.search_courses,
+                      ColumnarDataManager.iter_students, students)
+    results.put((opened - start, time.perf_counter() - opened, private_memory(), total))
+
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_STUDENTS
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_WORKERS
+    fm = build_school(students, COURSES_PER_STUDENT)
+    print(f"{students:,} students, {students * COURSES_PER_STUDENT:,} enrollments, {workers} workers")
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = {"snapshot": os.path.join(tmpdir, "school.snap"), "columnar": os.path.join(tmpdir, "school.col")}
+        fm.save_to_snapshot(paths["snapshot"])
+        write_columnar_store(paths["columnar"], fm.instructors.values(), fm.courses.values(), fm.students.values())
+        del fm
+        for mode, path in paths.items():
+            results = context.Queue()
+            processes = [context.Process(target=worker, args=(mode, path, students, results)) for _ in range(workers)]
+            for process in processes:
+                process.start()
+            timings = [results.get() for _ in processes]
+            for process in processes:
+                process.join()
+            opening = max(t[0] for t in timings)
+            reading = max(t[1] for t in timings)
+            memory = sum(t[2] for t in timings) / len(timings)
+            print(f"{mode:>8}: {os.path.getsize(path) / 2 ** 20:5.1f} MiB file, open {opening:.3f} s, "
+                  f"reads {reading:.3f} s, {memory / 2 ** 20:6.1f} MiB private per worker")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures the throughput of single-row CRUD operations on the DatabaseManager.
+
+Each operation is timed on its own against a fresh database file, one row
+per call, and reported in operations per second. Updates alternate the order
+of their keyword arguments, as the GUI forms and the data managers do. The
+inserts and deletes are then repeated inside a single transaction, which
+commits once instead of once per row.
+
+Run from the repository root:
+    python -m benchmarks.crud_ops [rows]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+
+from src.sms.data.db.manager import DatabaseManager
+
+logging.disable(logging.WARNING)
+
+DEFAULT_ROWS = 5_000
+
+
+def timed(label: str, count: int, operation, within=None):
+    """
+    Runs an operation once per row and prints its throughput.
+
+    :param label: The name of the operation.
+    :type label: str
+    :param count: The number of rows.
+    :type count: int
+    :param operation: Called with each row number.
+    :type operation: Callable[[int], object]
+    :param within: A context manager wrapping all the calls (e.g., a transaction), timed with them.
+    :type within: ContextManager, optional
+    """
+    start = time.perf_counter()
+    with within or nullcontext():
+        for n in range(count):
+            operation(n)
+    elapsed = time.perf_counter() - start
+    print(f"{label:>16} | {count / elapsed:>12,.0f}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dbm = DatabaseManager(os.path.join(tmpdir, "bench.db"))
+        dbm.create_tables()
+        dbm.add_instructor("100000000", "Ada Lovelace", 36, "ada@school.edu")
+        dbm.add_course("CS100", "Computing", "100000000")
+        ids = [f"{n:09d}" for n in range(count)]
+
+        print(f"{'operation':>16} | {'ops/s':>12}")
+        print("-" * 31)
+        timed("add_student", count, lambda n: dbm.add_student(ids[n], "Student Name", 20, f"s{n}@school.edu"))
+        timed("get_student", count, lambda n: dbm.get_student(ids[n]))
+        timed("update_student", count,
+              lambda n: dbm.update_student(ids[n], name="Renamed", age=21) if n % 2 else
+              dbm.update_student(ids[n], age=21, name="Renamed"))
+        timed("enroll_student", count, lambda n: dbm.enroll_student(ids[n], "CS100"))
+        timed("get_courses", count, lambda n: dbm.get_courses_for_student(ids[n]))
+        timed("delete_student", count, lambda n: dbm.delete_student(ids[n]))
+        timed("add (1 txn)", count, lambda n: dbm.add_student(ids[n], "Student Name", 20, f"s{n}@school.edu"),
+              dbm.transaction())
+        timed("delete (1 txn)", count, lambda n: dbm.delete_student(ids[n]), dbm.transaction())
+        dbm.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Measures the CSV export of the DatabaseDataManager.
+
+Fills a fresh database with a synthetic school, then exports it to CSV twice:
+the way `data_to_csv` used to, by hydrating every record into model objects
+and serializing them with a FileManager, and by streaming the rows from the
+database straight to the files. Reports the time and the peak memory
+allocated by each, from an empty cache.
+
+Run from the repository root:
+    python -m benchmarks.csv_export [students] [courses per student]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks import scratch_db  # noqa: F401  (before the database module)
+from benchmarks.hydration import populate
+from src.sms.data.db.manager import DatabaseManager
+from src.sms.data.dm import database
+from src.sms.data.dm.database import DatabaseDataManager
+from src.sms.data.dm.file import FileManager
+
+logging.disable(logging.WARNING)
+
+DEFAULT_STUDENTS = 100_000
+DEFAULT_COURSES_PER_STUDENT = 10
+
+
+def hydrated_export(dirpath: str):
+    """
+    Exports to CSV through the object graph, as `data_to_csv` did before streaming.
+
+    :param dirpath: The path to the output directory.
+    :type dirpath: str
+    """
+    fm = FileManager()
+    data = DatabaseDataManager._get_hydrated_data()
+    fm.students = dict(data["students_map"])
+    fm.instructors = dict(data["instructors_map"])
+    fm.courses = dict(data["courses_map"])
+    fm.save_to_csv(dirpath)
+
+
+def measure(export, dirpath: str) -> tuple[float, int]:
+    """
+    Runs an export from an empty cache, once timed and once traced.
+
+    :param export: The export function, called with the output directory.
+    :param dirpath: The path to the output directory.
+    :type dirpath: str
+    :return: The time taken, in seconds, and the peak traced memory, in bytes.
+    :rtype: tuple[float, int]
+    """
+    DatabaseDataManager._clear_cache()
+    start = time.perf_counter()
+    export(dirpath)
+    elapsed = time.perf_counter() - start
+
+    DatabaseDataManager._clear_cache()
+    tracemalloc.start()
+    export(dirpath)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    DatabaseDataManager._clear_cache()
+    return elapsed, peak
+
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_STUDENTS
+    per_student = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_COURSES_PER_STUDENT
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dbm = DatabaseManager(os.path.join(tmpdir, "bench.db"))
+        dbm.create_tables()
+        populate(dbm, students, per_student)
+        database.dbm = dbm
+
+        print(f"{students:,} students, {students * per_student:,} enrollments")
+        for label, export in (("hydrated export", hydrated_export),
+                              ("streamed export", DatabaseDataManager.data_to_csv)):
+            elapsed, peak = measure(export, tmpdir)
+            print(f"{label}: {elapsed:.2f} s, peak {peak / 2 ** 20:,.1f} MiB")
+        dbm.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Measures the CSV export and import of the FileManager.
+
+Builds a synthetic school in memory, then times `save_to_csv` writing the
+four files one after another against doing it concurrently, and
+`load_from_csv` (with validation) parsing them. The speedup of the
+parallel save depends on the number of cores; on a single core it only
+adds overhead.
+
+Run from the repository root:
+    python -m benchmarks.csv_parallel [students] [courses per student]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from src.sms.data.dm.file import FileManager
+from src.sms.models.course import Course
+from src.sms.models.instructor import Instructor
+from src.sms.models.student import Student
+
+logging.disable(logging.WARNING)
+
+DEFAULT_STUDENTS = 100_000
+DEFAULT_COURSES_PER_STUDENT = 5
+COURSES = 1_000
+INSTRUCTORS = 100
+RUNS = 3
+
+
+def build_school(students: int, per_student: int) -> FileManager:
+    """
+    Builds a synthetic school whose records all pass the models' validation.
+
+    :param students: The number of students.
+    :type students: int
+    :param per_student: The number of courses each student is enrolled in.
+    :type per_student: int
+    :return: A FileManager holding the school.
+    :rtype: FileManager
+    """
+    fm = FileManager()
+    for n in range(INSTRUCTORS):
+        fm.instructors[f"{n:09d}"] = Instructor.from_trusted("Instructor Name", 40, f"i{n}@school.edu", f"{n:09d}")
+    for n in range(COURSES):
+        course_id = f"CRSE{n:03d}"
+        fm.courses[course_id] = Course.from_trusted(course_id, "Course Name", fm.instructors[f"{n % INSTRUCTORS:09d}"])
+    for n in range(students):
+        student = Student.from_trusted("Student Name", 20, f"s{n}@school.edu", f"{n:09d}")
+        fm.students[student.student_id] = student
+        for k in range(per_student):
+            student.register_course(fm.courses[f"CRSE{(n * 7 + k * 131) % COURSES:03d}"])
+    return fm
+
+
+def best_time(operation) -> float:
+    """
+    Runs an operation `RUNS` times.
+
+    :param operation: The operation to time.
+    :return: The best time, in seconds.
+    :rtype: float
+    """
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_STUDENTS
+    per_student = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_COURSES_PER_STUDENT
+    fm = build_school(students, per_student)
+    print(f"{students:,} students, {students * per_student:,} enrollments, {os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for label, parallel in (("sequential", False), ("parallel", True)):
+            save = best_time(lambda: fm.save_to_csv(tmpdir, parallel=parallel))
+            print(f"{label:>10}: save {save:.2f} s")
+        load = best_time(lambda: FileManager().load_from_csv(tmpdir))
+        print(f"{'load':>10}: {load:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Measures registration-day enrollment through the DatabaseDataManager.
+
+Enrolls a batch of students in each of a few courses, first one
+`enroll_student` call per student (one commit each) and then one
+`enroll_students` call per course (one commit per batch), against a fresh
+database file.
+
+Run from the repository root:
+    python -m benchmarks.enrollment [students per course]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks import scratch_db  # noqa: F401  (before the database module)
+from src.sms.data.db.manager import DatabaseManager
+from src.sms.data.dm import database
+from src.sms.data.dm.database import DatabaseDataManager
+
+logging.disable(logging.WARNING)
+
+DEFAULT_STUDENTS = 2_000
+COURSES = 5
+
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_STUDENTS
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dbm = DatabaseManager(os.path.join(tmpdir, "bench.db"))
+        dbm.create_tables()
+        dbm.bulk_load(
+            instructors=[("100000000", "Ada Lovelace", 36, "ada@school.edu")],
+            students=((f"{n:09d}", "Student Name", 20, f"s{n}@school.edu") for n in range(students)),
+            courses=((f"C{n:04d}", "Course Name", "100000000") for n in range(2 * COURSES)))
+        database.dbm = dbm
+        DatabaseDataManager._clear_cache()
+        student_ids = [f"{n:09d}" for n in range(students)]
+
+        start = time.perf_counter()
+        for n in range(COURSES):
+            for student_id in student_ids:
+                DatabaseDataManager.enroll_student(student_id, f"C{n:04d}")
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for n in range(COURSES, 2 * COURSES):
+            DatabaseDataManager.enroll_students(f"C{n:04d}", student_ids)
+        batched = time.perf_counter() - start
+
+        total = students * COURSES
+        print(f"{total:,} enrollments in {COURSES} courses")
+        print(f"enroll_student:  {single:.3f} s ({total / single:,.0f} /s)")
+        print(f"enroll_students: {batched:.3f} s ({total / batched:,.0f} /s)")
+        DatabaseDataManager._clear_cache()
+        dbm.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Measures the cold-start hydration time of the DatabaseDataManager.
+
+Fills a fresh database with instructors, courses, students, and enrollments,
+then times how long `DatabaseDataManager` takes to build its object graph
+from an empty cache, and how long a single lazy lookup (one student and their
+courses) takes from an empty cache.
+
+Run from the repository root:
+    python -m benchmarks.hydration [students] [courses per student]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks import scratch_db  # noqa: F401  (before the database module)
+from src.sms.data.db.manager import DatabaseManager
+from src.sms.data.dm import database
+from src.sms.data.dm.database import DatabaseDataManager
+
+logging.disable(logging.WARNING)
+
+DEFAULT_STUDENTS = 100_000
+DEFAULT_COURSES_PER_STUDENT = 10
+COURSES = 2_000
+INSTRUCTORS = 200
+RUNS = 3
+
+
+def populate(dbm: DatabaseManager, students: int, per_student: int):
+    """
+    Bulk loads a synthetic school into a database.
+
+    :param dbm: The database to fill.
+    :type dbm: DatabaseManager
+    :param students: The number of students.
+    :type students: int
+    :param per_student: The number of courses each student is enrolled in.
+    :type per_student: int
+    """
+    dbm.bulk_load(
+        instructors=((f"{n:09d}", "Instructor Name", 40, f"i{n}@school.edu") for n in range(INSTRUCTORS)),
+        students=((f"{n:09d}", "Student Name", 20, f"s{n}@school.edu") for n in range(students)),
+        courses=((f"C{n:04d}", "Course Name", f"{n % INSTRUCTORS:09d}") for n in range(COURSES)),
+        enrollments=((f"{n:09d}", f"C{(n * 7 + k * 131) % COURSES:04d}")
+                     for n in range(students) for k in range(per_student)),
+        defer_indexes=True, fast=True)
+
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_STUDENTS
+    per_student = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_COURSES_PER_STUDENT
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dbm = DatabaseManager(os.path.join(tmpdir, "bench.db"))
+        dbm.create_tables()
+        populate(dbm, students, per_student)
+        database.dbm = dbm
+
+        timings = []
+        for _ in range(RUNS):
+            DatabaseDataManager._clear_cache()
+            start = time.perf_counter()
+            data = DatabaseDataManager._get_hydrated_data()
+            timings.append(time.perf_counter() - start)
+        enrollments = sum(len(s.registered_courses) for s in data["students_map"].values())
+        print(f"{len(data['students_map']):,} students, {len(data['courses_map']):,} courses, "
+              f"{enrollments:,} enrollments")
+        print(f"cold hydration: best {min(timings):.2f} s, mean {sum(timings) / RUNS:.2f} s")
+
+        timings = []
+        for n in range(RUNS):
+            DatabaseDataManager._clear_cache()
+            start = time.perf_counter()
+            len(DatabaseDataManager.get_student(f"{n * 997 % students:09d}").registered_courses)
+            timings.append(time.perf_counter() - start)
+        print(f"cold get_student + courses: best {min(timings) * 1000:.2f} ms")
+        DatabaseDataManager._clear_cache()
+        dbm.close()
+
+
+if __name__ == "__main__":
+    main()
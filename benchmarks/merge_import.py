@@ -0,0 +1,107 @@
+"""
+Measures applying a small correction file through the DatabaseDataManager.
+
+Fills a fresh database with a synthetic school, exports it to JSON, and
+writes a correction file in which a few hundred students have a changed name
+and one course fewer. Times importing the whole export (which wipes and
+reloads every table) against merging the correction file in, which only
+reads and writes the rows it names.
+
+Run from the repository root:
+    python -m benchmarks.merge_import [students] [corrected students]
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks import scratch_db  # noqa: F401  (before the database module)
+from src.sms.data.db.manager import DatabaseManager
+from src.sms.data.dm import database
+from src.sms.data.dm.database import DatabaseDataManager
+
+logging.disable(logging.WARNING)
+
+DEFAULT_STUDENTS = 20_000
+DEFAULT_CORRECTED = 200
+COURSES_PER_STUDENT = 10
+COURSES = 1_000
+INSTRUCTORS = 100
+
+
+def populate(dbm: DatabaseManager, students: int):
+    """
+    Bulk loads a synthetic school whose records all pass the models' validation.
+
+    :param dbm: The database to fill.
+    :type dbm: DatabaseManager
+    :param students: The number of students.
+    :type students: int
+    """
+    dbm.bulk_load(
+        instructors=((f"{n:09d}", "Instructor Name", 40, f"i{n}@school.edu") for n in range(INSTRUCTORS)),
+        students=((f"{n:09d}", "Student Name", 20, f"s{n}@school.edu") for n in range(students)),
+        courses=((f"CRSE{n:03d}", "Course Name", f"{n % INSTRUCTORS:09d}") for n in range(COURSES)),
+        enrollments=((f"{n:09d}", f"CRSE{(n * 7 + k * 131) % COURSES:03d}")
+                     for n in range(students) for k in range(COURSES_PER_STUDENT)),
+        defer_indexes=True, fast=True)
+
+
+def write_correction(export_path: str, correction_path: str, corrected: int):
+    """
+    Writes a correction file holding every instructor and course of an export, and a few changed students.
+
+    :param export_path: The path of the full JSON export.
+    :type export_path: str
+    :param correction_path: The path of the correction file to write.
+    :type correction_path: str
+    :param corrected: The number of students to include, each renamed and dropped from one course.
+    :type corrected: int
+    """
+    with open(export_path, encoding="utf-8") as f:
+        data = json.load(f)
+    students = data["students"][:corrected]
+    for student in students:
+        student["name"] = "Corrected Name"
+        student["registered_courses"] = student["registered_courses"][1:]
+    data["students"] = students
+    for course in data["courses"]:
+        course["enrolled_students"] = []
+    with open(correction_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_STUDENTS
+    corrected = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CORRECTED
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dbm = DatabaseManager(os.path.join(tmpdir, "bench.db"))
+        dbm.create_tables()
+        populate(dbm, students)
+        database.dbm = dbm
+        DatabaseDataManager._clear_cache()
+
+        export_path = os.path.join(tmpdir, "export.json")
+        correction_path = os.path.join(tmpdir, "correction.json")
+        DatabaseDataManager.data_to_json(export_path)
+        write_correction(export_path, correction_path, corrected)
+
+        start = time.perf_counter()
+        DatabaseDataManager.data_from_json(export_path)
+        replace = time.perf_counter() - start
+
+        start = time.perf_counter()
+        counts = DatabaseDataManager.data_from_json(correction_path, merge=True)
+        merge = time.perf_counter() - start
+
+        print(f"{students:,} students, correction of {corrected:,}: {counts}")
+        print(f"replace import: {replace:.3f} s")
+        print(f"merge import:   {merge:.3f} s")
+        DatabaseDataManager._clear_cache()
+        dbm.close()
+
+
+if __name__ == "__main__":
+    main()
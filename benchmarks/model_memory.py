@@ -0,0 +1,124 @@
+"""
+Measures the memory footprint of the model classes.
+
+Compares the `__slots__`-based `Student` against a dict-backed replica of the
+previous layout (plain instance attributes and a list of registered courses)
+and reports the bytes allocated per entity at several roster sizes.
+
+`Student` validates its email through the memoized `check_email_r`, whose
+cache would otherwise grow (and, once full, churn) inside the measured
+window. The objects are therefore measured with the cache bypassed, and the
+cache's own cost is reported in a column of its own.
+
+Run from the repository root:
+    python -m benchmarks.model_memory [sizes...]
+"""
+import gc
+import logging
+import sys
+import tracemalloc
+
+from src.sms.models import person
+from src.sms.models.student import Student
+from src.sms.utils.validator import check_email_r
+
+logging.disable(logging.WARNING)
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+
+class DictStudent:
+    """Dict-backed replica of the student layout before `__slots__` were introduced."""
+
+    def __init__(self, name: str, age: int, email: str, student_id: str):
+        self.name = name.strip()
+        self.age = age
+        self._email = email.strip()
+        self.student_id = student_id.strip()
+        self.registered_courses = []
+
+
+def make_rows(count: int) -> list[tuple]:
+    """
+    Builds the constructor arguments up front so their strings are not measured.
+
+    :param count: The number of rows to build.
+    :type count: int
+    :return: A list of (name, age, email, student_id) tuples.
+    :rtype: list[tuple]
+    """
+    return [("Student Name", 20, f"s{n}@school.edu", f"{n:09d}") for n in range(count)]
+
+
+def bytes_per_entity(cls, rows: list[tuple]) -> float:
+    """
+    Measures the memory allocated per object when building one object per row.
+
+    :param cls: The class to instantiate.
+    :param rows: The constructor arguments.
+    :type rows: list[tuple]
+    :return: The average number of bytes allocated per object.
+    :rtype: float
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = [cls(*row) for row in rows]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # exclude the list that holds the objects
+    allocated -= sys.getsizeof(objects)
+    del objects
+    return allocated / len(rows)
+
+
+def student_bytes_per_entity(rows: list[tuple]) -> float:
+    """
+    Measures the memory allocated per `Student`, leaving out the email verdict cache.
+
+    :param rows: The constructor arguments.
+    :type rows: list[tuple]
+    :return: The average number of bytes allocated per object.
+    :rtype: float
+    """
+    person.check_email_r = check_email_r.__wrapped__
+    try:
+        return bytes_per_entity(Student, rows)
+    finally:
+        person.check_email_r = check_email_r
+
+
+def email_cache_bytes(rows: list[tuple]) -> float:
+    """
+    Measures the memory allocated per row by caching the rows' email verdicts in an empty cache.
+
+    :param rows: The constructor arguments.
+    :type rows: list[tuple]
+    :return: The average number of bytes allocated per row.
+    :rtype: float
+    """
+    check_email_r.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    for _, _, email, _ in rows:
+        check_email_r(email)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    check_email_r.cache_clear()
+    return allocated / len(rows)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'students':>10} | {'dict-backed B/entity':>20} | {'slots B/entity':>15} | {'saving':>7} | "
+          f"{'email cache B/entity':>20}")
+    print("-" * 85)
+    for size in sizes:
+        rows = make_rows(size)
+        before = bytes_per_entity(DictStudent, rows)
+        after = student_bytes_per_entity(rows)
+        cache = email_cache_bytes(rows)
+        print(f"{size:>10,} | {before:>20.1f} | {after:>15.1f} | {1 - after / before:>6.1%} | {cache:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
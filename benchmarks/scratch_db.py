@@ -0,0 +1,15 @@
+"""
+Points the application database at a throwaway file for the benchmarks.
+
+Importing `src.sms.data.dm.database` opens the application database and
+creates or migrates its tables. Benchmarks import this module first, so that
+the database opened then is a scratch file removed on exit rather than the
+developer's `sms.db`; each benchmark then fills its own database.
+"""
+import os
+import tempfile
+
+_SCRATCH_DIR = tempfile.TemporaryDirectory(prefix="sms-bench-")
+
+# the name of `database.DATABASE_PATH_VARIABLE`, which cannot be imported without opening the database
+os.environ["SMS_DB_PATH"] = os.path.join(_SCRATCH_DIR.name, "sms.db")
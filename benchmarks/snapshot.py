@@ -0,0 +1,42 @@
+"""
+Compares the binary snapshot format with JSON for the in-memory datastore.
+
+Builds a synthetic school in memory, saves it as JSON and as a snapshot, and
+reports each file's size and how long the FileManager takes to save and load
+it. Loading JSON validates every record, as the memory backend does; a
+snapshot is verified by its checksum instead.
+
+Run from the repository root:
+    python -m benchmarks.snapshot [students] [courses per student]
+"""
+import logging
+import os
+import sys
+import tempfile
+
+from benchmarks.csv_parallel import best_time, build_school
+from src.sms.data.dm.file import FileManager
+
+logging.disable(logging.WARNING)
+
+DEFAULT_STUDENTS = 100_000
+DEFAULT_COURSES_PER_STUDENT = 5
+
+
+def main():
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_STUDENTS
+    per_student = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_COURSES_PER_STUDENT
+    fm = build_school(students, per_student)
+    print(f"{students:,} students, {students * per_student:,} enrollments")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for label, extension, save, load in (("json", "json", FileManager.save_to_json, FileManager.load_from_json),
+                                             ("snapshot", "snap", FileManager.save_to_snapshot,
+                                              FileManager.load_from_snapshot)):
+            path = os.path.join(tmpdir, f"school.{extension}")
+            saving = best_time(lambda: save(fm, path))
+            loading = best_time(lambda: load(FileManager(), path))
+            print(f"{label:>8}: {os.path.getsize(path) / 2 ** 20:6.1f} MiB, save {saving:.2f} s, load {loading:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Backs up a live SQLite database.
+
+This module provides the `backup_database` function. Copying the database
+file while the application is writing to it can capture a half-written,
+inconsistent state, and misses changes still held in the WAL file. The backup
+is instead taken with SQLite's online backup API, which copies the database
+page by page from a consistent snapshot and lets other connections keep
+reading and writing between steps.
+
+A backup can be written as a plain SQLite database, gzip-compressed, or
+incrementally, by updating an earlier backup with only the pages that changed
+since it was taken.
+
+Plain and compressed backups are written to a temporary file, which is synced
+to disk and then renamed over the target, so an error or crash partway through
+leaves the previous backup intact. An incremental backup instead patches the
+earlier backup in place, which is what keeps its writes small; it is synced
+once complete, but if it is interrupted, the earlier backup is left partly
+updated and must not be restored.
+
+Attributes:
+    BACKUP_STEP_PAGES (int): The number of pages copied per step of the backup API.
+    GZIP_SUFFIX (str): The file name suffix of compressed backups.
+"""
+import gzip
+import os
+import shutil
+import sqlite3
+import tempfile
+from typing import Callable
+
+BACKUP_STEP_PAGES = 256
+
+GZIP_SUFFIX = ".gz"
+
+
+def backup_database(source_path: str, target_path: str, compress: bool = False, incremental: bool = False,
+                    progress: Callable[[int, int], None] = None, step_pages: int = BACKUP_STEP_PAGES) -> int:
+    """
+    Writes a consistent copy of a database to a file.
+
+    The snapshot is first copied to a temporary file next to the target. A
+    plain or compressed backup then replaces the target only once it is
+    complete and synced, so a failed backup never leaves a partial file behind.
+    An incremental backup is merged into the target in place instead, and is
+    not crash-safe: if it is interrupted, write a full backup next.
+
+    This function blocks until the backup is complete; the GUIs run it in a
+    worker thread.
+
+    :param source_path: The path of the database to back up.
+    :type source_path: str
+    :param target_path: The path of the backup file.
+    :type target_path: str
+    :param compress: Whether to gzip the backup. Defaults to False.
+    :type compress: bool, optional
+    :param incremental: Whether to update an existing backup at `target_path` in place, writing only the
+                        pages that differ. If there is no earlier backup, a full one is written.
+                        Defaults to False.
+    :type incremental: bool, optional
+    :param progress: Called after each step with the number of pages copied so far and the total.
+    :type progress: Callable[[int, int], None], optional
+    :param step_pages: The number of pages copied per step. Defaults to `BACKUP_STEP_PAGES`.
+    :type step_pages: int, optional
+    :return: The number of pages written to the backup file.
+    :rtype: int
+    :raises ValueError: If both `compress` and `incremental` are requested.
+    :raises sqlite3.Error: If the database cannot be read.
+    :raises OSError: If the backup file cannot be written.
+    """
+    if compress and incremental:
+        raise ValueError("A compressed backup cannot be updated incrementally.")
+
+    directory = os.path.dirname(os.path.abspath(target_path))
+    fd, snapshot_path = tempfile.mkstemp(suffix=".db", dir=directory)
+    os.close(fd)
+    try:
+        page_size, page_count = _snapshot(source_path, snapshot_path, progress, step_pages)
+        if compress:
+            _compress(snapshot_path, target_path, directory)
+            return page_count
+        if incremental and os.path.isfile(target_path):
+            return _merge_changed_pages(snapshot_path, target_path, page_size)
+        with open(snapshot_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(snapshot_path, target_path)
+        return page_count
+    finally:
+        if os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
+
+
+def _compress(snapshot_path: str, target_path: str, directory: str):
+    """
+    Gzips a snapshot into a temporary file, which then replaces the target.
+
+    :param snapshot_path: The path of the snapshot.
+    :type snapshot_path: str
+    :param target_path: The path of the compressed backup.
+    :type target_path: str
+    :param directory: The directory of the temporary file, the same as the target's.
+    :type directory: str
+    """
+    fd, compressed_path = tempfile.mkstemp(suffix=GZIP_SUFFIX, dir=directory)
+    try:
+        with open(snapshot_path, "rb") as src, os.fdopen(fd, "wb") as raw:
+            # named after the target, so the gzip header records the same file name as gzip.open would
+            with gzip.GzipFile(filename=target_path, mode="wb", fileobj=raw) as dst:
+                shutil.copyfileobj(src, dst)
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(compressed_path, target_path)
+    except BaseException:
+        os.remove(compressed_path)
+        raise
+
+
+def _snapshot(source_path: str, snapshot_path: str, progress: Callable[[int, int], None] | None,
+              step_pages: int) -> tuple[int, int]:
+    """
+    Copies a database to a new file with the online backup API.
+
+    :param source_path: The path of the database to copy.
+    :type source_path: str
+    :param snapshot_path: The path of the copy.
+    :type snapshot_path: str
+    :param progress: Called after each step with the number of pages copied so far and the total.
+    :type progress: Callable[[int, int], None] | None
+    :param step_pages: The number of pages copied per step.
+    :type step_pages: int
+    :return: The page size and the number of pages of the copy.
+    :rtype: tuple[int, int]
+    """
+    def report(_status, remaining, total):
+        progress(total - remaining, total)
+
+    source = sqlite3.connect(source_path)
+    target = sqlite3.connect(snapshot_path)
+    try:
+        source.backup(target, pages=step_pages, progress=report if progress else None)
+        # a backup of a WAL database is itself in WAL mode; a standalone file should not need a -wal file
+        target.execute("PRAGMA journal_mode = DELETE")
+        page_size = target.execute("PRAGMA page_size").fetchone()[0]
+        page_count = target.execute("PRAGMA page_count").fetchone()[0]
+    finally:
+        target.close()
+        source.close()
+    return page_size, page_count
+
+
+def _merge_changed_pages(snapshot_path: str, target_path: str, page_size: int) -> int:
+    """
+    Updates an earlier backup to match a new snapshot, rewriting only the pages that differ.
+
+    The backup is patched in place and synced at the end; it is not
+    consistent until this returns.
+
+    :param snapshot_path: The path of the new snapshot.
+    :type snapshot_path: str
+    :param target_path: The path of the earlier backup.
+    :type target_path: str
+    :param page_size: The database page size, in bytes.
+    :type page_size: int
+    :return: The number of pages written.
+    :rtype: int
+    """
+    written = 0
+    with open(snapshot_path, "rb") as src, open(target_path, "r+b") as dst:
+        offset = 0
+        while page := src.read(page_size):
+            dst.seek(offset)
+            if dst.read(page_size) != page:
+                dst.seek(offset)
+                dst.write(page)
+                written += 1
+            offset += len(page)
+        dst.truncate(offset)
+        dst.flush()
+        os.fsync(dst.fileno())
+    return written
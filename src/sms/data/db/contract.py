@@ -10,6 +10,11 @@ Attributes:
     INSTRUCTOR_SCHEMA (str): SQL schema for the 'instructors' table.
     COURSE_SCHEMA (str): SQL schema for the 'courses' table.
     ENROLLMENT_SCHEMA (str): SQL schema for the 'enrollments' join table.
+    SEARCH_TABLES (dict): The tables with a full-text search index, mapped to their indexed columns,
+        primary key first.
+    SEARCH_SCHEMA (tuple): SQL templates for a table's key table and its FTS5 trigram search index.
+    SEARCH_TRIGGERS (tuple): SQL templates for the triggers keeping a search index in sync with its table.
+    SEARCH_REBUILD (tuple): SQL templates repopulating a table's search index from the table.
 """
 
 STUDENT_SCHEMA = """
@@ -52,3 +57,70 @@ ENROLLMENT_SCHEMA = """
                         FOREIGN KEY (course_id) REFERENCES courses (course_id) ON DELETE CASCADE
                     );
                     """
+
+SEARCH_TABLES = {"students": ("student_id", "name", "email"),
+                 "instructors": ("instructor_id", "name", "email"),
+                 "courses": ("course_id", "course_name")}
+
+# the templates are formatted with a table's name, its primary key (the first of its indexed columns),
+# and its indexed columns. The tables have TEXT primary keys, so their implicit rowids may be renumbered
+# by VACUUM; each search index is therefore keyed on the rowid of its own key table instead, which is
+# an INTEGER PRIMARY KEY and never changes
+SEARCH_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS {table}_search_keys
+    (
+        search_id INTEGER PRIMARY KEY,
+        {key}     TEXT NOT NULL UNIQUE
+    );
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS {table}_search USING fts5
+    (
+        {columns},
+        tokenize = 'trigram'
+    );
+    """,
+)
+
+SEARCH_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS {table}_search_insert
+        AFTER INSERT
+        ON {table}
+    BEGIN
+        INSERT INTO {table}_search_keys ({key}) VALUES (new.{key});
+        INSERT INTO {table}_search (rowid, {columns})
+        VALUES ((SELECT search_id FROM {table}_search_keys WHERE {key} = new.{key}), {new_columns});
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS {table}_search_delete
+        AFTER DELETE
+        ON {table}
+    BEGIN
+        DELETE FROM {table}_search WHERE rowid = (SELECT search_id FROM {table}_search_keys WHERE {key} = old.{key});
+        DELETE FROM {table}_search_keys WHERE {key} = old.{key};
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS {table}_search_update
+        AFTER UPDATE
+        ON {table}
+    BEGIN
+        UPDATE {table}_search_keys SET {key} = new.{key} WHERE {key} = old.{key};
+        UPDATE {table}_search SET ({columns}) = ({new_columns})
+        WHERE rowid = (SELECT search_id FROM {table}_search_keys WHERE {key} = new.{key});
+    END;
+    """,
+)
+
+SEARCH_REBUILD = (
+    "DELETE FROM {table}_search",
+    "DELETE FROM {table}_search_keys",
+    "INSERT INTO {table}_search_keys ({key}) SELECT {key} FROM {table} ORDER BY rowid",
+    """
+    INSERT INTO {table}_search (rowid, {columns})
+    SELECT k.search_id, {table_columns} FROM {table}_search_keys k JOIN {table} t ON t.{key} = k.{key}
+    """,
+)
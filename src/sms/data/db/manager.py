@@ -6,57 +6,259 @@ for connecting to an SQLite database and performing CRUD operations
 for students, instructors, courses, and enrollments.
 """
 
+import json
 import logging
 import os
 import sqlite3
+from contextlib import contextmanager
 
 from .contract import *
+from .migrations import has_search_indexes, migrate, rebuild_search_indexes
+from .pool import ConnectionPool, DEFAULT_BUSY_TIMEOUT
+from .statements import DEFAULT_CACHED_STATEMENTS, UPDATABLE_COLUMNS, full_update_sql, update_statement
 
 logger = logging.getLogger(__name__)
 
+STREAM_BATCH_SIZE = 10_000
+"""The number of rows fetched at a time by `stream_tables`."""
+
+# ordered so that every row's references are streamed before it
+_STREAM_QUERIES = (("instructors", "SELECT name, age, email, instructor_id FROM instructors"),
+                   ("students", "SELECT name, age, email, student_id FROM students"),
+                   ("courses", "SELECT course_id, course_name, instructor_id FROM courses"),
+                   # the primary key index yields each student's enrollments together, so no sort is needed
+                   ("enrollments", "SELECT student_id, json_group_array(course_id) FROM enrollments "
+                                   "GROUP BY student_id"))
+
+# the column order of the CSV files written by `FileManager.save_to_csv`
+_CSV_QUERIES = (("instructors", "SELECT name, age, email, instructor_id FROM instructors"),
+                ("students", "SELECT name, age, email, student_id FROM students"),
+                ("courses", "SELECT course_id, course_name, instructor_id FROM courses"),
+                # ordered by the primary key, so it is read from the key index without sorting
+                ("enrollments", "SELECT student_id, course_id FROM enrollments ORDER BY student_id, course_id"))
+
 
 class DatabaseManager:
-    def __init__(self, db_path: str = 'sms.db'):
+    def __init__(self, db_path: str = 'sms.db', busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+                 cached_statements: int = DEFAULT_CACHED_STATEMENTS):
         """
         Initializes the DatabaseManager and connects to the database.
 
+        Connections are pooled: each thread reads through its own connection,
+        and writes are serialized through a single writer connection. Every
+        connection reuses one cursor and keeps its prepared statements cached.
+
         :param db_path: The file path for the SQLite database. Defaults to 'sms.db'.
         :type db_path: str
+        :param busy_timeout: The number of seconds to wait for a lock held by another
+                             connection before failing. Defaults to `DEFAULT_BUSY_TIMEOUT`.
+        :type busy_timeout: float, optional
+        :param cached_statements: The number of prepared statements each connection keeps.
+                                  Defaults to `DEFAULT_CACHED_STATEMENTS`.
+        :type cached_statements: int, optional
         """
         self.db_path = os.path.abspath(db_path)
-        self.conn = None
+        self.pool = None
+        self._transaction_depth = 0
+        self.search_enabled = False
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            # enable foreign key constraints
-            self.conn.execute("PRAGMA foreign_keys = 1;")
+            self.pool = ConnectionPool(self.db_path, busy_timeout, cached_statements)
             logger.info(f"Successfully connected to database at {self.db_path}")
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
 
+    @contextmanager
+    def transaction(self):
+        """
+        Groups the writes made in its block into one atomic transaction.
+
+        The writer connection is held by the calling thread for the whole
+        block, and the writes inside it (including those of the other methods)
+        are committed together when the block exits, with a single commit.
+        If the block raises, they are all rolled back and the exception is
+        re-raised. Reads made by the thread inside the block see its
+        uncommitted writes.
+
+        Transactions may be nested; an inner one is a savepoint, so if it
+        fails only its own writes are rolled back.
+
+        :return: A context manager yielding the writer connection's reusable cursor.
+        :raises sqlite3.Error: If the transaction cannot be started or committed.
+        """
+        with self.pool.write() as conn:
+            cursor = self.pool.cursor()
+            depth = self._transaction_depth
+            savepoint = f"transaction_{depth}"
+            cursor.execute(f"SAVEPOINT {savepoint}" if depth else "BEGIN")
+            self._transaction_depth += 1
+            try:
+                yield cursor
+            except BaseException:
+                if depth:
+                    cursor.execute(f"ROLLBACK TO {savepoint}")
+                    cursor.execute(f"RELEASE {savepoint}")
+                else:
+                    conn.rollback()
+                raise
+            else:
+                if depth:
+                    cursor.execute(f"RELEASE {savepoint}")
+                else:
+                    conn.commit()
+            finally:
+                self._transaction_depth -= 1
+
+    @contextmanager
+    def _writing(self):
+        """
+        Runs a write on the writer connection and commits it.
+
+        The writer connection is held exclusively for the duration. If a
+        database error occurs, the changes are rolled back and the error is
+        re-raised. Inside `transaction()`, the write joins that transaction
+        instead and is neither committed nor rolled back on its own (a failed
+        statement leaves no partial changes).
+
+        :return: A context manager yielding the writer connection's reusable cursor.
+        """
+        with self.pool.write() as conn:
+            if self._transaction_depth:
+                yield self.pool.cursor()
+                return
+            try:
+                yield self.pool.cursor()
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """
+        Runs a query on the calling thread's reusable cursor.
+
+        :param sql: The SQL query.
+        :type sql: str
+        :param params: The query parameters.
+        :type params: tuple, optional
+        :return: All result rows.
+        :rtype: list[tuple]
+        """
+        return self.pool.cursor().execute(sql, params).fetchall()
+
+    def _query_one(self, sql: str, params: tuple = ()) -> tuple | None:
+        """
+        Runs a query expected to return at most one row, such as a primary key lookup.
+
+        The result set is read to the end so the statement is finished and does
+        not keep a read snapshot open on the connection.
+
+        :param sql: The SQL query.
+        :type sql: str
+        :param params: The query parameters.
+        :type params: tuple, optional
+        :return: The first result row, or None if there is none.
+        :rtype: tuple | None
+        """
+        rows = self._query(sql, params)
+        return rows[0] if rows else None
+
     def create_tables(self) -> bool:
         """
         Creates all necessary tables in the database using the defined schemas.
 
+        Tables that already exist are kept, and are then brought up to the
+        current schema version by the pending migrations.
+
         :return: True if tables were created successfully, False otherwise.
         :rtype: bool
         """
-        if not self.conn:
+        if not self.pool:
             return False
-        cursor = self.conn.cursor()
 
-        try:
-            for schema in [STUDENT_SCHEMA, INSTRUCTOR_SCHEMA, COURSE_SCHEMA, ENROLLMENT_SCHEMA]:
-                cursor.execute(schema)
-            self.conn.commit()
-            logger.info("Database tables created.")
-        except sqlite3.Error as e:
-            logger.error(f"Error creating tables: {e}")
-            return False
-        finally:
-            cursor.close()
+        with self.pool.write() as conn:
+            cursor = conn.cursor()
+            try:
+                for schema in [STUDENT_SCHEMA, INSTRUCTOR_SCHEMA, COURSE_SCHEMA, ENROLLMENT_SCHEMA]:
+                    cursor.execute(schema)
+                conn.commit()
+                logger.info("Database tables created.")
+                migrate(cursor)
+                self.search_enabled = has_search_indexes(cursor)
+            except sqlite3.Error as e:
+                logger.error(f"Error creating tables: {e}")
+                return False
+            finally:
+                cursor.close()
 
         return True
 
+    def _search(self, table: str, query: str, select: str, alias: str) -> list[tuple]:
+        """
+        Runs a case-insensitive substring search over a table's indexed columns.
+
+        Queries of three or more characters are answered by the table's trigram
+        index. Shorter queries cannot be, and fall back to a `LIKE` scan.
+
+        :param table: The name of the table to search.
+        :type table: str
+        :param query: The substring to search for.
+        :type query: str
+        :param select: The `SELECT ... FROM` clause producing the result rows, with the table aliased.
+        :type select: str
+        :param alias: The alias of the searched table in `select`.
+        :type alias: str
+        :return: The matching rows, in insertion order.
+        :rtype: list[tuple]
+        """
+        if self.search_enabled and len(query) >= 3:
+            key = SEARCH_TABLES[table][0]
+            sql = (f"{select} JOIN {table}_search_keys k ON k.{key} = {alias}.{key} "
+                   f"JOIN {table}_search f ON f.rowid = k.search_id "
+                   f"WHERE {table}_search MATCH ? ORDER BY k.search_id")
+            # a quoted phrase is matched literally; the trigram tokenizer turns it into a substring match
+            params = ('"' + query.replace('"', '""') + '"',)
+        else:
+            columns = SEARCH_TABLES[table]
+            pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            sql = f"{select} WHERE " + " OR ".join(f"{alias}.{c} LIKE ? ESCAPE '\\'" for c in columns)
+            params = (pattern,) * len(columns)
+        return self._query(sql, params)
+
+    def search_students(self, query: str) -> list[tuple]:
+        """
+        Retrieves the student records whose ID, name, or email contains the query, ignoring case.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: A list of tuples, where each tuple represents a student.
+        :rtype: list[tuple]
+        """
+        return self._search("students", query, "SELECT s.* FROM students s", "s")
+
+    def search_instructors(self, query: str) -> list[tuple]:
+        """
+        Retrieves the instructor records whose ID, name, or email contains the query, ignoring case.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: A list of tuples, where each tuple represents an instructor.
+        :rtype: list[tuple]
+        """
+        return self._search("instructors", query, "SELECT i.* FROM instructors i", "i")
+
+    def search_courses(self, query: str) -> list[tuple]:
+        """
+        Retrieves the course records whose ID or name contains the query, ignoring case.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: A list of tuples, where each tuple represents a course and its instructor.
+        :rtype: list[tuple]
+        """
+        return self._search("courses", query,
+                            "SELECT c.course_id, c.course_name, i.instructor_id, i.name, i.age, i.email "
+                            "FROM courses c JOIN instructors i ON c.instructor_id = i.instructor_id", "c")
+
     def add_student(self, student_id: str, name: str, age: int, email: str) -> bool:
         """
         Adds a new student to the database.
@@ -69,14 +271,14 @@ class DatabaseManager:
         :type age: int
         :param email: The email address of the student.
         :type email: str
-        :return: True upon successful insertion.
+        :return: True upon successful insertion, False if a student with this ID already exists.
         :rtype: bool
         """
-        sql = "INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?)"
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (student_id, name, age, email))
-        self.conn.commit()
-        return True
+        sql = ("INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?) "
+               "ON CONFLICT (student_id) DO NOTHING")
+        with self._writing() as cursor:
+            cursor.execute(sql, (student_id, name, age, email))
+        return cursor.rowcount > 0
 
     def get_student(self, student_id: str) -> tuple:
         """
@@ -88,9 +290,7 @@ class DatabaseManager:
         :rtype: tuple | None
         """
         sql = "SELECT * FROM students WHERE student_id = ?"
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (student_id,))
-        return cursor.fetchone()
+        return self._query_one(sql, (student_id,))
 
     def get_all_students(self) -> list[tuple]:
         """
@@ -100,9 +300,24 @@ class DatabaseManager:
         :rtype: list[tuple]
         """
         sql = "SELECT * FROM students"
-        cursor = self.conn.cursor()
-        cursor.execute(sql)
-        return cursor.fetchall()
+        return self._query(sql)
+
+    def get_students_page(self, after_id: str = None, limit: int = -1) -> list[tuple]:
+        """
+        Retrieves the student records following a given ID, ordered by ID.
+
+        The primary key index is used to seek directly to the first record, so
+        the cost of a page does not depend on how far into the table it is.
+
+        :param after_id: Only records with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of records to return. A negative value means no limit.
+        :type limit: int, optional
+        :return: A list of tuples, where each tuple represents a student.
+        :rtype: list[tuple]
+        """
+        sql = "SELECT * FROM students WHERE student_id > ? ORDER BY student_id LIMIT ?"
+        return self._query(sql, (after_id or "", limit))
 
     def update_student(self, student_id: str, **kwargs) -> bool:
         """
@@ -116,20 +331,12 @@ class DatabaseManager:
         :return: True if the update was successful, False otherwise.
         :rtype: bool
         """
-        allowed_fields = {"name", "age", "email"}
-        update_fields = {key: value for key, value in kwargs.items() if key in allowed_fields}
-
-        if not update_fields:
+        statement = update_statement("students", student_id, kwargs)
+        if not statement:
             return False
 
-        set_clause = ", ".join([f"{key} = ?" for key in update_fields.keys()])
-        sql = f"UPDATE students SET {set_clause} WHERE student_id = ?"
-
-        values = list(update_fields.values()) + [student_id]
-
-        cursor = self.conn.cursor()
-        cursor.execute(sql, tuple(values))
-        self.conn.commit()
+        with self._writing() as cursor:
+            cursor.execute(*statement)
         return cursor.rowcount > 0
 
     def delete_student(self, student_id: str) -> bool:
@@ -142,9 +349,8 @@ class DatabaseManager:
         :rtype: bool
         """
         sql = "DELETE FROM students WHERE student_id = ?"
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (student_id,))
-        self.conn.commit()
+        with self._writing() as cursor:
+            cursor.execute(sql, (student_id,))
         return cursor.rowcount > 0
 
     def add_instructor(self, instructor_id: str, name: str, age: int, email: str) -> bool:
@@ -159,14 +365,14 @@ class DatabaseManager:
         :type age: int
         :param email: The email address of the instructor.
         :type email: str
-        :return: True upon successful insertion.
+        :return: True upon successful insertion, False if an instructor with this ID already exists.
         :rtype: bool
         """
-        sql = "INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?)"
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (instructor_id, name, age, email))
-        self.conn.commit()
-        return True
+        sql = ("INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?) "
+               "ON CONFLICT (instructor_id) DO NOTHING")
+        with self._writing() as cursor:
+            cursor.execute(sql, (instructor_id, name, age, email))
+        return cursor.rowcount > 0
 
     def get_instructor(self, instructor_id: str) -> tuple:
         """
@@ -178,9 +384,7 @@ class DatabaseManager:
         :rtype: tuple | None
         """
         sql = "SELECT * FROM instructors WHERE instructor_id = ?"
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (instructor_id,))
-        return cursor.fetchone()
+        return self._query_one(sql, (instructor_id,))
 
     def get_all_instructors(self) -> list[tuple]:
         """
@@ -190,9 +394,24 @@ class DatabaseManager:
         :rtype: list[tuple]
         """
         sql = "SELECT * FROM instructors"
-        cursor = self.conn.cursor()
-        cursor.execute(sql)
-        return cursor.fetchall()
+        return self._query(sql)
+
+    def get_instructors_page(self, after_id: str = None, limit: int = -1) -> list[tuple]:
+        """
+        Retrieves the instructor records following a given ID, ordered by ID.
+
+        The primary key index is used to seek directly to the first record, so
+        the cost of a page does not depend on how far into the table it is.
+
+        :param after_id: Only records with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of records to return. A negative value means no limit.
+        :type limit: int, optional
+        :return: A list of tuples, where each tuple represents an instructor.
+        :rtype: list[tuple]
+        """
+        sql = "SELECT * FROM instructors WHERE instructor_id > ? ORDER BY instructor_id LIMIT ?"
+        return self._query(sql, (after_id or "", limit))
 
     def update_instructor(self, instructor_id: str, **kwargs) -> bool:
         """
@@ -206,20 +425,12 @@ class DatabaseManager:
         :return: True if the update was successful, False otherwise.
         :rtype: bool
         """
-        allowed_fields = {"name", "age", "email"}
-        update_fields = {key: value for key, value in kwargs.items() if key in allowed_fields}
-
-        if not update_fields:
+        statement = update_statement("instructors", instructor_id, kwargs)
+        if not statement:
             return False
 
-        set_clause = ", ".join([f"{key} = ?" for key in update_fields.keys()])
-        sql = f"UPDATE instructors SET {set_clause} WHERE instructor_id = ?"
-
-        values = list(update_fields.values()) + [instructor_id]
-
-        cursor = self.conn.cursor()
-        cursor.execute(sql, tuple(values))
-        self.conn.commit()
+        with self._writing() as cursor:
+            cursor.execute(*statement)
         return cursor.rowcount > 0
 
     def delete_instructor(self, instructor_id: str) -> bool:
@@ -232,9 +443,8 @@ class DatabaseManager:
         :rtype: bool
         """
         sql = "DELETE FROM instructors WHERE instructor_id = ?"
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (instructor_id,))
-        self.conn.commit()
+        with self._writing() as cursor:
+            cursor.execute(sql, (instructor_id,))
         return cursor.rowcount > 0
 
     def add_course(self, course_id: str, course_name: str, instructor_id: str) -> bool:
@@ -247,14 +457,15 @@ class DatabaseManager:
         :type course_name: str
         :param instructor_id: The ID of the instructor teaching the course.
         :type instructor_id: str
-        :return: True upon successful insertion.
+        :return: True upon successful insertion, False if a course with this ID already exists.
         :rtype: bool
+        :raises sqlite3.IntegrityError: If the instructor does not exist.
         """
-        sql = "INSERT INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?)"
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (course_id, course_name, instructor_id))
-        self.conn.commit()
-        return True
+        sql = ("INSERT INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?) "
+               "ON CONFLICT (course_id) DO NOTHING")
+        with self._writing() as cursor:
+            cursor.execute(sql, (course_id, course_name, instructor_id))
+        return cursor.rowcount > 0
 
     def get_course(self, course_id: str) -> tuple:
         """
@@ -277,9 +488,7 @@ class DatabaseManager:
                    instructors i ON c.instructor_id = i.instructor_id
               WHERE c.course_id = ? \
               """
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (course_id,))
-        return cursor.fetchone()
+        return self._query_one(sql, (course_id,))
 
     def get_all_courses(self) -> list[tuple]:
         """
@@ -299,9 +508,37 @@ class DatabaseManager:
                        JOIN
                    instructors i ON c.instructor_id = i.instructor_id \
               """
-        cursor = self.conn.cursor()
-        cursor.execute(sql)
-        return cursor.fetchall()
+        return self._query(sql)
+
+    def get_courses_page(self, after_id: str = None, limit: int = -1) -> list[tuple]:
+        """
+        Retrieves the course records following a given ID, ordered by ID.
+
+        The primary key index is used to seek directly to the first record, so
+        the cost of a page does not depend on how far into the table it is.
+
+        :param after_id: Only records with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of records to return. A negative value means no limit.
+        :type limit: int, optional
+        :return: A list of tuples, where each tuple represents a course and its instructor.
+        :rtype: list[tuple]
+        """
+        sql = """
+              SELECT c.course_id,
+                     c.course_name,
+                     i.instructor_id,
+                     i.name,
+                     i.age,
+                     i.email
+              FROM courses c
+                       JOIN
+                   instructors i ON c.instructor_id = i.instructor_id
+              WHERE c.course_id > ?
+              ORDER BY c.course_id
+              LIMIT ? \
+              """
+        return self._query(sql, (after_id or "", limit))
 
     def update_course(self, course_id: str, **kwargs) -> bool:
         """
@@ -315,20 +552,12 @@ class DatabaseManager:
         :return: True if the update was successful, False otherwise.
         :rtype: bool
         """
-        allowed_fields = {"course_name", "instructor_id"}
-        update_fields = {key: value for key, value in kwargs.items() if key in allowed_fields}
-
-        if not update_fields:
+        statement = update_statement("courses", course_id, kwargs)
+        if not statement:
             return False
 
-        set_clause = ", ".join([f"{key} = ?" for key in update_fields.keys()])
-        sql = f"UPDATE courses SET {set_clause} WHERE course_id = ?"
-
-        values = list(update_fields.values()) + [course_id]
-
-        cursor = self.conn.cursor()
-        cursor.execute(sql, tuple(values))
-        self.conn.commit()
+        with self._writing() as cursor:
+            cursor.execute(*statement)
         return cursor.rowcount > 0
 
     def delete_course(self, course_id: str) -> bool:
@@ -341,9 +570,8 @@ class DatabaseManager:
         :rtype: bool
         """
         sql = "DELETE FROM courses WHERE course_id = ?"
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (course_id,))
-        self.conn.commit()
+        with self._writing() as cursor:
+            cursor.execute(sql, (course_id,))
         return cursor.rowcount > 0
 
     def enroll_student(self, student_id, course_id):
@@ -354,14 +582,60 @@ class DatabaseManager:
         :type student_id: str
         :param course_id: The ID of the course to enroll in.
         :type course_id: str
-        :return: True upon successful enrollment.
+        :return: True upon successful enrollment, False if the student was already enrolled.
         :rtype: bool
+        :raises sqlite3.IntegrityError: If the student or the course does not exist.
         """
-        sql = "INSERT INTO enrollments (student_id, course_id) VALUES (?, ?)"
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (student_id, course_id))
-        self.conn.commit()
-        return True
+        sql = "INSERT INTO enrollments (student_id, course_id) VALUES (?, ?) ON CONFLICT DO NOTHING"
+        with self._writing() as cursor:
+            cursor.execute(sql, (student_id, course_id))
+        return cursor.rowcount > 0
+
+    def enroll_many(self, pairs) -> int:
+        """
+        Enrolls students in courses in bulk, with one `executemany` call.
+
+        Pairs that are already enrolled are skipped.
+
+        :param pairs: The (student_id, course_id) pairs to enroll.
+        :type pairs: Iterable[tuple[str, str]]
+        :return: The number of enrollments created.
+        :rtype: int
+        :raises sqlite3.IntegrityError: If a student or a course does not exist; nothing is enrolled then.
+        """
+        sql = "INSERT INTO enrollments (student_id, course_id) VALUES (?, ?) ON CONFLICT DO NOTHING"
+        with self._writing() as cursor:
+            cursor.executemany(sql, pairs)
+        return cursor.rowcount
+
+    def get_missing_ids(self, student_ids: list[str], course_ids: list[str]) -> tuple[list[str], list[str]]:
+        """
+        Finds which of the given student and course IDs have no record, with a single query.
+
+        The IDs are passed as JSON arrays and expanded with `json_each`, so the
+        number of IDs does not change the SQL text, and each one is checked with
+        a primary key lookup.
+
+        :param student_ids: The student IDs to check.
+        :type student_ids: list[str]
+        :param course_ids: The course IDs to check.
+        :type course_ids: list[str]
+        :return: The missing student IDs and the missing course IDs, in the order given.
+        :rtype: tuple[list[str], list[str]]
+        """
+        sql = """
+              SELECT 0, j.value
+              FROM json_each(?) j
+              WHERE NOT EXISTS (SELECT 1 FROM students s WHERE s.student_id = j.value)
+              UNION ALL
+              SELECT 1, j.value
+              FROM json_each(?) j
+              WHERE NOT EXISTS (SELECT 1 FROM courses c WHERE c.course_id = j.value)
+              """
+        missing = ([], [])
+        for table, value in self._query(sql, (json.dumps(student_ids), json.dumps(course_ids))):
+            missing[table].append(value)
+        return missing
 
     def get_student_courses(self, student_id):
         """
@@ -378,9 +652,7 @@ class DatabaseManager:
                        JOIN enrollments e ON c.course_id = e.course_id
               WHERE e.student_id = ?
               """
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (student_id,))
-        return cursor.fetchall()
+        return self._query(sql, (student_id,))
 
     def get_course_enrollments(self, course_id):
         """
@@ -397,9 +669,7 @@ class DatabaseManager:
                        JOIN enrollments e ON s.student_id = e.student_id
               WHERE e.course_id = ?
               """
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (course_id,))
-        return cursor.fetchall()
+        return self._query(sql, (course_id,))
 
     def get_instructor_courses(self, instructor_id: str) -> list[tuple]:
         """
@@ -411,9 +681,7 @@ class DatabaseManager:
         :rtype: list[tuple]
         """
         sql = "SELECT course_id, course_name FROM courses WHERE instructor_id = ?"
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (instructor_id,))
-        return cursor.fetchall()
+        return self._query(sql, (instructor_id,))
 
     def get_all_enrollments(self) -> list[tuple]:
         """
@@ -423,9 +691,73 @@ class DatabaseManager:
         :rtype: list[tuple]
         """
         sql = "SELECT student_id, course_id FROM enrollments"
-        cursor = self.conn.cursor()
-        cursor.execute(sql)
-        return cursor.fetchall()
+        return self._query(sql)
+
+    def stream_tables(self, batch_size: int = STREAM_BATCH_SIZE):
+        """
+        Streams the rows of every table, from a single consistent snapshot.
+
+        Tables are streamed in the order instructors, students, courses,
+        enrollments, so each row only refers to rows already streamed. Rows are
+        fetched `batch_size` at a time rather than all at once, and the reads run
+        in one transaction, so writes committed meanwhile by other connections
+        are not seen halfway through.
+
+        The columns are those of `get_all_students`/`get_all_instructors` for
+        people and (course_id, course_name, instructor_id) for courses.
+        Enrollments come one row per enrolled student, as (student_id, JSON
+        array of course IDs), in student ID order with the course IDs sorted,
+        which takes far fewer rows and Python objects than one row per
+        enrollment.
+
+        :param batch_size: The number of rows fetched at a time. Defaults to `STREAM_BATCH_SIZE`.
+        :type batch_size: int, optional
+        :return: A generator of (table name, list of rows) batches.
+        :rtype: Iterator[tuple[str, list[tuple]]]
+        """
+        return self._stream(_STREAM_QUERIES, batch_size)
+
+    def stream_csv_rows(self, batch_size: int = STREAM_BATCH_SIZE):
+        """
+        Streams the rows of every table in the column order of the CSV files, from a single consistent snapshot.
+
+        Like `stream_tables`, but people come as (name, age, email, ID) and
+        enrollments one row per enrollment, as (student_id, course_id), ordered
+        by student and course ID, so each row can be written to its CSV file as is.
+
+        :param batch_size: The number of rows fetched at a time. Defaults to `STREAM_BATCH_SIZE`.
+        :type batch_size: int, optional
+        :return: A generator of (table name, list of rows) batches.
+        :rtype: Iterator[tuple[str, list[tuple]]]
+        """
+        return self._stream(_CSV_QUERIES, batch_size)
+
+    def _stream(self, queries: tuple[tuple[str, str], ...], batch_size: int):
+        """
+        Runs queries one after the other in a single read transaction, yielding their rows in batches.
+
+        :param queries: The (table name, SQL) pairs to run.
+        :type queries: tuple[tuple[str, str], ...]
+        :param batch_size: The number of rows fetched at a time.
+        :type batch_size: int
+        :return: A generator of (table name, list of rows) batches.
+        :rtype: Iterator[tuple[str, list[tuple]]]
+        """
+        conn = self.pool.reader()
+        # the thread may already be inside a transaction on the writer connection
+        own_transaction = not conn.in_transaction
+        cursor = conn.cursor()
+        try:
+            if own_transaction:
+                cursor.execute("BEGIN")
+            for table, sql in queries:
+                cursor.execute(sql)
+                while rows := cursor.fetchmany(batch_size):
+                    yield table, rows
+        finally:
+            cursor.close()
+            if own_transaction and conn.in_transaction:
+                conn.commit()
 
     def get_courses_for_student(self, student_id: str) -> list[tuple]:
         """
@@ -450,9 +782,7 @@ class DatabaseManager:
                        JOIN enrollments e ON c.course_id = e.course_id
               WHERE e.student_id = ?
               """
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (student_id,))
-        return cursor.fetchall()
+        return self._query(sql, (student_id,))
 
     def get_students_for_course(self, course_id: str) -> list[tuple]:
         """
@@ -469,9 +799,7 @@ class DatabaseManager:
                        JOIN enrollments e ON s.student_id = e.student_id
               WHERE e.course_id = ? \
               """
-        cursor = self.conn.cursor()
-        cursor.execute(sql, (course_id,))
-        return cursor.fetchall()
+        return self._query(sql, (course_id,))
 
     def clear_all_tables(self):
         """
@@ -482,25 +810,218 @@ class DatabaseManager:
 
         :raises sqlite3.Error: If a database error occurs during deletion.
         """
-        if not self.conn:
+        if not self.pool:
             return
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM enrollments;")
-            cursor.execute("DELETE FROM courses;")
-            cursor.execute("DELETE FROM students;")
-            cursor.execute("DELETE FROM instructors;")
-            self.conn.commit()
-        except sqlite3.Error as e:
-            self.conn.rollback()
-            raise e
+        with self._writing() as cursor:
+            self._delete_all_rows(cursor)
+
+    @staticmethod
+    def _delete_all_rows(cursor: sqlite3.Cursor):
+        """
+        Deletes every row of every table without committing.
+
+        :param cursor: The cursor to run the deletions on.
+        :type cursor: sqlite3.Cursor
+        """
+        cursor.execute("DELETE FROM enrollments;")
+        cursor.execute("DELETE FROM courses;")
+        cursor.execute("DELETE FROM students;")
+        cursor.execute("DELETE FROM instructors;")
+
+    def bulk_load(self, instructors=(), students=(), courses=(), enrollments=(), replace: bool = False,
+                  defer_indexes: bool = False, fast: bool = False):
+        """
+        Inserts many records at once inside a single transaction.
+
+        Each table is filled with one `executemany` call, so an import costs a
+        single commit instead of one per row. If anything fails, the whole
+        transaction (including the optional clearing of the tables) is rolled
+        back and the database is left untouched. Inside `transaction()`, the
+        load joins that transaction, and `fast` has no effect.
+
+        :param instructors: Rows of (instructor_id, name, age, email).
+        :type instructors: Iterable[tuple]
+        :param students: Rows of (student_id, name, age, email).
+        :type students: Iterable[tuple]
+        :param courses: Rows of (course_id, course_name, instructor_id).
+        :type courses: Iterable[tuple]
+        :param enrollments: Rows of (student_id, course_id).
+        :type enrollments: Iterable[tuple]
+        :param replace: If True, all existing records are deleted in the same transaction first.
+        :type replace: bool
+        :param defer_indexes: If True, secondary indexes are dropped during the load and rebuilt afterward.
+        :type defer_indexes: bool
+        :param fast: If True, `synchronous` and `journal_mode` are relaxed for the duration of the load.
+        :type fast: bool
+        :raises sqlite3.Error: If a database error occurs; the transaction is rolled back.
+        """
+        if not self.pool:
+            return
+        with self.pool.write() as conn:
+            # durability settings cannot be changed inside an open transaction
+            pragmas = self._relax_durability(conn) if fast and not self._transaction_depth else None
+            try:
+                with self.transaction() as cursor:
+                    self._load_rows(cursor, instructors, students, courses, enrollments, replace, defer_indexes)
+            finally:
+                if pragmas:
+                    self._restore_durability(conn, pragmas)
+
+    def _load_rows(self, cursor: sqlite3.Cursor, instructors, students, courses, enrollments, replace: bool,
+                   defer_indexes: bool):
+        """
+        Runs the statements of `bulk_load` without committing.
+
+        :param cursor: The cursor to run the statements on.
+        :type cursor: sqlite3.Cursor
+        :param instructors: See `bulk_load`, as are the remaining parameters.
+        :raises sqlite3.Error: If a database error occurs.
+        """
+        index_sql = self._drop_indexes(cursor) if defer_indexes else []
+        if replace:
+            self._delete_all_rows(cursor)
+        cursor.executemany("INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?)",
+                           instructors)
+        cursor.executemany("INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?)",
+                           students)
+        cursor.executemany("INSERT INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?)",
+                           courses)
+        cursor.executemany("INSERT INTO enrollments (student_id, course_id) VALUES (?, ?)", enrollments)
+        for sql in index_sql:
+            cursor.execute(sql)
+        if defer_indexes and self.search_enabled:
+            rebuild_search_indexes(cursor)
+
+    def merge(self, instructors=(), students=(), courses=(), enrollments=(), prune: bool = False) -> dict[str, int]:
+        """
+        Brings the database in line with a set of records, writing only what differs.
+
+        Unlike `bulk_load` with `replace`, the tables are not wiped: only the
+        existing rows whose keys appear in the given records are read, and
+        records are inserted if new and updated if any field changed. The
+        enrollments given for a student replace that student's enrollments.
+        Everything runs in a single transaction, so if anything fails the
+        database is left untouched. Enrollments deleted along with a pruned
+        student or course are not counted.
+
+        :param instructors: Rows of (instructor_id, name, age, email).
+        :type instructors: Iterable[tuple]
+        :param students: Rows of (student_id, name, age, email).
+        :type students: Iterable[tuple]
+        :param courses: Rows of (course_id, course_name, instructor_id).
+        :type courses: Iterable[tuple]
+        :param enrollments: Rows of (student_id, course_id); rows for students not in `students` are ignored.
+        :type enrollments: Iterable[tuple]
+        :param prune: If True, students, courses, and instructors not among the given records are deleted.
+                      Defaults to False.
+        :type prune: bool, optional
+        :return: The number of rows inserted, updated, and deleted, under those keys.
+        :rtype: dict[str, int]
+        :raises sqlite3.Error: If a database error occurs; the transaction is rolled back.
+        """
+        counts = {"inserted": 0, "updated": 0, "deleted": 0}
+        if not self.pool:
+            return counts
+        # ordered so that every row's references are written before it
+        records = {"instructors": {row[0]: tuple(row) for row in instructors},
+                   "courses": {row[0]: tuple(row) for row in courses},
+                   "students": {row[0]: tuple(row) for row in students}}
+        wanted = {tuple(row) for row in enrollments if row[0] in records["students"]}
+        with self.transaction() as cursor:
+            for table, rows in records.items():
+                key, columns = UPDATABLE_COLUMNS[table]
+                cursor.execute(f"SELECT t.{key}, {', '.join(f't.{c}' for c in columns)} FROM {table} t "
+                               f"JOIN json_each(?) j ON t.{key} = j.value", (json.dumps(list(rows)),))
+                existing = {row[0]: row for row in cursor.fetchall()}
+                placeholders = ", ".join("?" * (len(columns) + 1))
+                cursor.executemany(f"INSERT INTO {table} ({key}, {', '.join(columns)}) VALUES ({placeholders})",
+                                   [row for row_id, row in rows.items() if row_id not in existing])
+                counts["inserted"] += cursor.rowcount
+                cursor.executemany(full_update_sql(table), [row[1:] + row[:1] for row_id, row in rows.items()
+                                                            if row_id in existing and existing[row_id] != row])
+                counts["updated"] += cursor.rowcount
+
+            cursor.execute("SELECT e.student_id, e.course_id FROM enrollments e "
+                           "JOIN json_each(?) j ON e.student_id = j.value", (json.dumps(list(records["students"])),))
+            enrolled = set(cursor.fetchall())
+            cursor.executemany("DELETE FROM enrollments WHERE student_id = ? AND course_id = ?",
+                               enrolled - wanted)
+            counts["deleted"] += cursor.rowcount
+            cursor.executemany("INSERT INTO enrollments (student_id, course_id) VALUES (?, ?)", wanted - enrolled)
+            counts["inserted"] += cursor.rowcount
+
+            if prune:
+                # students and courses first, so no instructor still has a course when it is deleted
+                for table in ("students", "courses", "instructors"):
+                    key, _ = UPDATABLE_COLUMNS[table]
+                    cursor.execute(f"DELETE FROM {table} WHERE {key} NOT IN (SELECT value FROM json_each(?))",
+                                   (json.dumps(list(records[table])),))
+                    counts["deleted"] += cursor.rowcount
+        return counts
+
+    @staticmethod
+    def _drop_indexes(cursor: sqlite3.Cursor) -> list[str]:
+        """
+        Drops all explicitly created indexes so they can be rebuilt after a bulk load.
+
+        Primary key and unique constraint indexes are internal and are left alone.
+        The triggers maintaining the search indexes are dropped as well; the search
+        indexes themselves have to be rebuilt from their tables afterward.
+
+        :param cursor: The cursor to run the statements on.
+        :type cursor: sqlite3.Cursor
+        :return: The `CREATE` statements needed to restore the dropped indexes and triggers.
+        :rtype: list[str]
+        """
+        cursor.execute("SELECT type, name, sql FROM sqlite_master "
+                       "WHERE type IN ('index', 'trigger') AND sql IS NOT NULL")
+        indexes = cursor.fetchall()
+        for kind, name, _ in indexes:
+            cursor.execute(f'DROP {kind.upper()} "{name}"')
+        return [sql for _, _, sql in indexes]
+
+    @staticmethod
+    def _relax_durability(conn: sqlite3.Connection) -> tuple:
+        """
+        Trades crash safety for speed while a bulk load runs.
+
+        A database in WAL mode keeps its journal mode, since leaving WAL would
+        require exclusive access and block the other connections; only the
+        rollback journal is moved to memory.
+
+        :param conn: The connection running the bulk load.
+        :type conn: sqlite3.Connection
+        :return: The previous (synchronous, journal_mode) settings.
+        :rtype: tuple
+        """
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.execute("PRAGMA synchronous = OFF")
+        if journal_mode != "wal":
+            conn.execute("PRAGMA journal_mode = MEMORY")
+        return synchronous, journal_mode
+
+    @staticmethod
+    def _restore_durability(conn: sqlite3.Connection, pragmas: tuple):
+        """
+        Restores the settings saved by `_relax_durability`.
+
+        :param conn: The connection that ran the bulk load.
+        :type conn: sqlite3.Connection
+        :param pragmas: The (synchronous, journal_mode) settings to restore.
+        :type pragmas: tuple
+        """
+        synchronous, journal_mode = pragmas
+        if journal_mode != "wal":
+            conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {int(synchronous)}")
 
     def close(self):
         """
         Closes the connection to the database.
         """
-        if self.conn:
-            self.conn.close()
+        if self.pool:
+            self.pool.close()
             logger.info("Database connection closed.")
 
 
@@ -0,0 +1,158 @@
+"""
+Upgrades existing databases to the current schema version.
+
+The tables in `contract.py` are created with `CREATE TABLE IF NOT EXISTS`,
+so they never change once a database file exists. Every later change to the
+schema is a migration in `MIGRATIONS` instead. A database records the number
+of migrations applied to it in its `PRAGMA user_version`, and `migrate` applies
+the pending ones in order, each in its own transaction.
+
+Migrations are only ever appended to `MIGRATIONS`; a released migration must
+not be edited, since databases that already applied it will not run it again.
+
+Attributes:
+    MIGRATIONS (tuple): The schema migrations, as (description, steps) pairs. Each step is either a
+        SQL statement or a function running statements on the cursor it is given. Migration `n`
+        (counting from 1) upgrades a database from version `n - 1` to version `n`.
+    SCHEMA_VERSION (int): The schema version of a fully migrated database.
+"""
+import logging
+import sqlite3
+
+from .contract import SEARCH_REBUILD, SEARCH_SCHEMA, SEARCH_TABLES, SEARCH_TRIGGERS
+
+logger = logging.getLogger(__name__)
+
+
+def _search_names(table: str) -> dict[str, str]:
+    """
+    Builds the names the search index templates of `contract.py` are formatted with.
+
+    :param table: The name of an indexed table.
+    :type table: str
+    :return: The template names and their values for the table.
+    :rtype: dict[str, str]
+    """
+    columns = SEARCH_TABLES[table]
+    return {"table": table, "key": columns[0], "columns": ", ".join(columns),
+            "new_columns": ", ".join(f"new.{c}" for c in columns),
+            "table_columns": ", ".join(f"t.{c}" for c in columns)}
+
+
+def rebuild_search_indexes(cursor: sqlite3.Cursor):
+    """
+    Repopulates every search index from its table, e.g. after its triggers were dropped for a bulk load.
+
+    :param cursor: A cursor on a database with search indexes.
+    :type cursor: sqlite3.Cursor
+    :raises sqlite3.Error: If a database error occurs.
+    """
+    for table in SEARCH_TABLES:
+        names = _search_names(table)
+        for sql in SEARCH_REBUILD:
+            cursor.execute(sql.format(**names))
+
+
+def has_search_indexes(cursor: sqlite3.Cursor) -> bool:
+    """
+    Checks whether a database has its full-text search indexes.
+
+    :param cursor: A cursor on the database.
+    :type cursor: sqlite3.Cursor
+    :return: True if every searchable table has its index.
+    :rtype: bool
+    """
+    names = [f"{table}_search" for table in SEARCH_TABLES]
+    cursor.execute(f"SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name IN "
+                   f"({', '.join('?' * len(names))})", names)
+    return cursor.fetchone()[0] == len(names)
+
+
+def _create_search_indexes(cursor: sqlite3.Cursor):
+    """
+    Creates the full-text search indexes, the triggers keeping them in sync, and populates them.
+
+    The unversioned indexes that older releases created on every start, which
+    were keyed on the tables' implicit rowids, are dropped first. If this
+    SQLite build lacks FTS5 trigram support, nothing is created and searches
+    fall back to `LIKE` queries; the migration still counts as applied.
+
+    :param cursor: A cursor inside the migration's transaction.
+    :type cursor: sqlite3.Cursor
+    """
+    cursor.execute("SAVEPOINT search_indexes")
+    try:
+        for table in SEARCH_TABLES:
+            names = _search_names(table)
+            for kind in ("insert", "delete", "update"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {table}_search_{kind}")
+            cursor.execute(f"DROP TABLE IF EXISTS {table}_search")
+            for sql in SEARCH_SCHEMA + SEARCH_TRIGGERS:
+                cursor.execute(sql.format(**names))
+        rebuild_search_indexes(cursor)
+    except sqlite3.OperationalError as e:
+        cursor.execute("ROLLBACK TO search_indexes")
+        logger.warning(f"Full-text search is not available ({e}). Falling back to LIKE queries.")
+    finally:
+        cursor.execute("RELEASE search_indexes")
+
+
+MIGRATIONS = (
+    ("Index the foreign keys used to look up a course's students and an instructor's courses",
+     ("CREATE INDEX IF NOT EXISTS idx_enrollments_course_id ON enrollments (course_id)",
+      "CREATE INDEX IF NOT EXISTS idx_courses_instructor_id ON courses (instructor_id)")),
+    ("Add full-text search indexes over the students', instructors', and courses' IDs, names, and emails",
+     (_create_search_indexes,)),
+)
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_version(cursor: sqlite3.Cursor) -> int:
+    """
+    Reads the schema version of a database.
+
+    :param cursor: A cursor on the database.
+    :type cursor: sqlite3.Cursor
+    :return: The number of migrations applied to the database.
+    :rtype: int
+    """
+    return cursor.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(cursor: sqlite3.Cursor) -> int:
+    """
+    Applies the pending migrations to a database.
+
+    Each migration and its version bump are committed together, so an
+    interrupted upgrade resumes from the last completed migration.
+
+    :param cursor: A cursor on the database; its tables must already exist.
+    :type cursor: sqlite3.Cursor
+    :return: The schema version of the database after migrating.
+    :rtype: int
+    :raises sqlite3.Error: If a migration fails. That migration is rolled back.
+    """
+    version = get_version(cursor)
+    if version > SCHEMA_VERSION:
+        logger.warning(f"Database schema version {version} is newer than this application's "
+                       f"({SCHEMA_VERSION}); it was left unchanged.")
+        return version
+
+    conn = cursor.connection
+    for version, (description, steps) in enumerate(MIGRATIONS[version:], start=version + 1):
+        try:
+            cursor.execute("BEGIN")
+            for step in steps:
+                if callable(step):
+                    step(cursor)
+                else:
+                    cursor.execute(step)
+            # PRAGMA does not accept parameters; version is always an int
+            cursor.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        logger.info(f"Migrated database to schema version {version}: {description}.")
+    return get_version(cursor)
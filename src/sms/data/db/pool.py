@@ -0,0 +1,187 @@
+"""
+Provides pooled SQLite connections for the School Management System.
+
+This module contains the `ConnectionPool` class. The database is opened in
+WAL (write-ahead logging) mode, which lets readers proceed while a write is
+in progress. Every thread reads through its own connection, and all writes
+go through a single writer connection guarded by a lock, so writers are
+serialized without blocking readers. Each connection also keeps one cursor
+that is reused for every statement run on it.
+"""
+import logging
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+
+from .statements import DEFAULT_CACHED_STATEMENTS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUSY_TIMEOUT = 5.0
+"""The default number of seconds a connection waits for a lock held by another connection."""
+
+
+class _Reader:
+    """
+    Holds a thread's reader cursor in the pool's thread-local storage.
+
+    When the thread exits, its thread-local storage is released along with
+    this holder, which closes the reader connection.
+    """
+    __slots__ = ("cursor", "__weakref__")
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        """
+        Initializes the holder.
+
+        :param cursor: The reusable cursor of the thread's reader connection.
+        :type cursor: sqlite3.Cursor
+        """
+        self.cursor = cursor
+
+
+class ConnectionPool:
+    """
+    A writer connection shared by all threads plus one reader connection per thread.
+
+    A thread's reader connection is opened on its first read and closed when
+    the thread exits. Reads made by a thread that is inside `write()` use the
+    writer connection, so they see that thread's uncommitted changes.
+
+    :ivar db_path: The file path of the SQLite database.
+    :vartype db_path: str
+    :ivar busy_timeout: The number of seconds a connection waits for a lock before failing.
+    :vartype busy_timeout: float
+    :ivar cached_statements: The number of prepared statements each connection keeps.
+    :vartype cached_statements: int
+    :ivar writer: The connection all writes go through.
+    :vartype writer: sqlite3.Connection
+    :ivar journal_mode: The journal mode in effect, normally "wal".
+    :vartype journal_mode: str
+    """
+
+    def __init__(self, db_path: str, busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+                 cached_statements: int = DEFAULT_CACHED_STATEMENTS):
+        """
+        Initializes the ConnectionPool and opens the writer connection.
+
+        :param db_path: The file path of the SQLite database.
+        :type db_path: str
+        :param busy_timeout: The number of seconds a connection waits for a lock before failing.
+                             Defaults to `DEFAULT_BUSY_TIMEOUT`.
+        :type busy_timeout: float, optional
+        :param cached_statements: The number of prepared statements each connection keeps.
+                                  Defaults to `DEFAULT_CACHED_STATEMENTS`.
+        :type cached_statements: int, optional
+        :raises sqlite3.Error: If the database cannot be opened.
+        """
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._write_owner = None
+        self._write_depth = 0
+
+        self.writer = self._connect()
+        self._writer_cursor = self.writer.cursor()
+        self.journal_mode = self.writer.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        if self.journal_mode != "wal":
+            logger.warning(f"WAL journaling is not available; using '{self.journal_mode}' instead.")
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Opens a new connection to the database.
+
+        Connections may be closed from any thread by `close()`, but each one is
+        only ever used by one thread at a time.
+
+        :return: The new connection.
+        :rtype: sqlite3.Connection
+        """
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False,
+                               cached_statements=self.cached_statements)
+        # enable foreign key constraints
+        conn.execute("PRAGMA foreign_keys = 1;")
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def reader(self) -> sqlite3.Connection:
+        """
+        Gets the connection the calling thread should read through.
+
+        :return: The writer connection if the calling thread is inside `write()`,
+                 otherwise the thread's own reader connection.
+        :rtype: sqlite3.Connection
+        """
+        return self.cursor().connection
+
+    def cursor(self) -> sqlite3.Cursor:
+        """
+        Gets the reusable cursor the calling thread should run statements on.
+
+        Reusing a cursor saves allocating one per statement. Its previous result
+        set is discarded by the next `execute`, so callers must fetch their rows
+        before running another statement.
+
+        :return: The writer connection's cursor if the calling thread is inside `write()`,
+                 otherwise the cursor of the thread's own reader connection.
+        :rtype: sqlite3.Cursor
+        """
+        if self._write_owner == threading.get_ident():
+            return self._writer_cursor
+        reader = getattr(self._local, "reader", None)
+        if reader is None:
+            conn = self._connect()
+            reader = self._local.reader = _Reader(conn.cursor())
+            # the finalizer must not hold the pool, or a thread that outlives the pool would keep it alive
+            weakref.finalize(reader, ConnectionPool._release, self._connections, self._connections_lock, conn)
+        return reader.cursor
+
+    @staticmethod
+    def _release(connections: list, lock: threading.Lock, conn: sqlite3.Connection):
+        """
+        Closes the reader connection of a thread that has exited, and forgets it.
+
+        :param connections: The pool's open connections.
+        :type connections: list
+        :param lock: The lock guarding `connections`.
+        :type lock: threading.Lock
+        :param conn: The reader connection.
+        :type conn: sqlite3.Connection
+        """
+        with lock:
+            if conn in connections:
+                connections.remove(conn)
+        conn.close()
+
+    @contextmanager
+    def write(self):
+        """
+        Gives the calling thread exclusive use of the writer connection.
+
+        Calls may be nested within the same thread.
+
+        :return: A context manager yielding the writer connection.
+        """
+        with self._write_lock:
+            self._write_owner = threading.get_ident()
+            self._write_depth += 1
+            try:
+                yield self.writer
+            finally:
+                self._write_depth -= 1
+                if not self._write_depth:
+                    self._write_owner = None
+
+    def close(self):
+        """Closes every connection opened by the pool, including the readers of threads still running."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
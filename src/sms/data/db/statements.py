@@ -0,0 +1,79 @@
+"""
+Provides canonical SQL for the DatabaseManager's parameterized statements.
+
+SQLite compiles each distinct SQL string into a prepared statement, and each
+connection keeps the most recently used ones in a cache keyed by the exact
+text. Statements whose text is built at call time (e.g., the `UPDATE` of the
+fields a caller happened to pass) only hit that cache if equivalent calls
+produce identical text, so this module builds them in a canonical form and
+remembers them.
+
+Attributes:
+    UPDATABLE_COLUMNS (dict): The tables that can be updated, mapped to their key column and updatable columns.
+    DEFAULT_CACHED_STATEMENTS (int): The default size of each connection's prepared statement cache.
+"""
+from functools import lru_cache
+
+UPDATABLE_COLUMNS = {"students": ("student_id", ("name", "age", "email")),
+                     "instructors": ("instructor_id", ("name", "age", "email")),
+                     "courses": ("course_id", ("course_name", "instructor_id"))}
+
+DEFAULT_CACHED_STATEMENTS = 256
+"""
+Large enough to hold every statement the DatabaseManager issues at once: the
+fixed CRUD, paging, and search queries plus the 17 canonical `UPDATE` variants.
+"""
+
+
+@lru_cache(maxsize=None)
+def _update_sql(table: str, fields: tuple[str, ...]) -> str:
+    """
+    Builds the `UPDATE` statement setting the given columns of a table.
+
+    :param table: The name of the table.
+    :type table: str
+    :param fields: The columns to set, in canonical order.
+    :type fields: tuple[str, ...]
+    :return: The SQL statement, whose parameters are the column values followed by the key.
+    :rtype: str
+    """
+    key, _ = UPDATABLE_COLUMNS[table]
+    set_clause = ", ".join(f"{field} = ?" for field in fields)
+    return f"UPDATE {table} SET {set_clause} WHERE {key} = ?"
+
+
+def full_update_sql(table: str) -> str:
+    """
+    Builds the `UPDATE` statement setting every updatable column of a record.
+
+    :param table: The name of the table.
+    :type table: str
+    :return: The SQL statement, whose parameters are the updatable columns in declared order, then the key.
+    :rtype: str
+    """
+    return _update_sql(table, UPDATABLE_COLUMNS[table][1])
+
+
+def update_statement(table: str, key_value: str, values: dict) -> tuple[str, tuple] | None:
+    """
+    Builds the canonical `UPDATE` statement for a partial update of a record.
+
+    Columns that cannot be updated are ignored, and the remaining ones are
+    always set in the table's declared column order, so the same set of
+    fields yields the same SQL text whatever order it was passed in.
+
+    :param table: The name of the table.
+    :type table: str
+    :param key_value: The key of the record to update.
+    :type key_value: str
+    :param values: The new column values; other keys are ignored.
+    :type values: dict
+    :return: The SQL statement and its parameters, or None if there is nothing to update.
+    :rtype: tuple[str, tuple] | None
+    """
+    _, columns = UPDATABLE_COLUMNS[table]
+    fields = tuple(column for column in columns if column in values)
+    if not fields:
+        return None
+    return _update_sql(table, fields), tuple(values[field] for field in fields) + (key_value,)
+
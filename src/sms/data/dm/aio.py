@@ -0,0 +1,323 @@
+"""
+Provides an asyncio interface to the data managers.
+
+This module contains the `AsyncDataManager` class, which wraps a data manager
+and exposes every method of the `BaseDataManager` interface as a coroutine.
+Each call runs in a thread pool owned by the wrapper, so an asyncio service or
+a GUI driven by an asyncio event loop can run many data operations at once
+without blocking its loop.
+
+The `DatabaseDataManager` is thread-safe; its calls run concurrently, and each
+worker thread reads through its own pooled database connection. The
+`MemoryDataManager` is not; its calls still run off the event loop, but are
+serialized by a lock shared by every wrapper of that manager.
+
+Example::
+
+    async with AsyncDataManager(data_manager) as adm:
+        students, courses = await asyncio.gather(adm.get_students(), adm.get_courses())
+        async with adm.transaction():
+            await adm.add_student(**fields)
+            await adm.enroll_student(fields["student_id"], "EECE230")
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Iterable
+
+from .interface import BaseDataManager, PAGE_SIZE
+from ...models.course import Course
+from ...models.instructor import Instructor
+from ...models.student import Student
+
+DEFAULT_ASYNC_WORKERS = 4
+"""The default number of worker threads of an `AsyncDataManager`."""
+
+
+class AsyncDataManager:
+    """
+    Awaitable versions of the methods of a data manager.
+
+    The objects returned are the wrapped manager's own model objects, shared
+    with any other code using that manager.
+
+    :ivar manager: The wrapped data manager.
+    :vartype manager: BaseDataManager
+    """
+
+    _locks: dict[type, threading.RLock] = {}
+    """The lock serializing the calls to each wrapped manager that is not thread-safe."""
+    _locks_lock = threading.Lock()
+
+    def __init__(self, manager: BaseDataManager, max_workers: int = DEFAULT_ASYNC_WORKERS):
+        """
+        Initializes the AsyncDataManager.
+
+        :param manager: The data manager to wrap (e.g., `data_manager`).
+        :type manager: BaseDataManager
+        :param max_workers: The number of worker threads. Defaults to `DEFAULT_ASYNC_WORKERS`.
+        :type max_workers: int, optional
+        """
+        self.manager = manager
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sms-data")
+        self._lock = None if manager.thread_safe else AsyncDataManager._lock_for(manager)
+        # the thread running the current task's open transaction, if any
+        self._transaction_executor = contextvars.ContextVar(f"sms-transaction-{id(self)}", default=None)
+
+    @staticmethod
+    def _lock_for(manager: BaseDataManager) -> threading.RLock:
+        """
+        Gets the lock serializing the calls to a manager that is not thread-safe.
+
+        Every AsyncDataManager wrapping the same manager shares its lock, since
+        they all touch the same data. The lock is reentrant so that the calls
+        made inside a transaction, which holds it, can take it again.
+
+        :param manager: The wrapped data manager.
+        :type manager: BaseDataManager
+        :return: The manager's lock.
+        :rtype: threading.RLock
+        """
+        with AsyncDataManager._locks_lock:
+            return AsyncDataManager._locks.setdefault(manager, threading.RLock())
+
+    def _call(self, func: Callable, args: tuple, kwargs: dict):
+        """
+        Calls a method of the wrapped manager. Runs in a worker thread.
+
+        :param func: The method to call.
+        :type func: Callable
+        :param args: The positional arguments.
+        :type args: tuple
+        :param kwargs: The keyword arguments.
+        :type kwargs: dict
+        :return: The method's return value.
+        """
+        if self._lock is None:
+            return func(*args, **kwargs)
+        with self._lock:
+            return func(*args, **kwargs)
+
+    async def _run(self, func: Callable, *args, **kwargs):
+        """
+        Runs a method of the wrapped manager in a worker thread and waits for its result.
+
+        :param func: The method to call.
+        :type func: Callable
+        :return: The method's return value.
+        :raises DataError: If the method raises it.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._transaction_executor.get() or self._executor
+        return await loop.run_in_executor(executor, functools.partial(self._call, func, args, kwargs))
+
+    def _enter(self, context):
+        """
+        Starts a transaction of the wrapped manager. Runs in the transaction's thread.
+
+        :param context: The context manager returned by the manager's `transaction()`.
+        """
+        if self._lock is not None:
+            self._lock.acquire()
+        try:
+            context.__enter__()
+        except BaseException:
+            if self._lock is not None:
+                self._lock.release()
+            raise
+
+    def _exit(self, context, *exc_info) -> bool:
+        """
+        Ends a transaction of the wrapped manager. Runs in the transaction's thread.
+
+        :param context: The context manager returned by the manager's `transaction()`.
+        :param exc_info: The exception raised by the transaction's block, as (type, value, traceback).
+        :return: True if the exception was suppressed.
+        :rtype: bool
+        """
+        try:
+            return context.__exit__(*exc_info)
+        finally:
+            if self._lock is not None:
+                self._lock.release()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator["AsyncDataManager"]:
+        """
+        Awaitable version of `BaseDataManager.transaction`, used with `async with`.
+
+        A transaction is bound to the thread that started it, so the block's
+        calls through this AsyncDataManager all run on one thread of their own,
+        which holds the transaction until the block ends; a nested transaction
+        runs on its outer transaction's thread. Calls made meanwhile by other
+        tasks run as usual, and wait wherever the wrapped manager makes writers
+        wait for the transaction.
+
+        :return: An async context manager yielding this AsyncDataManager.
+        :raises DataError: If the transaction cannot be started or committed.
+        """
+        loop = asyncio.get_running_loop()
+        outer = self._transaction_executor.get()
+        executor = outer or ThreadPoolExecutor(max_workers=1, thread_name_prefix="sms-transaction")
+        try:
+            context = self.manager.transaction()
+            await loop.run_in_executor(executor, self._enter, context)
+            token = self._transaction_executor.set(executor)
+            try:
+                yield self
+            except BaseException as e:
+                self._transaction_executor.reset(token)
+                if not await loop.run_in_executor(executor, self._exit, context, type(e), e, e.__traceback__):
+                    raise
+            else:
+                self._transaction_executor.reset(token)
+                await loop.run_in_executor(executor, self._exit, context, None, None, None)
+        finally:
+            if outer is None:
+                executor.shutdown(wait=False)
+
+    async def aclose(self):
+        """
+        Waits for the running calls to complete and stops the worker threads.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    async def __aenter__(self) -> "AsyncDataManager":
+        """
+        Enters an `async with` block.
+
+        :return: This AsyncDataManager.
+        :rtype: AsyncDataManager
+        """
+        return self
+
+    async def __aexit__(self, *_):
+        """
+        Closes the AsyncDataManager when the `async with` block ends.
+        """
+        await self.aclose()
+
+    async def add_student(self, **kwargs) -> None:
+        """Awaitable version of `BaseDataManager.add_student`."""
+        return await self._run(self.manager.add_student, **kwargs)
+
+    async def edit_student(self, **kwargs) -> None:
+        """Awaitable version of `BaseDataManager.edit_student`."""
+        return await self._run(self.manager.edit_student, **kwargs)
+
+    async def remove_student(self, student_id: str) -> None:
+        """Awaitable version of `BaseDataManager.remove_student`."""
+        return await self._run(self.manager.remove_student, student_id)
+
+    async def get_student(self, student_id: str) -> Student:
+        """Awaitable version of `BaseDataManager.get_student`."""
+        return await self._run(self.manager.get_student, student_id)
+
+    async def get_students(self) -> list[Student]:
+        """Awaitable version of `BaseDataManager.get_students`."""
+        return await self._run(self.manager.get_students)
+
+    async def iter_students(self, after_id: str = None, limit: int = PAGE_SIZE) -> list[Student]:
+        """Awaitable version of `BaseDataManager.iter_students`."""
+        return await self._run(self.manager.iter_students, after_id, limit)
+
+    async def search_students(self, query: str) -> list[Student]:
+        """Awaitable version of `BaseDataManager.search_students`."""
+        return await self._run(self.manager.search_students, query)
+
+    async def add_instructor(self, **kwargs) -> None:
+        """Awaitable version of `BaseDataManager.add_instructor`."""
+        return await self._run(self.manager.add_instructor, **kwargs)
+
+    async def edit_instructor(self, **kwargs) -> None:
+        """Awaitable version of `BaseDataManager.edit_instructor`."""
+        return await self._run(self.manager.edit_instructor, **kwargs)
+
+    async def remove_instructor(self, instructor_id: str) -> None:
+        """Awaitable version of `BaseDataManager.remove_instructor`."""
+        return await self._run(self.manager.remove_instructor, instructor_id)
+
+    async def get_instructor(self, instructor_id: str) -> Instructor:
+        """Awaitable version of `BaseDataManager.get_instructor`."""
+        return await self._run(self.manager.get_instructor, instructor_id)
+
+    async def get_instructors(self) -> list[Instructor]:
+        """Awaitable version of `BaseDataManager.get_instructors`."""
+        return await self._run(self.manager.get_instructors)
+
+    async def iter_instructors(self, after_id: str = None, limit: int = PAGE_SIZE) -> list[Instructor]:
+        """Awaitable version of `BaseDataManager.iter_instructors`."""
+        return await self._run(self.manager.iter_instructors, after_id, limit)
+
+    async def search_instructors(self, query: str) -> list[Instructor]:
+        """Awaitable version of `BaseDataManager.search_instructors`."""
+        return await self._run(self.manager.search_instructors, query)
+
+    async def add_course(self, **kwargs) -> None:
+        """Awaitable version of `BaseDataManager.add_course`."""
+        return await self._run(self.manager.add_course, **kwargs)
+
+    async def edit_course(self, **kwargs) -> None:
+        """Awaitable version of `BaseDataManager.edit_course`."""
+        return await self._run(self.manager.edit_course, **kwargs)
+
+    async def remove_course(self, course_id: str) -> None:
+        """Awaitable version of `BaseDataManager.remove_course`."""
+        return await self._run(self.manager.remove_course, course_id)
+
+    async def get_course(self, course_id: str) -> Course:
+        """Awaitable version of `BaseDataManager.get_course`."""
+        return await self._run(self.manager.get_course, course_id)
+
+    async def get_courses(self) -> list[Course]:
+        """Awaitable version of `BaseDataManager.get_courses`."""
+        return await self._run(self.manager.get_courses)
+
+    async def iter_courses(self, after_id: str = None, limit: int = PAGE_SIZE) -> list[Course]:
+        """Awaitable version of `BaseDataManager.iter_courses`."""
+        return await self._run(self.manager.iter_courses, after_id, limit)
+
+    async def search_courses(self, query: str) -> list[Course]:
+        """Awaitable version of `BaseDataManager.search_courses`."""
+        return await self._run(self.manager.search_courses, query)
+
+    async def enroll_student(self, student_id: str, course_id: str) -> None:
+        """Awaitable version of `BaseDataManager.enroll_student`."""
+        return await self._run(self.manager.enroll_student, student_id, course_id)
+
+    async def enroll_many(self, pairs: Iterable[tuple[str, str]]) -> int:
+        """Awaitable version of `BaseDataManager.enroll_many`."""
+        # materialized here, so a generator is not consumed by the worker thread
+        return await self._run(self.manager.enroll_many, list(pairs))
+
+    async def enroll_students(self, course_id: str, student_ids: Iterable[str]) -> int:
+        """Awaitable version of `BaseDataManager.enroll_students`."""
+        return await self._run(self.manager.enroll_students, course_id, list(student_ids))
+
+    async def data_to_json(self, filepath: str) -> None:
+        """Awaitable version of `BaseDataManager.data_to_json`."""
+        return await self._run(self.manager.data_to_json, filepath)
+
+    async def data_from_json(self, filepath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
+        """Awaitable version of `BaseDataManager.data_from_json`."""
+        return await self._run(self.manager.data_from_json, filepath, merge, prune)
+
+    async def data_to_snapshot(self, filepath: str) -> None:
+        """Awaitable version of `BaseDataManager.data_to_snapshot`."""
+        return await self._run(self.manager.data_to_snapshot, filepath)
+
+    async def data_from_snapshot(self, filepath: str, merge: bool = False,
+                                 prune: bool = False) -> dict[str, int] | None:
+        """Awaitable version of `BaseDataManager.data_from_snapshot`."""
+        return await self._run(self.manager.data_from_snapshot, filepath, merge, prune)
+
+    async def data_to_csv(self, dirpath: str) -> None:
+        """Awaitable version of `BaseDataManager.data_to_csv`."""
+        return await self._run(self.manager.data_to_csv, dirpath)
+
+    async def data_from_csv(self, dirpath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
+        """Awaitable version of `BaseDataManager.data_from_csv`."""
+        return await self._run(self.manager.data_from_csv, dirpath, merge, prune)
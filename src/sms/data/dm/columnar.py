@@ -0,0 +1,1032 @@
+"""
+Provides a read-only data manager over a memory-mapped columnar store.
+
+A columnar store holds the same data as a snapshot, laid out so that it can
+be used in place instead of being loaded: the file is mapped into memory with
+`mmap`, and records are decoded only when they are asked for. Opening a store
+costs the same whatever its size, and processes that open the same file share
+one copy of it in the operating system's page cache, so reporting workers can
+each read all the data without each holding their own object graph.
+
+Every table is sorted by ID and stored as columns:
+
+- IDs: fixed-width, padded with NUL bytes, so a record is found by binary search
+- names and emails: offsets into a shared string heap (64 bits each, one more than there are rows)
+- ages: 16 bits each; a course's instructor: the instructor's row number (32 bits)
+- relations, in compressed sparse row form: for each row, the position of its
+  first related row in an array of row numbers (32 bits each, one more than
+  there are rows), and that array
+- search text: offsets into the heap of each row's lowercased searchable fields
+
+Layout, with every integer unsigned and little-endian:
+
+- header: the magic bytes `MAGIC`, the format version (16 bits), 16 reserved
+  bits, and the number of sections (32 bits)
+- directory: for each section, in a fixed order, its offset and byte length
+  (64 bits each), and the size of its items (32 bits, then 32 padding bits)
+- sections, each starting at a multiple of 8 bytes
+
+A store is only ever written by the application from valid objects, so its
+records are not revalidated, and it has no checksum: verifying one would
+mean reading the whole file when it is opened.
+
+Attributes:
+    MAGIC (bytes): The bytes every columnar store starts with.
+    VERSION (int): The version of the format written by `write_columnar_store`.
+"""
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import Iterable
+
+from .file import FileManager
+from .interface import BaseDataManager, DataError, PAGE_SIZE
+from .snapshot import SnapshotError
+from ...models.course import Course
+from ...models.instructor import Instructor
+from ...models.relation import LazyRelation
+from ...models.student import Student
+
+MAGIC = b"SMSC"
+
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHI")
+_ENTRY = struct.Struct("<QQI4x")
+_ALIGNMENT = 8
+# array item types of the columns; "I" is 32 bits and "Q" 64 bits on every supported platform
+_AGE = "H"
+_ROW = "I"
+_OFFSET = "Q"
+
+_TABLES = {
+    "instructors": ("instructor_id", "assigned_courses", "courses"),
+    "courses": ("course_id", "enrolled_students", "students"),
+    "students": ("student_id", "registered_courses", "courses"),
+}
+"""For each table: the ID attribute, the relation attribute, and the table the relation refers to."""
+
+_SECTIONS = tuple(
+    f"{kind}.{column}"
+    for kind, columns in (("instructors", ("ids", "names", "ages", "emails", "links.ptr", "links", "search")),
+                          ("courses", ("ids", "names", "owners", "links.ptr", "links", "search")),
+                          ("students", ("ids", "names", "ages", "emails", "links.ptr", "links", "search")))
+    for column in columns
+) + ("heap",)
+"""The sections of a columnar store, in the order of its directory."""
+
+
+class ColumnarError(ValueError):
+    """Raised when a file is not a columnar store, is of an unsupported version, or is corrupt."""
+
+
+def _align(offset: int) -> int:
+    """
+    Rounds an offset up to the section alignment.
+
+    :param offset: The offset.
+    :type offset: int
+    :return: The first aligned offset not before it.
+    :rtype: int
+    """
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def write_columnar_store(path: str, instructors: Iterable[Instructor], courses: Iterable[Course],
+                         students: Iterable[Student]) -> int:
+    """
+    Writes model objects to a file as a columnar store.
+
+    Every course's instructor and every related object must be among the
+    objects written. The store is written to a temporary file that then
+    replaces `path`, so processes that have the old store open keep reading
+    it, unchanged, until they open the new one.
+
+    :param path: The path of the store.
+    :type path: str
+    :param instructors: The instructors, with their assigned courses.
+    :type instructors: Iterable[Instructor]
+    :param courses: The courses, with their enrolled students.
+    :type courses: Iterable[Course]
+    :param students: The students, with their registered courses.
+    :type students: Iterable[Student]
+    :return: The size of the store, in bytes.
+    :rtype: int
+    """
+    tables = {kind: sorted(objects, key=lambda obj, key=_TABLES[kind][0]: getattr(obj, key).encode("utf-8"))
+              for kind, objects in (("instructors", instructors), ("courses", courses), ("students", students))}
+    rows = {kind: {getattr(obj, _TABLES[kind][0]): n for n, obj in enumerate(objects)}
+            for kind, objects in tables.items()}
+    heap = bytearray()
+
+    def strings(values: Iterable[str]) -> array:
+        offsets = array(_OFFSET, [len(heap)])
+        for value in values:
+            heap.extend(value.encode("utf-8"))
+            offsets.append(len(heap))
+        return offsets
+
+    sections = {}
+    for kind, objects in tables.items():
+        key, relation, target = _TABLES[kind]
+        ids = [getattr(obj, key).encode("utf-8") for obj in objects]
+        width = max(map(len, ids), default=1)
+        sections[f"{kind}.ids"] = (b"".join(i.ljust(width, b"\0") for i in ids), width)
+        if kind == "courses":
+            sections[f"{kind}.names"] = strings(c.course_name for c in objects)
+            sections[f"{kind}.owners"] = array(_ROW, (rows["instructors"][c.instructor.instructor_id] for c in objects))
+        else:
+            sections[f"{kind}.names"] = strings(p.name for p in objects)
+            sections[f"{kind}.ages"] = array(_AGE, (p.age for p in objects))
+            sections[f"{kind}.emails"] = strings(p._email for p in objects)
+        ptr, links = array(_ROW, [0]), array(_ROW)
+        for obj in objects:
+            links.extend(rows[target][related_id] for related_id in getattr(obj, relation).ids())
+            ptr.append(len(links))
+        sections[f"{kind}.links.ptr"], sections[f"{kind}.links"] = ptr, links
+        # each row's text starts with a NUL byte, so that no match can span two rows
+        sections[f"{kind}.search"] = strings("\0" + "\0".join(obj.search_fields()).lower()
+                                             for obj in objects)
+    sections["heap"] = (bytes(heap), 1)
+
+    directory, chunks = [], []
+    offset = _align(_HEADER.size + _ENTRY.size * len(_SECTIONS))
+    for name in _SECTIONS:
+        data = sections[name]
+        if isinstance(data, array):
+            if sys.byteorder == "big":
+                data.byteswap()
+            data = (data.tobytes(), data.itemsize)
+        data, item_size = data
+        directory.append(_ENTRY.pack(offset, len(data), item_size))
+        chunks.append((offset, data))
+        offset = _align(offset + len(data))
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, 0, len(_SECTIONS)))
+            f.write(b"".join(directory))
+            for offset, data in chunks:
+                f.write(bytes(offset - f.tell()))
+                f.write(data)
+            size = f.tell()
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return size
+
+
+class _Table:
+    """
+    The columns of one table of an open columnar store.
+
+    The numeric columns are memoryviews of the mapped file (copies, on
+    big-endian platforms); strings are decoded from the heap when read.
+
+    A table also holds the model objects built from its rows, and the other
+    tables of its store, so whoever holds a table (or an object built from
+    it) keeps reading the store it came from, and keeps it mapped.
+
+    :ivar kind: The name of the table.
+    :vartype kind: str
+    :ivar tables: The tables of the store, by name.
+    :vartype tables: dict[str, _Table]
+    :ivar objects: The model objects built from the table, by row.
+    :vartype objects: dict[int, object]
+    """
+    __slots__ = ("kind", "tables", "objects", "mmap", "heap", "count", "ids", "width", "names", "ages", "emails",
+                 "owners", "link_ptr", "links", "search_ptr")
+
+    def __init__(self, store: "ColumnarStore", kind: str):
+        """
+        Initializes a _Table.
+
+        :param store: The open store.
+        :type store: ColumnarStore
+        :param kind: The name of the table.
+        :type kind: str
+        :raises ColumnarError: If the columns of the table do not agree on its number of rows.
+        """
+        self.kind = kind
+        self.tables = store.tables
+        self.objects = {}
+        self.mmap, self.heap = store.mmap, store.heap
+        self.ids, length, self.width = store.section(f"{kind}.ids")
+        self.count = length // self.width
+        self.names = store.column(f"{kind}.names", _OFFSET, self.count + 1)
+        people = kind != "courses"
+        self.ages = store.column(f"{kind}.ages", _AGE, self.count) if people else None
+        self.emails = store.column(f"{kind}.emails", _OFFSET, self.count + 1) if people else None
+        self.owners = None if people else store.column(f"{kind}.owners", _ROW, self.count)
+        self.link_ptr = store.column(f"{kind}.links.ptr", _ROW, self.count + 1)
+        self.links = store.column(f"{kind}.links", _ROW, self.link_ptr[self.count])
+        self.search_ptr = store.column(f"{kind}.search", _OFFSET, self.count + 1)
+
+    def id(self, row: int) -> str:
+        """
+        Reads the ID of a row.
+
+        :param row: The row number.
+        :type row: int
+        :return: The ID.
+        :rtype: str
+        """
+        return self._id_bytes(row).rstrip(b"\0").decode("utf-8")
+
+    def _id_bytes(self, row: int) -> bytes:
+        """
+        Reads the padded ID of a row.
+
+        :param row: The row number.
+        :type row: int
+        :return: The ID, as stored.
+        :rtype: bytes
+        """
+        start = self.ids + row * self.width
+        return self.mmap[start:start + self.width]
+
+    def _bisect(self, key: bytes, right: bool) -> int:
+        """
+        Finds where an ID would be inserted in the ID column, by binary search.
+
+        :param key: The ID, padded to the column's width.
+        :type key: bytes
+        :param right: If True, the position after any equal ID is returned, otherwise the position before it.
+        :type right: bool
+        :return: The row number.
+        :rtype: int
+        """
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = self._id_bytes(mid)
+            if value < key or (right and value == key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, record_id: str) -> int:
+        """
+        Finds the row of an ID.
+
+        :param record_id: The ID.
+        :type record_id: str
+        :return: The row number, or -1 if the table does not hold the ID.
+        :rtype: int
+        """
+        key = record_id.encode("utf-8")
+        if len(key) > self.width or b"\0" in key:
+            return -1
+        key = key.ljust(self.width, b"\0")
+        row = self._bisect(key, False)
+        return row if row < self.count and self._id_bytes(row) == key else -1
+
+    def after(self, record_id: str) -> int:
+        """
+        Finds the first row whose ID is greater than a given ID.
+
+        :param record_id: The ID, which the table need not hold.
+        :type record_id: str
+        :return: The row number, or the number of rows if there is none.
+        :rtype: int
+        """
+        # IDs hold no NUL bytes, so padding keeps their order, and any ID longer than
+        # the column compares with the stored IDs as its first `width` bytes do
+        return self._bisect(record_id.encode("utf-8")[:self.width].ljust(self.width, b"\0"), True)
+
+    def string(self, offsets: memoryview, row: int) -> str:
+        """
+        Reads a string column.
+
+        :param offsets: The column's heap offsets.
+        :type offsets: memoryview
+        :param row: The row number.
+        :type row: int
+        :return: The string.
+        :rtype: str
+        """
+        heap = self.heap
+        return self.mmap[heap + offsets[row]:heap + offsets[row + 1]].decode("utf-8")
+
+    def linked(self, row: int) -> list[int]:
+        """
+        Reads the rows related to a row.
+
+        :param row: The row number.
+        :type row: int
+        :return: The row numbers of the related records, in the table the relation refers to.
+        :rtype: list[int]
+        """
+        return self.links[self.link_ptr[row]:self.link_ptr[row + 1]].tolist()
+
+    def search(self, query: str) -> list[int]:
+        """
+        Finds the rows whose searchable fields contain a query, ignoring case.
+
+        The lowercased fields of all rows are stored one after another, each
+        row's starting with a NUL byte, so a single scan of the mapped file
+        finds every match, and a binary search over the row offsets tells
+        which row each one belongs to.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching row numbers, in ID order.
+        :rtype: list[int]
+        """
+        needle = query.lower().encode("utf-8")
+        if not needle:
+            return list(range(self.count))
+        if b"\0" in needle:
+            return []
+        mm, heap, offsets = self.mmap, self.heap, self.search_ptr
+        rows = []
+        start, end = heap + offsets[0], heap + offsets[self.count]
+        while (position := mm.find(needle, start, end)) >= 0:
+            row = bisect_right(offsets, position - heap) - 1
+            rows.append(row)
+            start = heap + offsets[row + 1]
+        return rows
+
+
+class ColumnarStore:
+    """
+    A columnar store file, mapped read-only into memory.
+
+    The file stays mapped as long as the store or any of its tables is
+    referenced, or until `close` is called.
+
+    :ivar mmap: The mapped file.
+    :vartype mmap: mmap.mmap
+    :ivar heap: The offset of the string heap in the file.
+    :vartype heap: int
+    :ivar tables: The instructors, courses, and students tables, by name.
+    :vartype tables: dict[str, _Table]
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens and maps a columnar store. Only the header and directory are read.
+
+        :param path: The path of the store.
+        :type path: str
+        :raises OSError: If the file cannot be opened.
+        :raises ColumnarError: If the file is not a valid columnar store of a supported version.
+        """
+        with open(path, "rb") as f:
+            try:
+                self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ColumnarError("The file is empty.")
+        self._views: list[memoryview] = []
+        try:
+            self._sections = self._read_directory()
+            self.heap = self._sections["heap"][0]
+            self.tables = {}
+            for kind in _TABLES:
+                self.tables[kind] = _Table(self, kind)
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_directory(self) -> dict[str, tuple[int, int, int]]:
+        """
+        Reads and checks the header and the section directory.
+
+        :return: The offset, byte length, and item size of each section, by name.
+        :rtype: dict[str, tuple[int, int, int]]
+        :raises ColumnarError: If the header or directory is invalid.
+        """
+        size = len(self.mmap)
+        if size < _HEADER.size:
+            raise ColumnarError("The file is too short to be a columnar store.")
+        magic, version, _, count = _HEADER.unpack_from(self.mmap)
+        if magic != MAGIC:
+            raise ColumnarError("The file is not a columnar store.")
+        if version != VERSION:
+            raise ColumnarError(f"Columnar store version {version} is not supported (expected {VERSION}).")
+        if count != len(_SECTIONS) or size < _HEADER.size + count * _ENTRY.size:
+            raise ColumnarError("The columnar store's section directory is corrupt.")
+        sections = {}
+        for n, name in enumerate(_SECTIONS):
+            offset, length, item_size = _ENTRY.unpack_from(self.mmap, _HEADER.size + n * _ENTRY.size)
+            if not item_size or length % item_size or offset % _ALIGNMENT or offset + length > size:
+                raise ColumnarError(f"The columnar store's {name} section is corrupt.")
+            sections[name] = (offset, length, item_size)
+        return sections
+
+    def section(self, name: str) -> tuple[int, int, int]:
+        """
+        Looks up a section in the directory.
+
+        :param name: The name of the section.
+        :type name: str
+        :return: The section's offset, byte length, and item size.
+        :rtype: tuple[int, int, int]
+        """
+        return self._sections[name]
+
+    def column(self, name: str, typecode: str, count: int) -> memoryview | array:
+        """
+        Gives access to an integer column without copying it.
+
+        :param name: The name of the section holding the column.
+        :type name: str
+        :param typecode: The `array` type code of the column.
+        :type typecode: str
+        :param count: The number of integers the column should hold.
+        :type count: int
+        :return: A view of the mapped column, or a byte-swapped copy of it on big-endian platforms.
+        :rtype: memoryview | array
+        :raises ColumnarError: If the column does not hold `count` integers of that type.
+        """
+        offset, length, item_size = self._sections[name]
+        if item_size != struct.calcsize(typecode) or length != count * item_size:
+            raise ColumnarError(f"The columnar store's {name} section does not match its table.")
+        if sys.byteorder == "big":
+            column = array(typecode, self.mmap[offset:offset + length])
+            column.byteswap()
+            return column
+        view = memoryview(self.mmap)[offset:offset + length].cast(typecode)
+        self._views.append(view)
+        return view
+
+    def close(self):
+        """
+        Releases the column views and unmaps the file.
+
+        The store's tables, and the objects built from them, can no longer be read afterwards.
+        """
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self.mmap.close()
+
+
+class ColumnarDataManager(BaseDataManager):
+    """
+    Implements the BaseDataManager interface, read-only, over a columnar store.
+
+    A store is opened with `open`, which maps the file and returns at once.
+    Model objects are built from its columns only when they are first asked
+    for, and kept in a class-level identity map; their relations are
+    `LazyRelation` proxies that read the store's relation arrays on first use.
+    `get_*` and `iter_*` find records by binary search over the sorted ID
+    columns, and `search_*` scans the store's search text, so none of them
+    build more objects than they return.
+
+    Every write, and every import, raises a DataError. Stores are written with
+    `build` (or `write_columnar_store`), and a new build reaches a process the
+    next time it calls `open`.
+
+    Reads take no lock: each one looks up the open store's table once and
+    works on that table only. When another store is opened (or the store is
+    closed), the replaced store is not unmapped under its readers; it stays
+    mapped, and the objects built from it stay readable, until nothing refers
+    to it any more.
+    """
+    thread_safe = True
+
+    _store: ColumnarStore | None = None
+    """The open store."""
+    _lock = threading.RLock()
+    """Guards the identity maps of the tables, so that two threads never build the same object."""
+
+    @staticmethod
+    def open(filepath: str) -> None:
+        """
+        Opens a columnar store in place of the one currently open.
+
+        Objects built from the previous store keep reading that store, not the new one.
+
+        :param filepath: The path of the store.
+        :type filepath: str
+        :raises DataError: If the file cannot be opened or is not a valid columnar store.
+        """
+        try:
+            store = ColumnarStore(filepath)
+        except (OSError, ColumnarError) as e:
+            raise DataError(f"Failed to open columnar store: {e}")
+        ColumnarDataManager._store = store
+
+    @staticmethod
+    def close() -> None:
+        """
+        Closes the open store, if any.
+
+        The file is unmapped once no reader, and no object built from it, refers to it any more.
+        """
+        ColumnarDataManager._store = None
+
+    @staticmethod
+    def build(filepath: str, source: BaseDataManager) -> int:
+        """
+        Writes a columnar store holding all the data of another data manager.
+
+        The data is copied through a temporary snapshot, which every data
+        manager exports without loading its records one by one.
+
+        :param filepath: The path of the store.
+        :type filepath: str
+        :param source: The data manager to copy (e.g., `data_manager`).
+        :type source: BaseDataManager
+        :return: The size of the store, in bytes.
+        :rtype: int
+        :raises DataError: If the data cannot be exported or the store cannot be written.
+        """
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                snapshot_path = os.path.join(tmpdir, "data.snap")
+                source.data_to_snapshot(snapshot_path)
+                data = FileManager.from_snapshot(snapshot_path)
+            return write_columnar_store(filepath, data.instructors.values(), data.courses.values(),
+                                        data.students.values())
+        except (OSError, SnapshotError) as e:
+            raise DataError(f"Failed to build columnar store: {e}")
+
+    @staticmethod
+    def _table(kind: str) -> _Table:
+        """
+        Returns a table of the open store.
+
+        :param kind: The name of the table.
+        :type kind: str
+        :return: The table.
+        :rtype: _Table
+        :raises DataError: If no store is open.
+        """
+        store = ColumnarDataManager._store
+        if store is None:
+            raise DataError("No columnar store is open.")
+        return store.tables[kind]
+
+    @staticmethod
+    def _object(table: _Table, row: int):
+        """
+        Returns the model object of a row, building it on first use.
+
+        :param table: The table holding the row.
+        :type table: _Table
+        :param row: The row number.
+        :type row: int
+        :return: The `Student`, `Instructor`, or `Course` object.
+        """
+        objects = table.objects
+        obj = objects.get(row)
+        if obj is not None:
+            return obj
+        with ColumnarDataManager._lock:
+            obj = objects.get(row)
+            if obj is None:
+                if table.kind == "courses":
+                    # the instructor's courses come from their own relation array, so do not assign here
+                    instructor = ColumnarDataManager._object(table.tables["instructors"], table.owners[row])
+                    obj = Course.from_trusted(table.id(row), table.string(table.names, row), instructor, assign=False)
+                else:
+                    model = Student if table.kind == "students" else Instructor
+                    obj = model.from_trusted(table.string(table.names, row), table.ages[row],
+                                             table.string(table.emails, row), table.id(row))
+                _, relation, target = _TABLES[table.kind]
+                target_table = table.tables[target]
+                setattr(obj, relation, LazyRelation(
+                    _TABLES[target][0],
+                    lambda: [ColumnarDataManager._object(target_table, r) for r in table.linked(row)],
+                    ColumnarDataManager._lock))
+                objects[row] = obj
+            return obj
+
+    @staticmethod
+    def _get(kind: str, label: str, record_id: str):
+        """
+        Retrieves the model object of an ID.
+
+        :param kind: The name of the table.
+        :type kind: str
+        :param label: The kind of record, capitalized, for the error message.
+        :type label: str
+        :param record_id: The ID.
+        :type record_id: str
+        :return: The `Student`, `Instructor`, or `Course` object.
+        :raises DataError: If the table does not hold the ID.
+        """
+        table = ColumnarDataManager._table(kind)
+        row = table.find(record_id)
+        if row < 0:
+            raise DataError.not_found(label, [record_id])
+        return ColumnarDataManager._object(table, row)
+
+    @staticmethod
+    def _all(kind: str) -> list:
+        """
+        Retrieves the model objects of a whole table, ordered by ID.
+
+        :param kind: The name of the table.
+        :type kind: str
+        :return: The objects.
+        :rtype: list
+        """
+        return ColumnarDataManager._every_object(ColumnarDataManager._table(kind))
+
+    @staticmethod
+    def _every_object(table: _Table) -> list:
+        """
+        Retrieves the model objects of every row of a table, ordered by ID.
+
+        :param table: The table.
+        :type table: _Table
+        :return: The objects.
+        :rtype: list
+        """
+        return [ColumnarDataManager._object(table, row) for row in range(table.count)]
+
+    @staticmethod
+    def _page(kind: str, after_id: str, limit: int) -> list:
+        """
+        Retrieves the objects of a table following a given ID, ordered by ID.
+
+        :param kind: The name of the table.
+        :type kind: str
+        :param after_id: Only objects with a greater ID are returned. None starts from the beginning.
+        :type after_id: str | None
+        :param limit: The maximum number of objects to return. A negative value means no limit.
+        :type limit: int
+        :return: The objects of the page.
+        :rtype: list
+        """
+        table = ColumnarDataManager._table(kind)
+        start = table.after(after_id) if after_id is not None else 0
+        end = min(start + limit, table.count) if limit >= 0 else table.count
+        return [ColumnarDataManager._object(table, row) for row in range(start, end)]
+
+    @staticmethod
+    def _search(kind: str, query: str) -> list:
+        """
+        Finds the objects of a table whose searchable fields contain the query, ignoring case.
+
+        :param kind: The name of the table.
+        :type kind: str
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching objects, ordered by ID.
+        :rtype: list
+        """
+        table = ColumnarDataManager._table(kind)
+        return [ColumnarDataManager._object(table, row) for row in table.search(query)]
+
+    @staticmethod
+    def _read_only():
+        """
+        Rejects a write.
+
+        :raises DataError: Always.
+        """
+        raise DataError("The columnar store is read-only.")
+
+    @staticmethod
+    def _file_manager() -> FileManager:
+        """
+        Collects every record of the open store into a FileManager, for the exports.
+
+        :return: The FileManager.
+        :rtype: FileManager
+        """
+        # all three tables from the same store, even if another is opened meanwhile
+        tables = ColumnarDataManager._table("students").tables
+        fm = FileManager()
+        fm.instructors = {i.instructor_id: i for i in ColumnarDataManager._every_object(tables["instructors"])}
+        fm.courses = {c.course_id: c for c in ColumnarDataManager._every_object(tables["courses"])}
+        fm.students = {s.student_id: s for s in ColumnarDataManager._every_object(tables["students"])}
+        return fm
+
+    @staticmethod
+    def add_student(**kwargs) -> None:
+        """
+        Rejects adding a student.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def edit_student(**kwargs) -> None:
+        """
+        Rejects editing a student.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def remove_student(student_id: str) -> None:
+        """
+        Rejects removing a student.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def get_student(student_id: str) -> Student:
+        """
+        Retrieves a single student from the store.
+
+        :param student_id: The ID of the student to retrieve.
+        :type student_id: str
+        :return: The corresponding Student object.
+        :rtype: Student
+        :raises DataError: If the student is not found, or no store is open.
+        """
+        return ColumnarDataManager._get("students", "Student", student_id)
+
+    @staticmethod
+    def get_students() -> list[Student]:
+        """
+        Retrieves all students from the store, ordered by ID.
+
+        :return: A list of all students.
+        :rtype: list[Student]
+        """
+        return ColumnarDataManager._all("students")
+
+    @staticmethod
+    def iter_students(after_id: str = None, limit: int = PAGE_SIZE) -> list[Student]:
+        """
+        Retrieves one page of students from the store, ordered by ID.
+
+        :param after_id: Only students with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of students to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` students, ordered by ID.
+        :rtype: list[Student]
+        """
+        return ColumnarDataManager._page("students", after_id, limit)
+
+    @staticmethod
+    def search_students(query: str) -> list[Student]:
+        """
+        Finds the students whose name, ID, or email contains the query, ignoring case.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching students, ordered by ID.
+        :rtype: list[Student]
+        """
+        return ColumnarDataManager._search("students", query)
+
+    @staticmethod
+    def add_instructor(**kwargs) -> None:
+        """
+        Rejects adding an instructor.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def edit_instructor(**kwargs) -> None:
+        """
+        Rejects editing an instructor.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def remove_instructor(instructor_id: str) -> None:
+        """
+        Rejects removing an instructor.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def get_instructor(instructor_id: str) -> Instructor:
+        """
+        Retrieves a single instructor from the store.
+
+        :param instructor_id: The ID of the instructor to retrieve.
+        :type instructor_id: str
+        :return: The corresponding Instructor object.
+        :rtype: Instructor
+        :raises DataError: If the instructor is not found, or no store is open.
+        """
+        return ColumnarDataManager._get("instructors", "Instructor", instructor_id)
+
+    @staticmethod
+    def get_instructors() -> list[Instructor]:
+        """
+        Retrieves all instructors from the store, ordered by ID.
+
+        :return: A list of all instructors.
+        :rtype: list[Instructor]
+        """
+        return ColumnarDataManager._all("instructors")
+
+    @staticmethod
+    def iter_instructors(after_id: str = None, limit: int = PAGE_SIZE) -> list[Instructor]:
+        """
+        Retrieves one page of instructors from the store, ordered by ID.
+
+        :param after_id: Only instructors with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of instructors to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` instructors, ordered by ID.
+        :rtype: list[Instructor]
+        """
+        return ColumnarDataManager._page("instructors", after_id, limit)
+
+    @staticmethod
+    def search_instructors(query: str) -> list[Instructor]:
+        """
+        Finds the instructors whose name, ID, or email contains the query, ignoring case.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching instructors, ordered by ID.
+        :rtype: list[Instructor]
+        """
+        return ColumnarDataManager._search("instructors", query)
+
+    @staticmethod
+    def add_course(**kwargs) -> None:
+        """
+        Rejects adding a course.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def edit_course(**kwargs) -> None:
+        """
+        Rejects editing a course.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def remove_course(course_id: str) -> None:
+        """
+        Rejects removing a course.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def get_course(course_id: str) -> Course:
+        """
+        Retrieves a single course from the store.
+
+        :param course_id: The ID of the course to retrieve.
+        :type course_id: str
+        :return: The corresponding Course object.
+        :rtype: Course
+        :raises DataError: If the course is not found, or no store is open.
+        """
+        return ColumnarDataManager._get("courses", "Course", course_id)
+
+    @staticmethod
+    def get_courses() -> list[Course]:
+        """
+        Retrieves all courses from the store, ordered by ID.
+
+        :return: A list of all courses.
+        :rtype: list[Course]
+        """
+        return ColumnarDataManager._all("courses")
+
+    @staticmethod
+    def iter_courses(after_id: str = None, limit: int = PAGE_SIZE) -> list[Course]:
+        """
+        Retrieves one page of courses from the store, ordered by ID.
+
+        :param after_id: Only courses with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of courses to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` courses, ordered by ID.
+        :rtype: list[Course]
+        """
+        return ColumnarDataManager._page("courses", after_id, limit)
+
+    @staticmethod
+    def search_courses(query: str) -> list[Course]:
+        """
+        Finds the courses whose ID or name contains the query, ignoring case.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching courses, ordered by ID.
+        :rtype: list[Course]
+        """
+        return ColumnarDataManager._search("courses", query)
+
+    @staticmethod
+    def enroll_student(student_id: str, course_id: str) -> None:
+        """
+        Rejects enrolling a student.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def enroll_many(pairs) -> int:
+        """
+        Rejects enrolling students in bulk.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def enroll_students(course_id: str, student_ids) -> int:
+        """
+        Rejects enrolling students in a course.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    @contextmanager
+    def transaction():
+        """
+        Delimits a block of reads. Since the store cannot be written, there is nothing to commit or roll back.
+
+        :return: A context manager delimiting the transaction.
+        """
+        yield
+
+    @staticmethod
+    def data_to_json(filepath: str) -> None:
+        """
+        Saves all the data of the store to a JSON file.
+
+        :param filepath: The path to the output JSON file.
+        :type filepath: str
+        """
+        ColumnarDataManager._file_manager().save_to_json(filepath)
+
+    @staticmethod
+    def data_from_json(filepath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
+        """
+        Rejects importing a JSON file.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def data_to_snapshot(filepath: str) -> None:
+        """
+        Saves all the data of the store to a binary snapshot file.
+
+        :param filepath: The path to the output snapshot file.
+        :type filepath: str
+        """
+        ColumnarDataManager._file_manager().save_to_snapshot(filepath)
+
+    @staticmethod
+    def data_from_snapshot(filepath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
+        """
+        Rejects importing a snapshot file.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
+
+    @staticmethod
+    def data_to_csv(dirpath: str) -> None:
+        """
+        Saves all the data of the store to CSV files.
+
+        :param dirpath: The path to the output directory.
+        :type dirpath: str
+        """
+        ColumnarDataManager._file_manager().save_to_csv(dirpath)
+
+    @staticmethod
+    def data_from_csv(dirpath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
+        """
+        Rejects importing CSV files.
+
+        :raises DataError: Always, since the store is read-only.
+        """
+        ColumnarDataManager._read_only()
@@ -2,37 +2,90 @@
 Provides a database-backed implementation of the data management interface.
 
 This module uses a `DatabaseManager` for direct SQL operations and implements
-the `DatabaseDataManager` class. This class uses an in-memory caching strategy
-to "hydrate" data from the database into a network of Python objects,
-improving performance for read operations. Write operations are sent
-directly to the database.
+the `DatabaseDataManager` class. This class loads objects from the database on
+demand: fetching a record builds only that object, and its relationships are
+fetched by a targeted query the first time they are used. Each record is built
+at most once and kept in an in-memory identity map, so repeated reads are
+served from memory and every reader sees the same object. Write operations are
+sent directly to the database and then applied to the cached objects in place.
 """
+import gc
 import json
+import os
 import sqlite3
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 
 from .file import FileManager
-from .interface import BaseDataManager, DataError
+from .interface import BaseDataManager, DataError, PAGE_SIZE
+from .snapshot import SnapshotError
 from ..db.manager import DatabaseManager as DatabaseManager
 from ...models.course import Course
 from ...models.instructor import Instructor
+from ...models.relation import LazyRelation, RelationSet
 from ...models.student import Student
 
-dbm = DatabaseManager()
+DATABASE_PATH_VARIABLE = "SMS_DB_PATH"
+"""The environment variable that, when set, gives the path of the application database instead of 'sms.db'."""
+
+dbm = DatabaseManager(os.environ.get(DATABASE_PATH_VARIABLE, "sms.db"))
 """The global instance for direct, low-level database communication."""
 dbm.create_tables()
 
+_ID_ATTRIBUTES = {"students_map": "student_id", "instructors_map": "instructor_id", "courses_map": "course_id"}
+"""The attribute holding the ID of the objects in each map of the cache."""
+_PERSON_FIELDS = {"name": "name", "age": "age", "email": "_email"}
+"""The model attribute holding each editable field of a student or instructor."""
+_COURSE_FIELDS = {"course_name": "course_name"}
+"""The model attribute holding each editable field of a course, besides its instructor."""
+
+
+def _empty_cache() -> dict:
+    """
+    Creates the empty lookup maps of the identity map.
+
+    :return: A dictionary with an empty map for each kind of object.
+    :rtype: dict
+    """
+    return {"students_map": {}, "instructors_map": {}, "courses_map": {}}
+
 
 class DatabaseDataManager(BaseDataManager):
     """
     Implements the data management interface using a persistent SQLite database.
 
     This class provides CRUD operations that interact with the database.
-    It uses a class-level cache to store hydrated object models, reducing
-    database queries for repeated read operations. Write operations (add, edit,
-    remove) are performed directly on the database and invalidate the cache.
+    Objects are loaded lazily into a class-level identity map: `get_student`
+    reads a single row, and the `registered_courses`, `enrolled_students`, and
+    `assigned_courses` of a loaded object are `LazyRelation` proxies that run
+    their query on first use and keep the result. The listing methods load a
+    whole table once, and only the JSON export builds the complete object graph.
+
+    Each write is a single statement: instead of looking the record up first,
+    it relies on the table constraints (`ON CONFLICT DO NOTHING` for existing
+    keys, the foreign keys for missing references) and on the number of rows
+    changed, so a concurrent writer cannot slip in between a check and the write.
+
+    The cache is write-through: every successful write (add, edit, remove,
+    enroll) is applied in place to the cached objects and to the relations that
+    have been loaded, so it never has to be rebuilt because a single record
+    changed. Relations that have not been loaded yet need no update, since they
+    will read the database when they are first used.
+
+    The methods are safe to call from several threads: the database is
+    accessed through a connection pool, and a class-level lock serializes the
+    writes with their cache updates and with the readers of the cache.
     """
-    _cache = {}
-    """Internal cache for storing hydrated data objects to minimize DB queries."""
+    _cache = _empty_cache()
+    """The identity map: every object loaded so far, by kind and then by ID."""
+    _complete = set()
+    """The kinds of object (keys of `_cache`) whose map holds every record, in table order."""
+    _hydrated = False
+    """Whether every relation of every cached object is loaded, as built by `_get_hydrated_data`."""
+    thread_safe = True
+    _lock = threading.RLock()
+    """Guards the cache, so that each write and its cache update appear atomic to other threads."""
 
     @staticmethod
     def get_db_path():
@@ -47,87 +100,375 @@ class DatabaseDataManager(BaseDataManager):
     @staticmethod
     def _clear_cache():
         """Invalidates the in-memory cache, forcing a refresh from the database."""
-        DatabaseDataManager._cache = {}
+        DatabaseDataManager._cache = _empty_cache()
+        DatabaseDataManager._complete = set()
+        DatabaseDataManager._hydrated = False
+
+    @staticmethod
+    def _validated_edit(blank, fields: dict, attributes: dict) -> dict:
+        """
+        Validates the fields of an edit with the model's own `update`, before anything is written.
+
+        The fields are applied to a blank object of the edited model, so the
+        database is only written once every value has passed the model's checks.
+
+        :param blank: A blank object of the edited model.
+        :param fields: The fields of the edit.
+        :type fields: dict
+        :param attributes: The model attribute holding each editable field.
+        :type attributes: dict
+        :return: The normalized values to write. Fields the model's `update` ignores (empty values) are left out.
+        :rtype: dict
+        :raises DataError: If a value is invalid for the model.
+        """
+        try:
+            blank.update(**{field: fields.get(field) for field in attributes})
+        except ValueError as e:
+            raise DataError(e)
+        return {field: getattr(blank, attribute) for field, attribute in attributes.items() if fields.get(field)}
+
+    @staticmethod
+    def _update_cached(obj, fields: dict):
+        """
+        Applies an already validated and persisted update to a cached object.
+
+        :param obj: The cached `Student`, `Instructor`, or `Course`, or None if not cached.
+        :param fields: The fields that were written to the database, as returned by `_validated_edit`.
+        :type fields: dict
+        """
+        if obj is not None:
+            obj.update(**fields)
+
+    @staticmethod
+    def _fetch(query, *args):
+        """
+        Runs a `DatabaseManager` query, reporting database errors as DataError.
+
+        :param query: The `DatabaseManager` method to call.
+        :param args: The arguments of the query.
+        :return: The result of the query.
+        :raises DataError: If an underlying database error occurs.
+        """
+        try:
+            return query(*args)
+        except sqlite3.Error as e:
+            raise DataError(e)
+
+    @staticmethod
+    def _student(row: tuple) -> Student:
+        """
+        Resolves a student row to its cached object, building the object on first sight.
+
+        :param row: A student record, as (name, age, email, student_id).
+        :type row: tuple
+        :return: The Student, whose courses are loaded when first used.
+        :rtype: Student
+        """
+        with DatabaseDataManager._lock:
+            students_map = DatabaseDataManager._cache["students_map"]
+            student = students_map.get(row[3])
+            if student is None:
+                student = students_map[row[3]] = Student.from_trusted(*row)
+                student.registered_courses = LazyRelation(
+                    "course_id", lambda: [DatabaseDataManager._course_from_row(r) for r in
+                                          DatabaseDataManager._fetch(dbm.get_courses_for_student, row[3])],
+                    DatabaseDataManager._lock)
+            return student
+
+    @staticmethod
+    def _instructor(row: tuple) -> Instructor:
+        """
+        Resolves an instructor row to its cached object, building the object on first sight.
+
+        :param row: An instructor record, as (name, age, email, instructor_id).
+        :type row: tuple
+        :return: The Instructor, whose courses are loaded when first used.
+        :rtype: Instructor
+        """
+        with DatabaseDataManager._lock:
+            instructors_map = DatabaseDataManager._cache["instructors_map"]
+            instructor = instructors_map.get(row[3])
+            if instructor is None:
+                instructor = instructors_map[row[3]] = Instructor.from_trusted(*row)
+                instructor.assigned_courses = LazyRelation(
+                    "course_id", lambda: [DatabaseDataManager._course(course_id, course_name, instructor)
+                                          for course_id, course_name in
+                                          DatabaseDataManager._fetch(dbm.get_instructor_courses, row[3])],
+                    DatabaseDataManager._lock)
+            return instructor
+
+    @staticmethod
+    def _course(course_id: str, course_name: str, instructor: Instructor) -> Course:
+        """
+        Resolves a course to its cached object, building the object on first sight.
+
+        :param course_id: The ID of the course.
+        :type course_id: str
+        :param course_name: The name of the course.
+        :type course_name: str
+        :param instructor: The cached `Instructor` of the course.
+        :type instructor: Instructor
+        :return: The Course, whose students are loaded when first used.
+        :rtype: Course
+        """
+        with DatabaseDataManager._lock:
+            courses_map = DatabaseDataManager._cache["courses_map"]
+            course = courses_map.get(course_id)
+            if course is None:
+                # the instructor's courses come from their own query, so do not load them here
+                course = courses_map[course_id] = Course.from_trusted(course_id, course_name, instructor, assign=False)
+                course.enrolled_students = LazyRelation(
+                    "student_id", lambda: [DatabaseDataManager._student(r) for r in
+                                           DatabaseDataManager._fetch(dbm.get_students_for_course, course_id)],
+                    DatabaseDataManager._lock)
+            return course
+
+    @staticmethod
+    def _course_from_row(row: tuple) -> Course:
+        """
+        Resolves a course row joined with its instructor to the cached course.
+
+        :param row: A course record, as (course_id, course_name, instructor_id, name, age, email).
+        :type row: tuple
+        :return: The Course.
+        :rtype: Course
+        """
+        instructor = DatabaseDataManager._instructor((row[3], row[4], row[5], row[2]))
+        return DatabaseDataManager._course(row[0], row[1], instructor)
+
+    @staticmethod
+    def _find(kind: str, query, record_id: str, build):
+        """
+        Gets a cached object by ID, loading only its row if it is not cached yet.
+
+        :param kind: The key of the object's map in `_cache`.
+        :type kind: str
+        :param query: The `DatabaseManager` method fetching the object's row.
+        :param record_id: The ID of the object.
+        :type record_id: str
+        :param build: Resolves the row to its cached object.
+        :return: The object, or None if there is no such record.
+        :raises DataError: If an underlying database error occurs.
+        """
+        with DatabaseDataManager._lock:
+            obj = DatabaseDataManager._cache[kind].get(record_id)
+            if obj is not None or kind in DatabaseDataManager._complete:
+                return obj
+            row = DatabaseDataManager._fetch(query, record_id)
+            return build(row) if row else None
+
+    @staticmethod
+    def _load_all(kind: str, query, build) -> list:
+        """
+        Gets every object of a kind, loading the whole table the first time.
+
+        The map is then rebuilt in table order and marked complete, so later
+        calls and lookups of missing IDs are answered from memory.
+
+        :param kind: The key of the map in `_cache`.
+        :type kind: str
+        :param query: The `DatabaseManager` method fetching every row.
+        :param build: Resolves a row to its cached object.
+        :return: All objects of the kind.
+        :rtype: list
+        :raises DataError: If an underlying database error occurs.
+        """
+        with DatabaseDataManager._lock:
+            if kind not in DatabaseDataManager._complete:
+                objects = [build(row) for row in DatabaseDataManager._fetch(query)]
+                key = _ID_ATTRIBUTES[kind]
+                DatabaseDataManager._cache[kind] = {getattr(obj, key): obj for obj in objects}
+                DatabaseDataManager._complete.add(kind)
+            return list(DatabaseDataManager._cache[kind].values())
 
     @staticmethod
     def _get_hydrated_data():
         """
         Fetches all data from the database and "hydrates" it into a network of objects.
 
-        If the cache is empty, this method reads all tables from the database,
-        reconstructs the `Student`, `Instructor`, and `Course` objects, and links
-        them together (i.e., enrollments). The resulting object graph and lookup
-        maps are stored in the class cache for fast retrieval.
+        Every record is resolved to its cached object (building the ones not
+        loaded yet), and every relation is replaced with a fully loaded one, so
+        the object graph can be traversed without further queries. The cache
+        then stays hydrated until it is cleared, since the write methods keep
+        loaded relations up to date. Only the JSON export needs the whole graph.
 
-        :return: A dictionary containing lists and lookup maps of all data objects.
+        :return: A dictionary containing the lookup maps of all data objects.
         :rtype: dict
         :raises DataError: If an underlying database error occurs.
         """
-        if DatabaseDataManager._cache:
+        if DatabaseDataManager._hydrated:
             return DatabaseDataManager._cache
+        with DatabaseDataManager._lock:
+            # another thread may have hydrated the cache while this one waited for the lock
+            if DatabaseDataManager._hydrated:
+                return DatabaseDataManager._cache
+            return DatabaseDataManager._hydrate()
 
+    @staticmethod
+    def _hydrate() -> dict:
+        """
+        Reads all tables and builds the complete cache. The caller must hold `_lock`.
+
+        The tables are streamed in one pass from a single snapshot, and the
+        objects are resolved and linked as their rows arrive; only each course's
+        students are attached at the end. A student's courses and a course's
+        students are linked in ID order. Objects already in the cache are reused,
+        with their relations reset before being linked again.
+
+        :return: A dictionary containing the lookup maps of all data objects.
+        :rtype: dict
+        :raises DataError: If an underlying database error occurs.
+        """
+        cached = DatabaseDataManager._cache
+        old_students, old_instructors, old_courses = (cached["students_map"], cached["instructors_map"],
+                                                      cached["courses_map"])
+        students_map, instructors_map, courses_map = {}, {}, {}
+        # each course's students are collected while the students are linked, then handed over whole
+        course_students = defaultdict(dict)
+        loads = json.loads
+        # every object built here stays reachable, so collection passes triggered by the
+        # allocations would only traverse the growing graph without freeing anything
+        gc_enabled = gc.isenabled()
+        gc.disable()
         try:
-            all_student_tuples = dbm.get_all_students()
-            all_instructor_tuples = dbm.get_all_instructors()
-            all_course_tuples = dbm.get_all_courses()
-            all_enrollments = dbm.get_all_enrollments()
-
-            all_students = [Student(*s) for s in all_student_tuples]
-            all_instructors = [Instructor(*i) for i in all_instructor_tuples]
-
-            all_courses = []
-            instructors_map_temp = {i.instructor_id: i for i in all_instructors}
-            for row in all_course_tuples:
-                instructor = instructors_map_temp.get(row[2])
-                if instructor:
-                    course = Course(course_id=row[0], course_name=row[1], instructor=instructor)
-                    all_courses.append(course)
-
-            students_map = {s.student_id: s for s in all_students}
-            instructors_map = {i.instructor_id: i for i in all_instructors}
-            courses_map = {c.course_id: c for c in all_courses}
-
-            for student_id, course_id in all_enrollments:
-                student = students_map.get(student_id)
-                course = courses_map.get(course_id)
-                if student and course:
-                    student.registered_courses.append(course)
-                    course.enrolled_students.append(student)
-
-            hydrated_data = {"students": all_students, "instructors": all_instructors, "courses": all_courses,
-                             "students_map": students_map, "instructors_map": instructors_map,
-                             "courses_map": courses_map, }
+            # rows were validated when they were written, so skip revalidating them
+            for table, rows in dbm.stream_tables():
+                if table == "enrollments":
+                    for student_id, course_ids in rows:
+                        student = students_map.get(student_id)
+                        if student is None:
+                            continue
+                        courses = {}
+                        for course_id in loads(course_ids):
+                            course = courses_map.get(course_id)
+                            if course is not None:
+                                courses[course_id] = course
+                                course_students[course_id][student_id] = student
+                        student.registered_courses = RelationSet.from_mapping("course_id", courses)
+                elif table == "students":
+                    for row in rows:
+                        student = old_students.get(row[3])
+                        if student is None:
+                            student = Student.from_trusted(*row)
+                        else:
+                            student.registered_courses = RelationSet("course_id")
+                        students_map[row[3]] = student
+                elif table == "instructors":
+                    for row in rows:
+                        instructor = old_instructors.get(row[3])
+                        if instructor is None:
+                            instructor = Instructor.from_trusted(*row)
+                        else:
+                            instructor.assigned_courses = RelationSet("course_id")
+                        instructors_map[row[3]] = instructor
+                else:
+                    for course_id, course_name, instructor_id in rows:
+                        instructor = instructors_map.get(instructor_id)
+                        if not instructor:
+                            continue
+                        course = old_courses.get(course_id)
+                        if course is None:
+                            course = Course.from_trusted(course_id, course_name, instructor)
+                        else:
+                            course.enrolled_students = RelationSet("student_id")
+                            course.instructor = instructor
+                            instructor.assign_course(course)
+                        courses_map[course_id] = course
+
+            for course_id, students in course_students.items():
+                courses_map[course_id].enrolled_students = RelationSet.from_mapping("student_id", students)
+
+            hydrated_data = {"students_map": students_map, "instructors_map": instructors_map,
+                             "courses_map": courses_map}
             DatabaseDataManager._cache = hydrated_data
+            DatabaseDataManager._complete = set(hydrated_data)
+            DatabaseDataManager._hydrated = True
             return hydrated_data
         except sqlite3.Error as e:
             raise DataError(e)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    @staticmethod
+    def _resolve(rows: list[tuple], build) -> list:
+        """
+        Resolves the rows of a query to their cached objects.
+
+        :param rows: The rows, e.g., one page or the matches of a search.
+        :type rows: list[tuple]
+        :param build: Resolves a row to its cached object.
+        :return: The objects, in the order of the rows.
+        :rtype: list
+        """
+        with DatabaseDataManager._lock:
+            return [build(row) for row in rows]
 
     @staticmethod
     def get_students() -> list[Student]:
         """
         Retrieves a list of all student objects from the database.
 
+        The table is read the first time only; the students' courses are loaded when first used.
+
         :return: A list of all students.
         :rtype: list[Student]
+        :raises DataError: If an underlying database error occurs.
         """
-        DatabaseDataManager._clear_cache()
-        data = DatabaseDataManager._get_hydrated_data()
-        return data["students"]
+        return DatabaseDataManager._load_all("students_map", dbm.get_all_students, DatabaseDataManager._student)
+
+    @staticmethod
+    def iter_students(after_id: str = None, limit: int = PAGE_SIZE) -> list[Student]:
+        """
+        Retrieves one page of students, ordered by ID.
+
+        The page is selected in the database using the primary key index; the
+        rows are then resolved to their cached objects.
+
+        :param after_id: Only students with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of students to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` students, ordered by ID.
+        :rtype: list[Student]
+        :raises DataError: If an underlying database error occurs.
+        """
+        rows = DatabaseDataManager._fetch(dbm.get_students_page, after_id, limit)
+        return DatabaseDataManager._resolve(rows, DatabaseDataManager._student)
+
+    @staticmethod
+    def search_students(query: str) -> list[Student]:
+        """
+        Finds the students whose name, ID, or email contains the query, ignoring case.
+
+        The search runs in the database against a full-text index; the matching
+        rows are then resolved to their cached objects.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching students.
+        :rtype: list[Student]
+        :raises DataError: If an underlying database error occurs.
+        """
+        rows = DatabaseDataManager._fetch(dbm.search_students, query)
+        return DatabaseDataManager._resolve(rows, DatabaseDataManager._student)
 
     @staticmethod
     def get_student(student_id: str) -> Student:
         """
         Retrieves a single student object from the database.
 
+        Only the student's row is read; their courses are loaded when first used.
+
         :param student_id: The ID of the student to retrieve.
         :type student_id: str
         :return: The corresponding Student object.
         :rtype: Student
-        :raises DataError: If the student is not found.
+        :raises DataError: If the student is not found or a DB error occurs.
         """
-        DatabaseDataManager._clear_cache()
-        data = DatabaseDataManager._get_hydrated_data()
-        student = data["students_map"].get(student_id)
+        student = DatabaseDataManager._find("students_map", dbm.get_student, student_id,
+                                            DatabaseDataManager._student)
         if not student:
             raise DataError(f"Student with ID '{student_id}' not found.")
         return student
@@ -137,27 +478,67 @@ class DatabaseDataManager(BaseDataManager):
         """
         Retrieves a list of all instructor objects from the database.
 
+        The table is read the first time only; the instructors' courses are loaded when first used.
+
         :return: A list of all instructors.
         :rtype: list[Instructor]
+        :raises DataError: If an underlying database error occurs.
         """
-        DatabaseDataManager._clear_cache()
-        data = DatabaseDataManager._get_hydrated_data()
-        return data["instructors"]
+        return DatabaseDataManager._load_all("instructors_map", dbm.get_all_instructors,
+                                             DatabaseDataManager._instructor)
+
+    @staticmethod
+    def iter_instructors(after_id: str = None, limit: int = PAGE_SIZE) -> list[Instructor]:
+        """
+        Retrieves one page of instructors, ordered by ID.
+
+        The page is selected in the database using the primary key index; the
+        rows are then resolved to their cached objects.
+
+        :param after_id: Only instructors with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of instructors to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` instructors, ordered by ID.
+        :rtype: list[Instructor]
+        :raises DataError: If an underlying database error occurs.
+        """
+        rows = DatabaseDataManager._fetch(dbm.get_instructors_page, after_id, limit)
+        return DatabaseDataManager._resolve(rows, DatabaseDataManager._instructor)
+
+    @staticmethod
+    def search_instructors(query: str) -> list[Instructor]:
+        """
+        Finds the instructors whose name, ID, or email contains the query, ignoring case.
+
+        The search runs in the database against a full-text index; the matching
+        rows are then resolved to their cached objects.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching instructors.
+        :rtype: list[Instructor]
+        :raises DataError: If an underlying database error occurs.
+        """
+        rows = DatabaseDataManager._fetch(dbm.search_instructors, query)
+        return DatabaseDataManager._resolve(rows, DatabaseDataManager._instructor)
 
     @staticmethod
     def get_instructor(instructor_id: str) -> Instructor:
         """
         Retrieves a single instructor object from the database.
 
+        Only the instructor's row is read; their courses are loaded when first used.
+
         :param instructor_id: The ID of the instructor to retrieve.
         :type instructor_id: str
         :return: The corresponding Instructor object.
         :rtype: Instructor
-        :raises DataError: If the instructor is not found.
+        :raises DataError: If the instructor is not found or a DB error occurs.
         """
-        DatabaseDataManager._clear_cache()
-        data = DatabaseDataManager._get_hydrated_data()
-        instructor = data["instructors_map"].get(instructor_id)
+        instructor = DatabaseDataManager._find("instructors_map", dbm.get_instructor, instructor_id,
+                                               DatabaseDataManager._instructor)
         if not instructor:
             raise DataError(f"Instructor with ID '{instructor_id}' not found.")
         return instructor
@@ -167,27 +548,66 @@ class DatabaseDataManager(BaseDataManager):
         """
         Retrieves a list of all course objects from the database.
 
+        The table is read the first time only; the courses' students are loaded when first used.
+
         :return: A list of all courses.
         :rtype: list[Course]
+        :raises DataError: If an underlying database error occurs.
         """
-        DatabaseDataManager._clear_cache()
-        data = DatabaseDataManager._get_hydrated_data()
-        return data["courses"]
+        return DatabaseDataManager._load_all("courses_map", dbm.get_all_courses, DatabaseDataManager._course_from_row)
+
+    @staticmethod
+    def iter_courses(after_id: str = None, limit: int = PAGE_SIZE) -> list[Course]:
+        """
+        Retrieves one page of courses, ordered by ID.
+
+        The page is selected in the database using the primary key index; the
+        rows are then resolved to their cached objects.
+
+        :param after_id: Only courses with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of courses to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` courses, ordered by ID.
+        :rtype: list[Course]
+        :raises DataError: If an underlying database error occurs.
+        """
+        rows = DatabaseDataManager._fetch(dbm.get_courses_page, after_id, limit)
+        return DatabaseDataManager._resolve(rows, DatabaseDataManager._course_from_row)
+
+    @staticmethod
+    def search_courses(query: str) -> list[Course]:
+        """
+        Finds the courses whose name or ID contains the query, ignoring case.
+
+        The search runs in the database against a full-text index; the matching
+        rows are then resolved to their cached objects.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching courses.
+        :rtype: list[Course]
+        :raises DataError: If an underlying database error occurs.
+        """
+        rows = DatabaseDataManager._fetch(dbm.search_courses, query)
+        return DatabaseDataManager._resolve(rows, DatabaseDataManager._course_from_row)
 
     @staticmethod
     def get_course(course_id: str) -> Course:
         """
         Retrieves a single course object from the database.
 
+        Only the course's row (and its instructor's) is read; its students are loaded when first used.
+
         :param course_id: The ID of the course to retrieve.
         :type course_id: str
         :return: The corresponding Course object.
         :rtype: Course
-        :raises DataError: If the course is not found.
+        :raises DataError: If the course is not found or a DB error occurs.
         """
-        DatabaseDataManager._clear_cache()
-        data = DatabaseDataManager._get_hydrated_data()
-        course = data["courses_map"].get(course_id)
+        course = DatabaseDataManager._find("courses_map", dbm.get_course, course_id,
+                                           DatabaseDataManager._course_from_row)
         if not course:
             raise DataError(f"Course with ID '{course_id}' not found.")
         return course
@@ -200,16 +620,18 @@ class DatabaseDataManager(BaseDataManager):
         :param kwargs: Keyword arguments representing student attributes.
         :raises DataError: If student data is invalid, the student already exists, or a DB error occurs.
         """
-        try:
-            s = Student(**kwargs)
-        except ValueError as e:
-            raise DataError(e)
-        try:
-            if dbm.get_student(s.student_id):
+        with DatabaseDataManager._lock:
+            try:
+                s = Student(**kwargs)
+            except ValueError as e:
+                raise DataError(e)
+            try:
+                added = dbm.add_student(student_id=s.student_id, name=s.name, age=s.age, email=s._email)
+            except sqlite3.Error as e:
+                raise DataError(e)
+            if not added:
                 raise DataError(f"Student with ID '{s.student_id}' already exists.")
-            dbm.add_student(**kwargs)
-        except sqlite3.Error as e:
-            raise DataError(e)
+            DatabaseDataManager._cache["students_map"][s.student_id] = s
 
     @staticmethod
     def edit_student(**kwargs) -> None:
@@ -221,15 +643,20 @@ class DatabaseDataManager(BaseDataManager):
         :param kwargs: Keyword arguments with fields to update.
         :raises DataError: If the student ID is missing, the student is not found, or a DB error occurs.
         """
-        student_id = kwargs.get('student_id')
-        if not student_id:
-            raise DataError("Student ID is required.")
-        try:
-            if not dbm.get_student(student_id):
+        with DatabaseDataManager._lock:
+            student_id = kwargs.get('student_id')
+            if not student_id:
+                raise DataError("Student ID is required.")
+            fields = DatabaseDataManager._validated_edit(Student.from_trusted("", 0, "", student_id), kwargs,
+                                                         _PERSON_FIELDS)
+            try:
+                # nothing was updated if the student is missing, or if no field was given
+                found = dbm.update_student(student_id, **fields) or dbm.get_student(student_id)
+            except sqlite3.Error as e:
+                raise DataError(e)
+            if not found:
                 raise DataError(f"Student with ID '{student_id}' not found.")
-            dbm.update_student(**kwargs)
-        except sqlite3.Error as e:
-            raise DataError(e)
+            DatabaseDataManager._update_cached(DatabaseDataManager._cache["students_map"].get(student_id), fields)
 
     @staticmethod
     def remove_student(student_id: str) -> None:
@@ -240,12 +667,19 @@ class DatabaseDataManager(BaseDataManager):
         :type student_id: str
         :raises DataError: If the student is not found or a DB error occurs.
         """
-        try:
-            if not dbm.get_student(student_id):
+        with DatabaseDataManager._lock:
+            try:
+                deleted = dbm.delete_student(student_id)
+            except sqlite3.Error as e:
+                raise DataError(e)
+            if not deleted:
                 raise DataError(f"Student with ID '{student_id}' does not exist.")
-            dbm.delete_student(student_id)
-        except sqlite3.Error as e:
-            raise DataError(e)
+            cache = DatabaseDataManager._cache
+            cache["students_map"].pop(student_id, None)
+            # enrollments are removed by the ON DELETE CASCADE; relations not loaded yet will not see them
+            for c in cache["courses_map"].values():
+                if c.enrolled_students.loaded:
+                    c.enrolled_students.discard(student_id)
 
     @staticmethod
     def add_instructor(**kwargs) -> None:
@@ -255,16 +689,18 @@ class DatabaseDataManager(BaseDataManager):
         :param kwargs: Keyword arguments representing instructor attributes.
         :raises DataError: If instructor data is invalid, the instructor already exists, or a DB error occurs.
         """
-        try:
-            i = Instructor(**kwargs)
-        except ValueError as e:
-            raise DataError(e)
-        try:
-            if dbm.get_instructor(i.instructor_id):
+        with DatabaseDataManager._lock:
+            try:
+                i = Instructor(**kwargs)
+            except ValueError as e:
+                raise DataError(e)
+            try:
+                added = dbm.add_instructor(instructor_id=i.instructor_id, name=i.name, age=i.age, email=i._email)
+            except sqlite3.Error as e:
+                raise DataError(e)
+            if not added:
                 raise DataError(f"Instructor with ID '{i.instructor_id}' already exists.")
-            dbm.add_instructor(**kwargs)
-        except sqlite3.Error as e:
-            raise DataError(e)
+            DatabaseDataManager._cache["instructors_map"][i.instructor_id] = i
 
     @staticmethod
     def edit_instructor(**kwargs) -> None:
@@ -276,15 +712,21 @@ class DatabaseDataManager(BaseDataManager):
         :param kwargs: Keyword arguments with fields to update.
         :raises DataError: If the instructor ID is missing, the instructor is not found, or a DB error occurs.
         """
-        instructor_id = kwargs.get('instructor_id')
-        if not instructor_id:
-            raise DataError("Instructor ID is required.")
-        try:
-            if not dbm.get_instructor(instructor_id):
+        with DatabaseDataManager._lock:
+            instructor_id = kwargs.get('instructor_id')
+            if not instructor_id:
+                raise DataError("Instructor ID is required.")
+            fields = DatabaseDataManager._validated_edit(Instructor.from_trusted("", 0, "", instructor_id), kwargs,
+                                                         _PERSON_FIELDS)
+            try:
+                # nothing was updated if the instructor is missing, or if no field was given
+                found = dbm.update_instructor(instructor_id, **fields) or dbm.get_instructor(instructor_id)
+            except sqlite3.Error as e:
+                raise DataError(e)
+            if not found:
                 raise DataError(f"Instructor with ID '{instructor_id}' not found.")
-            dbm.update_instructor(**kwargs)
-        except sqlite3.Error as e:
-            raise DataError(e)
+            DatabaseDataManager._update_cached(DatabaseDataManager._cache["instructors_map"].get(instructor_id),
+                                               fields)
 
     @staticmethod
     def remove_instructor(instructor_id: str) -> None:
@@ -293,14 +735,18 @@ class DatabaseDataManager(BaseDataManager):
 
         :param instructor_id: The ID of the instructor to remove.
         :type instructor_id: str
-        :raises DataError: If the instructor is not found or a DB error occurs.
+        :raises DataError: If the instructor is not found, still has assigned courses, or a DB error occurs.
         """
-        try:
-            if not dbm.get_instructor(instructor_id):
+        with DatabaseDataManager._lock:
+            try:
+                deleted = dbm.delete_instructor(instructor_id)
+            except sqlite3.IntegrityError:
+                raise DataError(f"Instructor with ID '{instructor_id}' still has assigned courses.")
+            except sqlite3.Error as e:
+                raise DataError(e)
+            if not deleted:
                 raise DataError(f"Instructor with ID '{instructor_id}' does not exist.")
-            dbm.delete_instructor(instructor_id)
-        except sqlite3.Error as e:
-            raise DataError(e)
+            DatabaseDataManager._cache["instructors_map"].pop(instructor_id, None)
 
     @staticmethod
     def add_course(**kwargs) -> None:
@@ -310,16 +756,32 @@ class DatabaseDataManager(BaseDataManager):
         :param kwargs: Keyword arguments representing course attributes.
         :raises DataError: If course data is invalid, the course already exists, or a DB error occurs.
         """
-        try:
-            c = Course(**kwargs)
-        except ValueError as e:
-            raise DataError(e)
-        try:
-            if dbm.get_course(c.course_id):
+        with DatabaseDataManager._lock:
+            cache = DatabaseDataManager._cache
+            if kwargs.get('instructor'):
+                # link the new course to the cached instructor instance, not a stale copy
+                instructor = kwargs['instructor']
+                kwargs['instructor'] = cache["instructors_map"].get(instructor.instructor_id, instructor)
+            try:
+                c = Course(**kwargs)
+            except ValueError as e:
+                raise DataError(e)
+            added = False
+            try:
+                added = dbm.add_course(course_id=c.course_id, course_name=c.course_name,
+                                       instructor_id=c.instructor.instructor_id)
+            except sqlite3.IntegrityError:
+                # the only constraint left to fail is the instructor's foreign key
+                raise DataError(f"Instructor with ID '{c.instructor.instructor_id}' not found.")
+            except sqlite3.Error as e:
+                raise DataError(e)
+            finally:
+                if not added and c in c.instructor.assigned_courses:
+                    # the Course constructor already assigned itself to the instructor
+                    c.instructor.assigned_courses.remove(c)
+            if not added:
                 raise DataError(f"Course with ID '{c.course_id}' already exists.")
-            dbm.add_course(course_id=c.course_id, course_name=c.course_name, instructor_id=c.instructor.instructor_id)
-        except sqlite3.Error as e:
-            raise DataError(e)
+            cache["courses_map"][c.course_id] = c
 
     @staticmethod
     def edit_course(**kwargs) -> None:
@@ -331,17 +793,28 @@ class DatabaseDataManager(BaseDataManager):
         :param kwargs: Keyword arguments with fields to update.
         :raises DataError: If the course ID is missing, the course is not found, or a DB error occurs.
         """
-        course_id = kwargs.get('course_id')
-        if not course_id:
-            raise DataError("Course ID is required.")
-        try:
-            if not dbm.get_course(course_id):
+        with DatabaseDataManager._lock:
+            course_id = kwargs.get('course_id')
+            if not course_id:
+                raise DataError("Course ID is required.")
+            fields = DatabaseDataManager._validated_edit(Course.from_trusted(course_id, "", None, assign=False),
+                                                         kwargs, _COURSE_FIELDS)
+            instructor = kwargs.get('instructor')
+            if instructor:
+                fields["instructor_id"] = instructor.instructor_id
+            try:
+                # nothing was updated if the course is missing, or if no field was given
+                found = dbm.update_course(course_id, **fields) or dbm.get_course(course_id)
+            except sqlite3.IntegrityError:
+                raise DataError(f"Instructor with ID '{fields['instructor_id']}' not found.")
+            except sqlite3.Error as e:
+                raise DataError(e)
+            if not found:
                 raise DataError(f"Course with ID '{course_id}' not found.")
-            if kwargs.get('instructor'):
-                kwargs["instructor_id"] = kwargs.pop('instructor').instructor_id
-            dbm.update_course(**kwargs)
-        except sqlite3.Error as e:
-            raise DataError(e)
+            course = DatabaseDataManager._cache["courses_map"].get(course_id)
+            if course is not None and instructor:
+                fields["instructor"] = DatabaseDataManager.get_instructor(fields.pop("instructor_id"))
+            DatabaseDataManager._update_cached(course, fields)
 
     @staticmethod
     def remove_course(course_id: str) -> None:
@@ -352,12 +825,21 @@ class DatabaseDataManager(BaseDataManager):
         :type course_id: str
         :raises DataError: If the course is not found or a DB error occurs.
         """
-        try:
-            if not dbm.get_course(course_id):
+        with DatabaseDataManager._lock:
+            try:
+                deleted = dbm.delete_course(course_id)
+            except sqlite3.Error as e:
+                raise DataError(e)
+            if not deleted:
                 raise DataError(f"Course with ID '{course_id}' does not exist.")
-            dbm.delete_course(course_id)
-        except sqlite3.Error as e:
-            raise DataError(e)
+            cache = DatabaseDataManager._cache
+            c = cache["courses_map"].pop(course_id, None)
+            if c and c.instructor.assigned_courses.loaded:
+                c.instructor.assigned_courses.discard(c)
+            # relations not loaded yet will not see the course
+            for s in cache["students_map"].values():
+                if s.registered_courses.loaded:
+                    s.registered_courses.discard(course_id)
 
     @staticmethod
     def enroll_student(student_id: str, course_id: str) -> None:
@@ -370,14 +852,117 @@ class DatabaseDataManager(BaseDataManager):
         :type course_id: str
         :raises DataError: If student or course is not found, or a DB error occurs.
         """
-        try:
-            if not dbm.get_student(student_id):
-                raise DataError(f"Student with ID '{student_id}' not found.")
-            if not dbm.get_course(course_id):
+        with DatabaseDataManager._lock:
+            try:
+                enrolled = dbm.enroll_student(student_id, course_id)
+            except sqlite3.IntegrityError:
+                # a foreign key failed; find out which one, to report it
+                missing = DatabaseDataManager._fetch(dbm.get_student, student_id) is None
+                if missing:
+                    raise DataError(f"Student with ID '{student_id}' not found.")
                 raise DataError(f"Course with ID '{course_id}' not found.")
-            dbm.enroll_student(student_id, course_id)
-        except sqlite3.Error as e:
-            raise DataError(e)
+            except sqlite3.Error as e:
+                raise DataError(e)
+            if not enrolled:
+                raise DataError(f"Student with ID '{student_id}' is already enrolled in course '{course_id}'.")
+            cache = DatabaseDataManager._cache
+            s = cache["students_map"].get(student_id)
+            c = cache["courses_map"].get(course_id)
+            # only relations already loaded need the new link; the others will read it from the database
+            if s and s.registered_courses.loaded:
+                s.registered_courses.add(c or DatabaseDataManager.get_course(course_id))
+            if c and c.enrolled_students.loaded:
+                c.enrolled_students.add(s or DatabaseDataManager.get_student(student_id))
+
+    @staticmethod
+    def enroll_many(pairs) -> int:
+        """
+        Enrolls students in courses in bulk, all or nothing.
+
+        All the IDs are checked with one query, the enrollments are inserted
+        with one `executemany` call, and both run in a single transaction.
+        The loaded relations of cached objects are then patched in one pass.
+        Pairs that are already enrolled (or repeated) are skipped.
+
+        :param pairs: The (student_id, course_id) pairs to enroll.
+        :type pairs: Iterable[tuple[str, str]]
+        :return: The number of new enrollments.
+        :rtype: int
+        :raises DataError: If any student or course is not found (nothing is enrolled then), or a DB error occurs.
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return 0
+        student_ids = list(dict.fromkeys(student_id for student_id, _ in pairs))
+        course_ids = list(dict.fromkeys(course_id for _, course_id in pairs))
+        with DatabaseDataManager._lock:
+            try:
+                # validated inside the transaction, so no record can be deleted before the insert
+                with dbm.transaction():
+                    missing_students, missing_courses = dbm.get_missing_ids(student_ids, course_ids)
+                    if missing_students:
+                        raise DataError.not_found("Student", missing_students)
+                    if missing_courses:
+                        raise DataError.not_found("Course", missing_courses)
+                    added = dbm.enroll_many(pairs)
+            except sqlite3.Error as e:
+                raise DataError(e)
+
+            cache = DatabaseDataManager._cache
+            students_map, courses_map = cache["students_map"], cache["courses_map"]
+            # only relations already loaded need the new links; adding an existing link does nothing
+            for student_id, course_id in pairs:
+                s = students_map.get(student_id)
+                c = courses_map.get(course_id)
+                if s and s.registered_courses.loaded:
+                    s.registered_courses.add(c or DatabaseDataManager.get_course(course_id))
+                if c and c.enrolled_students.loaded:
+                    c.enrolled_students.add(s or DatabaseDataManager.get_student(student_id))
+            return added
+
+    @staticmethod
+    def enroll_students(course_id: str, student_ids) -> int:
+        """
+        Enrolls several students in one course, all or nothing.
+
+        See `enroll_many`.
+
+        :param course_id: The ID of the course to enroll in.
+        :type course_id: str
+        :param student_ids: The IDs of the students to enroll.
+        :type student_ids: Iterable[str]
+        :return: The number of new enrollments.
+        :rtype: int
+        :raises DataError: If the course or any student is not found (nothing is enrolled then), or a DB error occurs.
+        """
+        return DatabaseDataManager.enroll_many((student_id, course_id) for student_id in student_ids)
+
+    @staticmethod
+    @contextmanager
+    def transaction():
+        """
+        Groups the writes made in a `with` block into one atomic database transaction.
+
+        The writes are committed together, with a single commit, when the block
+        exits. If the block raises, they are all rolled back, and since the
+        cache has already applied them, it is dropped and reloaded on demand.
+        Other threads wait for the block to finish before touching the cache or
+        writing. Transactions may be nested; an inner one that fails only rolls
+        back its own writes.
+
+        :return: A context manager delimiting the transaction.
+        :raises DataError: If the transaction cannot be started or committed.
+        """
+        with DatabaseDataManager._lock:
+            try:
+                with dbm.transaction():
+                    yield
+            except sqlite3.Error as e:
+                DatabaseDataManager._clear_cache()
+                raise DataError(e)
+            except BaseException:
+                DatabaseDataManager._clear_cache()
+                raise
 
     @staticmethod
     def data_to_json(filepath: str) -> None:
@@ -390,93 +975,183 @@ class DatabaseDataManager(BaseDataManager):
         :type filepath: str
         """
         fm = FileManager()
-        DatabaseDataManager._clear_cache()
         data = DatabaseDataManager._get_hydrated_data()
-        fm.students = data["students_map"]
-        fm.instructors = data["instructors_map"]
-        fm.courses = data["courses_map"]
+        with DatabaseDataManager._lock:
+            fm.students = dict(data["students_map"])
+            fm.instructors = dict(data["instructors_map"])
+            fm.courses = dict(data["courses_map"])
         fm.save_to_json(filepath)
 
     @staticmethod
-    def data_from_json(filepath: str) -> None:
+    def data_from_json(filepath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
         """
-        Imports data from a JSON file into the database, overwriting existing data.
+        Imports data from a JSON file into the database, overwriting or merging into existing data.
 
-        The process involves clearing all tables, loading the JSON into temporary
-        in-memory objects, and then populating the database from these objects.
+        The JSON is first loaded into temporary in-memory objects, so a file
+        that cannot be read, or holds malformed or invalid records, is reported
+        before the database is touched. The tables are then either cleared and
+        repopulated from these objects or, when merging, updated with only the
+        rows that differ, in a single transaction, so a failure leaves the
+        existing data untouched.
 
         :param filepath: The path to the input JSON file.
         :type filepath: str
-        :raises DataError: If loading or populating fails.
+        :param merge: If True, only new and changed records are written, and each student's enrollments
+                      are replaced by those imported. Defaults to False.
+        :type merge: bool, optional
+        :param prune: If True and merging, records that were not imported are deleted. Defaults to False.
+        :type prune: bool, optional
+        :return: When merging, the number of rows inserted, updated, and deleted, under those keys;
+                 otherwise None.
+        :rtype: dict[str, int] | None
+        :raises DataError: If the file cannot be loaded, or populating fails.
         """
         try:
-            dbm.clear_all_tables()
-
-            datastore = FileManager()
-            datastore.load_from_json(filepath)
+            datastore = FileManager.from_json(filepath)
 
-            DatabaseDataManager._populate_db_from_file_manager(datastore)
-        except (FileNotFoundError, json.JSONDecodeError, sqlite3.Error) as e:
+            return DatabaseDataManager._populate_db_from_file_manager(datastore, merge, prune)
+        except (OSError, ValueError, sqlite3.Error) as e:
             raise DataError(f"Failed to load data from JSON: {e}")
+        finally:
+            # an import may change any row, so the cache is rebuilt lazily
+            with DatabaseDataManager._lock:
+                DatabaseDataManager._clear_cache()
+
+    @staticmethod
+    def data_to_snapshot(filepath: str) -> None:
+        """
+        Exports all data from the database to a binary snapshot file.
+
+        Hydrates all database records into objects and uses a FileManager to serialize them.
+
+        :param filepath: The path to the output snapshot file.
+        :type filepath: str
+        :raises DataError: If the records refer to one another inconsistently.
+        """
+        fm = FileManager()
+        data = DatabaseDataManager._get_hydrated_data()
+        with DatabaseDataManager._lock:
+            fm.students = dict(data["students_map"])
+            fm.instructors = dict(data["instructors_map"])
+            fm.courses = dict(data["courses_map"])
+        try:
+            fm.save_to_snapshot(filepath)
+        except SnapshotError as e:
+            raise DataError(f"Failed to save snapshot: {e}")
+
+    @staticmethod
+    def data_from_snapshot(filepath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
+        """
+        Imports data from a binary snapshot file into the database, overwriting or merging into existing data.
+
+        Works like `data_from_json`.
+
+        :param filepath: The path to the input snapshot file.
+        :type filepath: str
+        :param merge: If True, only new and changed records are written, and each student's enrollments
+                      are replaced by those imported. Defaults to False.
+        :type merge: bool, optional
+        :param prune: If True and merging, records that were not imported are deleted. Defaults to False.
+        :type prune: bool, optional
+        :return: When merging, the number of rows inserted, updated, and deleted, under those keys;
+                 otherwise None.
+        :rtype: dict[str, int] | None
+        :raises DataError: If loading or populating fails.
+        """
+        try:
+            datastore = FileManager.from_snapshot(filepath)
+
+            return DatabaseDataManager._populate_db_from_file_manager(datastore, merge, prune)
+        except (OSError, SnapshotError, sqlite3.Error) as e:
+            raise DataError(f"Failed to load data from snapshot: {e}")
+        finally:
+            # an import may change any row, so the cache is rebuilt lazily
+            with DatabaseDataManager._lock:
+                DatabaseDataManager._clear_cache()
 
     @staticmethod
     def data_to_csv(dirpath: str) -> None:
         """
         Exports all data from the database to a set of CSV files.
 
-        Hydrates all database records into objects and uses a FileManager to serialize them.
+        Rows are streamed from the database a batch at a time and written
+        straight to the files, without building model objects or touching the
+        cache, so memory use does not grow with the size of the database. The
+        rows are read from a single snapshot, so writes committed meanwhile are
+        not exported halfway.
 
         :param dirpath: The path to the output directory.
         :type dirpath: str
+        :raises DataError: If the database cannot be read.
         """
-        datastore = FileManager()
-        datastore.students = {s.student_id: s for s in DatabaseDataManager.get_students()}
-        datastore.instructors = {i.instructor_id: i for i in DatabaseDataManager.get_instructors()}
-        datastore.courses = {c.course_id: c for c in DatabaseDataManager.get_courses()}
-        datastore.save_to_csv(dirpath)
+        try:
+            FileManager.save_rows_to_csv(dirpath, dbm.stream_csv_rows())
+        except sqlite3.Error as e:
+            raise DataError(f"Failed to export data to CSV: {e}")
 
     @staticmethod
-    def data_from_csv(dirpath: str) -> None:
+    def data_from_csv(dirpath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
         """
-        Imports data from CSV files into the database, overwriting existing data.
+        Imports data from CSV files into the database, overwriting or merging into existing data.
 
-        The process involves clearing all tables, loading CSVs into temporary
-        in-memory objects, and then populating the database from these objects.
+        The CSVs are first loaded into temporary in-memory objects, so files
+        that cannot be read, or hold malformed or invalid records, are reported
+        before the database is touched. The tables are then either cleared and
+        repopulated from these objects or, when merging, updated with only the
+        rows that differ, in a single transaction, so a failure leaves the
+        existing data untouched.
 
         :param dirpath: The path to the input directory.
         :type dirpath: str
-        :raises DataError: If loading or populating fails.
+        :param merge: If True, only new and changed records are written, and each student's enrollments
+                      are replaced by those imported. Defaults to False.
+        :type merge: bool, optional
+        :param prune: If True and merging, records that were not imported are deleted. Defaults to False.
+        :type prune: bool, optional
+        :return: When merging, the number of rows inserted, updated, and deleted, under those keys;
+                 otherwise None.
+        :rtype: dict[str, int] | None
+        :raises DataError: If the files cannot be loaded, or populating fails.
         """
         try:
-            dbm.clear_all_tables()
-
-            datastore = FileManager()
-            datastore.load_from_csv(dirpath)
+            datastore = FileManager.from_csv(dirpath)
 
-            DatabaseDataManager._populate_db_from_file_manager(datastore)
-        except (FileNotFoundError, sqlite3.Error) as e:
+            return DatabaseDataManager._populate_db_from_file_manager(datastore, merge, prune)
+        except (OSError, ValueError, sqlite3.Error) as e:
             raise DataError(f"Failed to load data from CSV: {e}")
+        finally:
+            # an import may change any row, so the cache is rebuilt lazily
+            with DatabaseDataManager._lock:
+                DatabaseDataManager._clear_cache()
 
     @staticmethod
-    def _populate_db_from_file_manager(file_manager: FileManager):
+    def _populate_db_from_file_manager(file_manager: FileManager, merge: bool = False,
+                                       prune: bool = False) -> dict[str, int] | None:
         """
-        Helper method to populate the database from a FileManager instance.
+        Helper method to replace the database contents with a FileManager's data, or merge it in.
 
-        Iterates through the objects held by the FileManager and inserts them
-        into the corresponding database tables.
+        Without `merge`, all existing records are deleted and the objects held
+        by the FileManager are bulk inserted. With it, only the rows that
+        differ are written (see `DatabaseManager.merge`). Either way, it all
+        happens in one transaction, which is rolled back as a whole if any row
+        fails.
 
         :param file_manager: A FileManager instance preloaded with data.
         :type file_manager: FileManager
+        :param merge: Whether to merge instead of replacing. Defaults to False.
+        :type merge: bool, optional
+        :param prune: Whether a merge deletes the records the FileManager does not hold. Defaults to False.
+        :type prune: bool, optional
+        :return: When merging, the number of rows inserted, updated, and deleted; otherwise None.
+        :rtype: dict[str, int] | None
+        :raises sqlite3.Error: If a database error occurs.
         """
-        for i in file_manager.instructors.values():
-            dbm.add_instructor(instructor_id=i.instructor_id, name=i.name, age=i.age, email=i._email)
-
-        for s in file_manager.students.values():
-            dbm.add_student(student_id=s.student_id, name=s.name, age=s.age, email=s._email)
-
-        for c in file_manager.courses.values():
-            dbm.add_course(course_id=c.course_id, course_name=c.course_name, instructor_id=c.instructor.instructor_id)
-
-        for s in file_manager.students.values():
-            for c in s.registered_courses:
-                dbm.enroll_student(student_id=s.student_id, course_id=c.course_id)
+        rows = dict(
+            instructors=((i.instructor_id, i.name, i.age, i._email) for i in file_manager.instructors.values()),
+            students=((s.student_id, s.name, s.age, s._email) for s in file_manager.students.values()),
+            courses=((c.course_id, c.course_name, c.instructor.instructor_id) for c in file_manager.courses.values()),
+            enrollments=((s.student_id, c.course_id) for s in file_manager.students.values()
+                         for c in s.registered_courses))
+        if merge:
+            return dbm.merge(**rows, prune=prune)
+        dbm.bulk_load(**rows, replace=True, defer_indexes=True, fast=True)
@@ -2,19 +2,30 @@
 Handles data serialization and deserialization to/from file formats.
 
 This module provides the FileManager class, which is responsible for saving the
-application's in-memory data (students, instructors, courses) to JSON or CSV
-files, and loading data from those files back into memory.
+application's in-memory data (students, instructors, courses) to JSON, CSV, or
+binary snapshot files, and loading data from those files back into memory.
 """
+from __future__ import annotations
+
 import csv
 import json
 import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from operator import itemgetter
 
+from .snapshot import SnapshotError, read_snapshot, write_snapshot
 from ...models.course import Course
 from ...models.instructor import Instructor
 from ...models.student import Student
 
 logger = logging.getLogger(__name__)
 
+CSV_TABLES = ("instructors", "students", "courses", "enrollments")
+"""The tables saved to CSV, each to a file named after it, in the order they are loaded."""
+
 
 class FileManager:
     """
@@ -46,33 +57,58 @@ class FileManager:
         """
         Serializes the current data state to a single JSON file.
 
+        Entities are encoded and written one at a time instead of building the
+        whole document in memory first, so memory use does not grow with the
+        size of the roster. The output is identical to `json.dump(data, f, indent=4)`.
+
         :param file_path: The full path for the output JSON file.
         :type file_path: str
         """
-        data = {"students": [s.to_dict() for s in self.students.values()],
-                "instructors": [i.to_dict() for i in self.instructors.values()],
-                "courses": [c.to_dict() for c in self.courses.values()]}
+        sections = [("students", (s.to_dict() for s in self.students.values())),
+                    ("instructors", (i.to_dict() for i in self.instructors.values())),
+                    ("courses", (c.to_dict() for c in self.courses.values()))]
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+            f.write("{")
+            for n, (key, records) in enumerate(sections):
+                f.write(("," if n else "") + f"\n    {json.dumps(key)}: ")
+                self._write_json_array(f, records)
+            f.write("\n}")
         logger.info(f"Data successfully saved to {file_path}")
 
+    @staticmethod
+    def _write_json_array(f, records):
+        """
+        Streams a list of records into an open file as a JSON array nested at depth 1.
+
+        :param f: The open, writable text file.
+        :param records: An iterable of JSON-serializable records.
+        """
+        first = True
+        for record in records:
+            encoded = json.dumps(record, indent=4).replace("\n", "\n        ")
+            f.write(("[\n        " if first else ",\n        ") + encoded)
+            first = False
+        f.write("[]" if first else "\n    ]")
+
     def load_from_json(self, file_path: str):
         """
         Loads and reconstructs data from a JSON file, overwriting current data.
 
         This method clears all existing data before loading from the file. It handles
         potential file not found and JSON decoding errors internally by logging them.
+        The file is parsed incrementally, one entity at a time, rather than being
+        decoded into a single document first.
 
         :param file_path: The full path of the JSON file to load.
         :type file_path: str
+        :raises ValueError: If a record is invalid or incomplete (and no data is held then).
         """
         self.students.clear()
         self.instructors.clear()
         self.courses.clear()
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            loaded = FileManager.from_json(file_path)
         except FileNotFoundError:
             logger.error(f"Error: The file {file_path} was not found for reading.")
             return
@@ -80,31 +116,243 @@ class FileManager:
             logger.error(f"Error: The file {file_path} is not a valid JSON file.")
             return
 
-        for i_data in data["instructors"]:
-            instructor_id = i_data["instructor_id"]
-            self.instructors[instructor_id] = Instructor(i_data["name"], i_data["age"], i_data["email"], instructor_id)
+        self._replace_with(loaded)
+        logger.info(f"Data successfully loaded from {file_path}")
 
-        for s_data in data["students"]:
-            student_id = s_data["student_id"]
-            self.students[student_id] = Student(s_data["name"], s_data["age"], s_data["email"], student_id)
+    @classmethod
+    def from_json(cls, file_path: str) -> FileManager:
+        """
+        Creates a FileManager holding the data of a JSON file.
 
-        for c_data in data["courses"]:
-            course_id = c_data["course_id"]
-            instructor = self.instructors.get(c_data["instructor_id"])
-            if instructor:
-                self.courses[course_id] = Course(course_id, c_data["course_name"], instructor)
+        Unlike `load_from_json`, errors are raised rather than logged, so a
+        caller replacing or merging its data can keep it when the file cannot
+        be loaded.
 
-        # link courses to students
-        for s_data in data["students"]:
-            student = self.students[s_data["student_id"]]
-            for course_id in s_data["registered_courses"]:
-                course = self.courses.get(course_id)
-                if course:
-                    student.register_course(course)
+        :param file_path: The full path of the JSON file to load.
+        :type file_path: str
+        :return: The new FileManager.
+        :rtype: FileManager
+        :raises OSError: If the file cannot be read.
+        :raises ValueError: If the file is not valid JSON (a `json.JSONDecodeError`), or holds
+                            an invalid or incomplete record.
+        """
+        file_manager = cls()
+        kinds = {"students": "student", "instructors": "instructor", "courses": "course"}
+        with open(file_path, 'r', encoding='utf-8') as f:
+            try:
+                file_manager._load_records(((kinds[key], record) for key, record in _iter_json_sections(f)
+                                            if key in kinds))
+            except KeyError as e:
+                raise ValueError(f"The file {file_path} holds a record without the field {e}.")
+        return file_manager
+
+    def _replace_with(self, other: FileManager):
+        """
+        Replaces the data held with that of another FileManager.
+
+        :param other: The FileManager whose data is taken.
+        :type other: FileManager
+        """
+        self.instructors.clear()
+        self.courses.clear()
+        self.students.clear()
+        self.instructors.update(other.instructors)
+        self.courses.update(other.courses)
+        self.students.update(other.students)
+
+    def save_to_jsonl(self, file_path: str):
+        """
+        Serializes the current data state to a JSON Lines file, one entity per line.
+
+        Instructors are written first, then courses, then students with their
+        registrations, so the file can be loaded back in a single pass.
+
+        :param file_path: The full path for the output file.
+        :type file_path: str
+        """
+        with open(file_path, 'w', encoding='utf-8') as f:
+            for i in self.instructors.values():
+                f.write(json.dumps(i.to_dict()) + "\n")
+            for c in self.courses.values():
+                record = {"type": "course", **c.to_dict()}
+                # enrollments are stored once, on the student lines
+                del record["enrolled_students"]
+                f.write(json.dumps(record) + "\n")
+            for s in self.students.values():
+                f.write(json.dumps(s.to_dict()) + "\n")
+        logger.info(f"Data successfully saved to {file_path}")
+
+    def load_from_jsonl(self, file_path: str):
+        """
+        Loads and reconstructs data from a JSON Lines file, overwriting current data.
+
+        Each line holds one entity tagged with a "type" field. Lines are read and
+        decoded one at a time. File not found and decoding errors are handled
+        internally by logging them. The data is only replaced once the whole
+        file has loaded, so a failed load leaves no data rather than part of the file's.
+
+        :param file_path: The full path of the JSON Lines file to load.
+        :type file_path: str
+        :raises ValueError: If a record is invalid or incomplete (and no data is held then).
+        """
+        self.students.clear()
+        self.instructors.clear()
+        self.courses.clear()
+
+        try:
+            loaded = FileManager.from_jsonl(file_path)
+        except FileNotFoundError:
+            logger.error(f"Error: The file {file_path} was not found for reading.")
+            return
+        except json.JSONDecodeError:
+            logger.error(f"Error: The file {file_path} is not a valid JSON Lines file.")
+            return
+
+        self._replace_with(loaded)
+        logger.info(f"Data successfully loaded from {file_path}")
+
+    @classmethod
+    def from_jsonl(cls, file_path: str) -> FileManager:
+        """
+        Creates a FileManager holding the data of a JSON Lines file.
+
+        Unlike `load_from_jsonl`, errors are raised rather than logged.
+
+        :param file_path: The full path of the JSON Lines file to load.
+        :type file_path: str
+        :return: The new FileManager.
+        :rtype: FileManager
+        :raises OSError: If the file cannot be read.
+        :raises ValueError: If a line is not valid JSON (a `json.JSONDecodeError`), or holds
+                            an invalid or incomplete record.
+        """
+        file_manager = cls()
+        with open(file_path, 'r', encoding='utf-8') as f:
+            try:
+                file_manager._load_records(((record["type"], record)
+                                            for record in map(json.loads, filter(str.strip, f))))
+            except KeyError as e:
+                raise ValueError(f"The file {file_path} holds a record without the field {e}.")
+        return file_manager
+
+    def save_to_snapshot(self, file_path: str):
+        """
+        Serializes the current data state to a binary snapshot file.
+
+        See the `snapshot` module for the format. The snapshot is written to a
+        temporary file that then replaces `file_path`, so a failed save leaves
+        any previous snapshot in place.
+
+        :param file_path: The full path for the output snapshot file.
+        :type file_path: str
+        :raises OSError: If the file cannot be written.
+        :raises SnapshotError: If a course's instructor or a registered course is missing from the data.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write_snapshot(f, self.instructors.values(), self.courses.values(), self.students.values())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        logger.info(f"Data successfully saved to {file_path}")
+
+    def load_from_snapshot(self, file_path: str):
+        """
+        Loads and reconstructs data from a binary snapshot file, overwriting current data.
+
+        The snapshot's checksum is verified first; its records are not
+        revalidated, since snapshots are only written by the application.
+        File not found and invalid snapshot errors are handled internally by
+        logging them.
+
+        :param file_path: The full path of the snapshot file to load.
+        :type file_path: str
+        """
+        self.students.clear()
+        self.instructors.clear()
+        self.courses.clear()
 
+        try:
+            loaded = FileManager.from_snapshot(file_path)
+        except FileNotFoundError:
+            logger.error(f"Error: The file {file_path} was not found for reading.")
+            return
+        except SnapshotError as e:
+            logger.error(f"Error: The file {file_path} is not a valid snapshot: {e}")
+            return
+
+        self._replace_with(loaded)
         logger.info(f"Data successfully loaded from {file_path}")
 
-    def save_to_csv(self, directory_path: str):
+    @classmethod
+    def from_snapshot(cls, file_path: str) -> FileManager:
+        """
+        Creates a FileManager holding the data of a binary snapshot file.
+
+        Unlike `load_from_snapshot`, errors are raised rather than logged, so a
+        caller replacing its data can keep it when the file cannot be loaded.
+
+        :param file_path: The full path of the snapshot file to load.
+        :type file_path: str
+        :return: The new FileManager.
+        :rtype: FileManager
+        :raises OSError: If the file cannot be read.
+        :raises SnapshotError: If the file is not a valid snapshot.
+        """
+        file_manager = cls()
+        with open(file_path, 'rb') as f:
+            file_manager.instructors, file_manager.courses, file_manager.students = read_snapshot(f)
+        return file_manager
+
+    def _load_records(self, records):
+        """
+        Rebuilds the object graph from a stream of (kind, record) pairs.
+
+        Records may arrive in any order: courses whose instructor has not been
+        seen yet, and registrations for courses not seen yet, are resolved in a
+        final linking pass.
+
+        :param records: An iterable of (kind, record) pairs, where kind is "instructor",
+                        "student", or "course" and record is the entity's dictionary.
+        """
+        pending_courses = []
+        pending_registrations = []
+
+        for kind, data in records:
+            if kind == "instructor":
+                instructor_id = data["instructor_id"]
+                self.instructors[instructor_id] = Instructor(data["name"], data["age"], data["email"], instructor_id)
+            elif kind == "student":
+                student_id = data["student_id"]
+                student = Student(data["name"], data["age"], data["email"], student_id)
+                self.students[student_id] = student
+                for course_id in data.get("registered_courses", ()):
+                    course = self.courses.get(course_id)
+                    if course:
+                        student.register_course(course)
+                    else:
+                        pending_registrations.append((student, course_id))
+            elif kind == "course":
+                instructor = self.instructors.get(data["instructor_id"])
+                if instructor:
+                    self.courses[data["course_id"]] = Course(data["course_id"], data["course_name"], instructor)
+                else:
+                    pending_courses.append(data)
+
+        for data in pending_courses:
+            instructor = self.instructors.get(data["instructor_id"])
+            if instructor:
+                self.courses[data["course_id"]] = Course(data["course_id"], data["course_name"], instructor)
+
+        # link courses to students
+        for student, course_id in pending_registrations:
+            course = self.courses.get(course_id)
+            if course:
+                student.register_course(course)
+
+    def save_to_csv(self, directory_path: str, parallel: bool = False):
         """
         Serializes the current data state into multiple CSV files in a directory.
 
@@ -112,37 +360,53 @@ class FileManager:
 
         :param directory_path: The path to the directory where CSV files will be saved.
         :type directory_path: str
+        :param parallel: If True, the four files are written concurrently, each by its own thread. Building
+                         the rows still holds the GIL, so only the file I/O overlaps. Defaults to False.
+        :type parallel: bool, optional
         """
-        # newline parameter needed for windows
-        # open() converts \n to \r\n
-        # CSV module handles newlines automatically
-        # prevent double newline error
+        files = (("instructors", Instructor.row(), (i.to_row() for i in self.instructors.values())),
+                 ("students", Student.row(), (s.to_row() for s in self.students.values())),
+                 ("courses", Course.row(), (c.to_row() for c in self.courses.values())),
+                 # link, like a database
+                 ("enrollments", ["student_id", "course_id"],
+                  ([s.student_id, c.course_id] for s in self.students.values() for c in s.registered_courses)))
+
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(files)) as executor:
+                futures = [executor.submit(_write_csv_file, f"{directory_path}/{table}.csv", header, rows)
+                           for table, header, rows in files]
+                for future in futures:
+                    future.result()
+        else:
+            for table, header, rows in files:
+                _write_csv_file(f"{directory_path}/{table}.csv", header, rows)
 
-        with open(f"{directory_path}/instructors.csv", 'w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(Instructor.row())
-            for i in self.instructors.values():
-                writer.writerow(i.to_row())
+        logger.info(f"Data successfully saved to CSV files in {directory_path}")
 
-        with open(f"{directory_path}/students.csv", 'w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(Student.row())
-            for s in self.students.values():
-                writer.writerow(s.to_row())
+    @staticmethod
+    def save_rows_to_csv(directory_path: str, batches):
+        """
+        Writes rows streamed in batches straight to the CSV files, without building any objects.
 
-        with open(f"{directory_path}/courses.csv", 'w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(Course.row())
-            for c in self.courses.values():
-                writer.writerow(c.to_row())
+        The files and their headers are the same as those of `save_to_csv`,
+        and all four are written even if a table has no rows.
 
-        # link, like a database
-        with open(f"{directory_path}/enrollments.csv", 'w', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow(["student_id", "course_id"])
-            for s in self.students.values():
-                for c in s.registered_courses:
-                    writer.writerow([s.student_id, c.course_id])
+        :param directory_path: The path to the directory where CSV files will be saved.
+        :type directory_path: str
+        :param batches: (table name, list of rows) batches, each row in its CSV file's column order,
+                        such as those of `DatabaseManager.stream_csv_rows`.
+        :type batches: Iterable[tuple[str, list[tuple]]]
+        """
+        headers = {"instructors": Instructor.row(), "students": Student.row(), "courses": Course.row(),
+                   "enrollments": ["student_id", "course_id"]}
+        with ExitStack() as stack:
+            writers = {}
+            for table, header in headers.items():
+                file = stack.enter_context(open(f"{directory_path}/{table}.csv", 'w', newline=''))
+                writers[table] = csv.writer(file)
+                writers[table].writerow(header)
+            for table, rows in batches:
+                writers[table].writerows(rows)
 
         logger.info(f"Data successfully saved to CSV files in {directory_path}")
 
@@ -156,45 +420,193 @@ class FileManager:
 
         :param directory_path: The path to the directory containing the CSV files.
         :type directory_path: str
+        :raises ValueError: If a record is invalid (and no data is held then).
         """
         self.students.clear()
         self.instructors.clear()
         self.courses.clear()
 
         try:
-            with open(f"{directory_path}/instructors.csv", 'r') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    self.instructors[row["instructor_id"]] = Instructor(row["name"], int(row["age"]), row["email"],
-                                                                        row["instructor_id"])
-
-            with open(f"{directory_path}/students.csv", 'r') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    self.students[row["student_id"]] = Student(row["name"], int(row["age"]), row["email"],
-                                                               row["student_id"])
-
-            with open(f"{directory_path}/courses.csv", 'r') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    instructor = self.instructors.get(row["instructor_id"])
-                    if instructor:
-                        self.courses[row["course_id"]] = Course(row["course_id"], row["course_name"], instructor)
-
-            with open(f"{directory_path}/enrollments.csv", 'r') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    student = self.students.get(row["student_id"])
-                    course = self.courses.get(row["course_id"])
-                    if student and course:
-                        student.register_course(course)
+            loaded = FileManager.from_csv(directory_path)
         except FileNotFoundError:
             logger.error(f"Error: Could not find one or more required CSV files in the directory '{directory_path}'.")
-
-            self.students.clear()
-            self.instructors.clear()
-            self.courses.clear()
-
             return
 
+        self._replace_with(loaded)
         logger.info(f"Data successfully loaded from CSV files in {directory_path}")
+
+    @classmethod
+    def from_csv(cls, directory_path: str) -> FileManager:
+        """
+        Creates a FileManager holding the data of the CSV files in a directory.
+
+        Unlike `load_from_csv`, errors are raised rather than logged, so a
+        caller replacing or merging its data can keep it when the files cannot
+        be loaded. The files are read in the order of `CSV_TABLES`, so every
+        course's instructor and every enrollment's student and course are
+        built before they are referred to.
+
+        :param directory_path: The path to the directory containing the CSV files.
+        :type directory_path: str
+        :return: The new FileManager.
+        :rtype: FileManager
+        :raises OSError: If a file cannot be read.
+        :raises ValueError: If a file lacks a column, or holds a short or invalid record.
+        """
+        file_manager = cls()
+        instructors, students, courses = file_manager.instructors, file_manager.students, file_manager.courses
+
+        def read(table: str, *columns: str):
+            return _read_csv_columns(f"{directory_path}/{table}.csv", columns)
+
+        try:
+            for name, age, email, instructor_id in read("instructors", "name", "age", "email", "instructor_id"):
+                instructors[instructor_id] = Instructor(name, int(age), email, instructor_id)
+            for name, age, email, student_id in read("students", "name", "age", "email", "student_id"):
+                students[student_id] = Student(name, int(age), email, student_id)
+            for course_id, course_name, instructor_id in read("courses", "course_id", "course_name", "instructor_id"):
+                instructor = instructors.get(instructor_id)
+                if instructor:
+                    courses[course_id] = Course(course_id, course_name, instructor)
+            for student_id, course_id in read("enrollments", "student_id", "course_id"):
+                student = students.get(student_id)
+                course = courses.get(course_id)
+                if student and course:
+                    student.register_course(course)
+        except IndexError:
+            raise ValueError(f"The CSV files in '{directory_path}' hold a row with missing fields.")
+        return file_manager
+
+
+def _write_csv_file(path: str, header: list[str], rows):
+    """
+    Writes one CSV file.
+
+    :param path: The path of the file.
+    :type path: str
+    :param header: The header row.
+    :type header: list[str]
+    :param rows: The data rows.
+    :type rows: Iterable[list]
+    """
+    # newline parameter needed for windows
+    # open() converts \n to \r\n
+    # CSV module handles newlines automatically
+    # prevent double newline error
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _read_csv_columns(path: str, columns: tuple[str, ...]):
+    """
+    Reads some of the columns of a CSV file, looked up by name in its header.
+
+    A plain reader, with the columns looked up once, is much faster than a DictReader.
+
+    :param path: The path of the file.
+    :type path: str
+    :param columns: The names of the columns to read.
+    :type columns: tuple[str, ...]
+    :return: A generator of tuples holding the values of those columns, one per row.
+    :raises ValueError: If the header lacks a column.
+    :raises IndexError: If a row is too short.
+    """
+    with open(path, 'r') as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        yield from map(itemgetter(*(header.index(column) for column in columns)), reader)
+
+
+JSON_CHUNK_SIZE = 1 << 16
+"""The number of characters read from a JSON file at a time while streaming it."""
+
+_NUMBER_CHARACTERS = frozenset("0123456789.eE+-")
+"""The characters that can continue a JSON number."""
+
+
+def _iter_json_sections(f, chunk_size: int = JSON_CHUNK_SIZE):
+    """
+    Incrementally parses a JSON object whose values are arrays.
+
+    Yields each array element as soon as it has been read, keeping only a small
+    window of the file in memory. Top-level values that are not arrays are
+    decoded and skipped.
+
+    :param f: The open, readable text file.
+    :param chunk_size: The number of characters to read at a time.
+    :type chunk_size: int
+    :return: A generator of (key, element) pairs, in document order.
+    :raises json.JSONDecodeError: If the document is malformed.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                return ""
+
+    def expect(chars: str) -> str:
+        nonlocal pos
+        char = peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expected one of {chars!r}", buf, pos)
+        pos += 1
+        return char
+
+    def value():
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+                # a number touching the end of the buffer, or followed by what could be more of it
+                # (e.g. "-1.5" of "-1.5e10"), may continue in the next chunk
+                if eof or (end < len(buf) and not (type(obj) in (int, float) and buf[end] in _NUMBER_CHARACTERS)):
+                    pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            if not fill():
+                obj, pos = decoder.raw_decode(buf, pos)
+                return obj
+
+    expect("{")
+    if peek() == "}":
+        return
+    while True:
+        key = value()
+        expect(":")
+        if peek() == "[":
+            expect("[")
+            if peek() == "]":
+                expect("]")
+            else:
+                while True:
+                    yield key, value()
+                    if expect(",]") == "]":
+                        break
+        else:
+            value()
+        if expect(",}") == "}":
+            return
@@ -8,15 +8,36 @@ data managers expose a consistent API for handling CRUD operations.
 It also defines a custom `DataError` exception.
 """
 from abc import ABC, abstractmethod
+from typing import ContextManager, Iterable
 
 from ...models.course import Course
 from ...models.instructor import Instructor
 from ...models.student import Student
 
 
+PAGE_SIZE = 500
+"""The default number of objects returned per page by the `iter_*` methods."""
+
+
 class DataError(ValueError):
     """Custom exception raised for data-related errors."""
-    pass
+
+    @classmethod
+    def not_found(cls, kind: str, ids: Iterable[str]) -> "DataError":
+        """
+        Creates the error reporting that records do not exist.
+
+        :param kind: The kind of record, capitalized (e.g., "Student").
+        :type kind: str
+        :param ids: The IDs that were not found.
+        :type ids: Iterable[str]
+        :return: The error, e.g., "Student with ID '1' not found." for a single ID.
+        :rtype: DataError
+        """
+        ids = list(ids)
+        if len(ids) == 1:
+            return cls(f"{kind} with ID '{ids[0]}' not found.")
+        return cls(f"{kind}s with IDs {', '.join(repr(i) for i in ids)} not found.")
 
 
 class BaseDataManager(ABC):
@@ -26,6 +47,8 @@ class BaseDataManager(ABC):
     All concrete data manager classes must inherit from this class and
     implement all its abstract methods.
     """
+    thread_safe: bool = False
+    """Whether the methods may be called from several threads at once."""
 
     @staticmethod
     @abstractmethod
@@ -88,6 +111,39 @@ class BaseDataManager(ABC):
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    def iter_students(after_id: str = None, limit: int = PAGE_SIZE) -> list[Student]:
+        """
+        Retrieves one page of students, ordered by ID.
+
+        Pages are keyed by the last ID seen rather than by an offset: pass the ID
+        of the last student of a page to get the next one. An empty page means
+        there are no more students.
+
+        :param after_id: Only students with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of students to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` students, ordered by ID.
+        :rtype: list[Student]
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def search_students(query: str) -> list[Student]:
+        """
+        Finds the students whose name, ID, or email contains the query, ignoring case.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching students.
+        :rtype: list[Student]
+        """
+        pass
+
     @staticmethod
     @abstractmethod
     def add_instructor(**kwargs) -> None:
@@ -149,6 +205,39 @@ class BaseDataManager(ABC):
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    def iter_instructors(after_id: str = None, limit: int = PAGE_SIZE) -> list[Instructor]:
+        """
+        Retrieves one page of instructors, ordered by ID.
+
+        Pages are keyed by the last ID seen rather than by an offset: pass the ID
+        of the last instructor of a page to get the next one. An empty page means
+        there are no more instructors.
+
+        :param after_id: Only instructors with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of instructors to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` instructors, ordered by ID.
+        :rtype: list[Instructor]
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def search_instructors(query: str) -> list[Instructor]:
+        """
+        Finds the instructors whose name, ID, or email contains the query, ignoring case.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching instructors.
+        :rtype: list[Instructor]
+        """
+        pass
+
     @staticmethod
     @abstractmethod
     def add_course(**kwargs) -> None:
@@ -210,6 +299,39 @@ class BaseDataManager(ABC):
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    def iter_courses(after_id: str = None, limit: int = PAGE_SIZE) -> list[Course]:
+        """
+        Retrieves one page of courses, ordered by ID.
+
+        Pages are keyed by the last ID seen rather than by an offset: pass the ID
+        of the last course of a page to get the next one. An empty page means
+        there are no more courses.
+
+        :param after_id: Only courses with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of courses to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` courses, ordered by ID.
+        :rtype: list[Course]
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def search_courses(query: str) -> list[Course]:
+        """
+        Finds the courses whose name or ID contains the query, ignoring case.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching courses.
+        :rtype: list[Course]
+        """
+        pass
+
     @staticmethod
     @abstractmethod
     def enroll_student(student_id: str, course_id: str) -> None:
@@ -224,6 +346,56 @@ class BaseDataManager(ABC):
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    def enroll_many(pairs: Iterable[tuple[str, str]]) -> int:
+        """
+        Enrolls students in courses in bulk, all or nothing.
+
+        Every ID is checked before anything is written. Pairs that are already
+        enrolled (or repeated) are skipped rather than treated as errors.
+
+        :param pairs: The (student_id, course_id) pairs to enroll.
+        :type pairs: Iterable[tuple[str, str]]
+        :return: The number of new enrollments.
+        :rtype: int
+        :raises DataError: If any student or course is not found; nothing is enrolled then.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def enroll_students(course_id: str, student_ids: Iterable[str]) -> int:
+        """
+        Enrolls several students in one course, all or nothing.
+
+        Equivalent to `enroll_many` with a pair for each student.
+
+        :param course_id: The ID of the course to enroll in.
+        :type course_id: str
+        :param student_ids: The IDs of the students to enroll.
+        :type student_ids: Iterable[str]
+        :return: The number of new enrollments.
+        :rtype: int
+        :raises DataError: If the course or any student is not found; nothing is enrolled then.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def transaction() -> ContextManager[None]:
+        """
+        Groups the writes made in a `with` block into one atomic unit of work.
+
+        The writes are applied together when the block exits normally. If the
+        block raises, none of them are applied and the exception is re-raised.
+        Transactions may be nested; an inner one that fails only undoes its own writes.
+
+        :return: A context manager delimiting the unit of work.
+        :raises DataError: If the unit of work cannot be committed.
+        """
+        pass
+
     @staticmethod
     @abstractmethod
     def data_to_json(filepath: str) -> None:
@@ -238,14 +410,60 @@ class BaseDataManager(ABC):
 
     @staticmethod
     @abstractmethod
-    def data_from_json(filepath: str) -> None:
+    def data_from_json(filepath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
         """
         Deserializes and loads all data from a JSON file.
 
         :param filepath: The path to the input JSON file.
         :type filepath: str
-        :raises IOError: If the file cannot be read.
-        :raises DataError: If the data format is invalid.
+        :param merge: If True, the data is merged into the existing data instead of replacing it: new
+                      records are added, changed ones updated, and each student's enrollments replaced
+                      by those in the file. Defaults to False.
+        :type merge: bool, optional
+        :param prune: If True and merging, records missing from the file are removed. Defaults to False.
+        :type prune: bool, optional
+        :return: When merging, the number of records inserted, updated, and deleted, under those keys;
+                 otherwise None.
+        :rtype: dict[str, int] | None
+        :raises DataError: If the file cannot be read, or the data format is invalid; the existing data is left
+                           unchanged then.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def data_to_snapshot(filepath: str) -> None:
+        """
+        Serializes all data to a binary snapshot file.
+
+        A failed export leaves any previous file at `filepath` in place.
+
+        :param filepath: The path to the output snapshot file.
+        :type filepath: str
+        :raises IOError: If the file cannot be written.
+        :raises DataError: If a record refers to one that does not exist (e.g., a course to a removed instructor).
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def data_from_snapshot(filepath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
+        """
+        Deserializes and loads all data from a binary snapshot file.
+
+        :param filepath: The path to the input snapshot file.
+        :type filepath: str
+        :param merge: If True, the data is merged into the existing data instead of replacing it: new
+                      records are added, changed ones updated, and each student's enrollments replaced
+                      by those in the file. Defaults to False.
+        :type merge: bool, optional
+        :param prune: If True and merging, records missing from the file are removed. Defaults to False.
+        :type prune: bool, optional
+        :return: When merging, the number of records inserted, updated, and deleted, under those keys;
+                 otherwise None.
+        :rtype: dict[str, int] | None
+        :raises DataError: If the file cannot be read, or is not a valid snapshot; the existing data is left
+                           unchanged then.
         """
         pass
 
@@ -263,13 +481,22 @@ class BaseDataManager(ABC):
 
     @staticmethod
     @abstractmethod
-    def data_from_csv(dirpath: str) -> None:
+    def data_from_csv(dirpath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
         """
         Deserializes and loads all data from CSV files in a directory.
 
         :param dirpath: The path to the input directory.
         :type dirpath: str
-        :raises IOError: If files cannot be read.
-        :raises DataError: If the data format is invalid.
+        :param merge: If True, the data is merged into the existing data instead of replacing it: new
+                      records are added, changed ones updated, and each student's enrollments replaced
+                      by those in the files. Defaults to False.
+        :type merge: bool, optional
+        :param prune: If True and merging, records missing from the files are removed. Defaults to False.
+        :type prune: bool, optional
+        :return: When merging, the number of records inserted, updated, and deleted, under those keys;
+                 otherwise None.
+        :rtype: dict[str, int] | None
+        :raises DataError: If files cannot be read, or the data format is invalid; the existing data is left
+                           unchanged then.
         """
         pass
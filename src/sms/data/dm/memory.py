@@ -5,15 +5,45 @@ This module contains the `MemoryDataManager` class, which uses a singleton
 `FileManager` instance as a global in-memory datastore. It handles all
 CRUD operations by directly manipulating Python objects in memory.
 """
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+
 from .file import FileManager
-from .interface import BaseDataManager, DataError
+from .interface import BaseDataManager, DataError, PAGE_SIZE
+from .snapshot import SnapshotError
 from ...models.course import Course
 from ...models.instructor import Instructor
+from ...models.relation import RelationSet
 from ...models.student import Student
+from ...utils.ngram import NGramIndex
 
 datastore = FileManager()
 """The global, in-memory data store for the application."""
 
+_COLLECTIONS = ("students", "instructors", "courses")
+"""The names of the datastore's collections."""
+_KEYS = {Student: ("students", "student_id"), Instructor: ("instructors", "instructor_id"),
+         Course: ("courses", "course_id")}
+"""For each model class: the name of its datastore collection, and the attribute holding its ID."""
+
+
+def _object_state(obj) -> dict:
+    """
+    Captures the attributes of a model object, so that they can be restored later.
+
+    Relations are copied, since they are changed in place.
+
+    :param obj: A `Student`, `Instructor`, or `Course` object.
+    :return: The object's attribute values, by attribute name.
+    :rtype: dict
+    """
+    state = {}
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            value = getattr(obj, slot)
+            state[slot] = value.copy() if isinstance(value, RelationSet) else value
+    return state
+
 
 class MemoryDataManager(BaseDataManager):
     """
@@ -22,6 +52,185 @@ class MemoryDataManager(BaseDataManager):
     All methods are static and operate on the module-level `datastore` object,
     providing a concrete way to manage data while the application is running.
     """
+    _search_indexes: dict[str, NGramIndex] = {}
+    """N-gram indexes over the datastore for the search methods, built on first use and kept in sync by writes."""
+    _sorted_ids: dict[str, list[str]] = {}
+    """Sorted ID lists of the datastore for the `iter_*` methods, built on first use and kept in sync by writes."""
+    _transactions: list[tuple[dict, dict]] = []
+    """
+    The open transactions, innermost last. Each holds an undo log of the
+    datastore's collections, mapping each (collection name, ID) added or removed
+    since it began to the object it held then (None if it held none), and the
+    saved state of each object changed since.
+    """
+
+    @staticmethod
+    def _save(*objects):
+        """
+        Saves the state of objects about to be changed, if a transaction is open.
+
+        Only the first change to an object within a transaction saves its state.
+
+        :param objects: The `Student`, `Instructor`, or `Course` objects about to be changed.
+        """
+        if not MemoryDataManager._transactions:
+            return
+        changed = MemoryDataManager._transactions[-1][1]
+        for obj in objects:
+            if obj is not None and id(obj) not in changed:
+                changed[id(obj)] = (obj, _object_state(obj))
+
+    @staticmethod
+    def _put(kind: str, key: str, obj=None):
+        """
+        Adds an object to a datastore collection, or removes one, keeping the indexes in sync.
+
+        If a transaction is open, the first change to each key logs what it held before.
+
+        :param kind: The name of the datastore collection.
+        :type kind: str
+        :param key: The object's ID.
+        :type key: str
+        :param obj: The object to add, or None to remove the one with that ID.
+        """
+        objects = getattr(datastore, kind)
+        if MemoryDataManager._transactions:
+            MemoryDataManager._transactions[-1][0].setdefault((kind, key), objects.get(key))
+        if obj is None:
+            objects.pop(key, None)
+        else:
+            objects[key] = obj
+        MemoryDataManager._reindex(kind, key, obj)
+
+    @staticmethod
+    @contextmanager
+    def transaction():
+        """
+        Groups the writes made in a `with` block into one all-or-nothing unit of work.
+
+        Beginning a transaction copies nothing: each write logs what it is about
+        to change, an object's state the first time it is changed, and a
+        collection entry the first time it is added or removed, so a
+        transaction costs as much as the writes it groups. If the block raises,
+        the logged entries and objects are restored (removed records are put
+        back at the end of their collection), and the exception is re-raised.
+        Transactions may be nested; an inner one that fails only undoes its own
+        writes.
+
+        :return: A context manager delimiting the transaction.
+        """
+        keys, changed = {}, {}
+        transactions = MemoryDataManager._transactions
+        transactions.append((keys, changed))
+        try:
+            yield
+        except BaseException:
+            for (kind, key), obj in keys.items():
+                objects = getattr(datastore, kind)
+                if obj is None:
+                    objects.pop(key, None)
+                else:
+                    objects[key] = obj
+            for obj, state in changed.values():
+                for attribute, value in state.items():
+                    setattr(obj, attribute, value)
+            touched = set(keys)
+            for obj, _ in changed.values():
+                kind, attribute = _KEYS[type(obj)]
+                touched.add((kind, getattr(obj, attribute)))
+            for kind, key in touched:
+                MemoryDataManager._reindex(kind, key, getattr(datastore, kind).get(key))
+            raise
+        else:
+            if len(transactions) > 1:
+                # the enclosing transaction must be able to undo these changes too
+                outer_keys, outer_changed = transactions[-2]
+                for key, saved in keys.items():
+                    outer_keys.setdefault(key, saved)
+                for key, saved in changed.items():
+                    outer_changed.setdefault(key, saved)
+        finally:
+            transactions.pop()
+
+    @staticmethod
+    def _search_index(kind: str) -> NGramIndex:
+        """
+        Gets the search index of an entity type, building it from the datastore if needed.
+
+        :param kind: The name of the datastore collection ("students", "instructors", or "courses").
+        :type kind: str
+        :return: The search index.
+        :rtype: NGramIndex
+        """
+        index = MemoryDataManager._search_indexes.get(kind)
+        if index is None:
+            index = NGramIndex()
+            for key, obj in getattr(datastore, kind).items():
+                index.add(key, *obj.search_fields())
+            MemoryDataManager._search_indexes[kind] = index
+        return index
+
+    @staticmethod
+    def _sorted_keys(kind: str) -> list[str]:
+        """
+        Gets the sorted IDs of an entity type, sorting them from the datastore if needed.
+
+        :param kind: The name of the datastore collection ("students", "instructors", or "courses").
+        :type kind: str
+        :return: The sorted list of IDs.
+        :rtype: list[str]
+        """
+        keys = MemoryDataManager._sorted_ids.get(kind)
+        if keys is None:
+            keys = MemoryDataManager._sorted_ids[kind] = sorted(getattr(datastore, kind))
+        return keys
+
+    @staticmethod
+    def _reindex(kind: str, key: str, obj=None):
+        """
+        Applies a change to one object to the indexes that have been built for its collection.
+
+        :param kind: The name of the datastore collection.
+        :type kind: str
+        :param key: The object's ID.
+        :type key: str
+        :param obj: The object's current state, or None if it was removed.
+        """
+        index = MemoryDataManager._search_indexes.get(kind)
+        if index is not None:
+            if obj is None:
+                index.remove(key)
+            else:
+                index.add(key, *obj.search_fields())
+
+        keys = MemoryDataManager._sorted_ids.get(kind)
+        if keys is not None:
+            i = bisect_left(keys, key)
+            present = i < len(keys) and keys[i] == key
+            if obj is None and present:
+                del keys[i]
+            elif obj is not None and not present:
+                keys.insert(i, key)
+
+    @staticmethod
+    def _page(kind: str, after_id: str, limit: int) -> list:
+        """
+        Retrieves the objects of a collection following a given ID, ordered by ID.
+
+        :param kind: The name of the datastore collection.
+        :type kind: str
+        :param after_id: Only objects with a greater ID are returned. None starts from the beginning.
+        :type after_id: str | None
+        :param limit: The maximum number of objects to return. A negative value means no limit.
+        :type limit: int
+        :return: The objects of the page.
+        :rtype: list
+        """
+        keys = MemoryDataManager._sorted_keys(kind)
+        start = bisect_right(keys, after_id) if after_id is not None else 0
+        end = start + limit if limit >= 0 else len(keys)
+        objects = getattr(datastore, kind)
+        return [objects[key] for key in keys[start:end]]
 
     @staticmethod
     def add_student(**kwargs) -> None:
@@ -37,7 +246,7 @@ class MemoryDataManager(BaseDataManager):
             raise DataError(e)
         if s.student_id in datastore.students:
             raise DataError(f"Student with ID '{s.student_id}' already exists.")
-        datastore.students[s.student_id] = s
+        MemoryDataManager._put("students", s.student_id, s)
 
     @staticmethod
     def edit_student(**kwargs) -> None:
@@ -56,23 +265,31 @@ class MemoryDataManager(BaseDataManager):
         if student_id not in datastore.students:
             raise DataError(f"Student with ID '{student_id}' not found.")
 
+        MemoryDataManager._save(datastore.students[student_id])
         try:
             datastore.students[student_id].update(**kwargs)
         except ValueError as e:
             raise DataError(e)
+        MemoryDataManager._reindex("students", student_id, datastore.students[student_id])
 
     @staticmethod
     def remove_student(student_id: str) -> None:
         """
         Removes a student from the in-memory datastore.
 
+        This also removes the student from the courses they are enrolled in.
+
         :param student_id: The ID of the student to remove.
         :type student_id: str
         :raises DataError: If the student is not found.
         """
         if not datastore.students.get(student_id):
             raise DataError(f"Student with ID '{student_id}' does not exist.")
-        del datastore.students[student_id]
+        s = datastore.students[student_id]
+        MemoryDataManager._put("students", student_id)
+        MemoryDataManager._save(*s.registered_courses)
+        for course in s.registered_courses:
+            course.enrolled_students.discard(s)
 
     @staticmethod
     def get_student(student_id: str) -> Student:
@@ -100,6 +317,38 @@ class MemoryDataManager(BaseDataManager):
         """
         return list(datastore.students.values())
 
+    @staticmethod
+    def iter_students(after_id: str = None, limit: int = PAGE_SIZE) -> list[Student]:
+        """
+        Retrieves one page of students from memory, ordered by ID.
+
+        The start of the page is found by binary search over a sorted list of IDs.
+
+        :param after_id: Only students with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of students to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` students, ordered by ID.
+        :rtype: list[Student]
+        """
+        return MemoryDataManager._page("students", after_id, limit)
+
+    @staticmethod
+    def search_students(query: str) -> list[Student]:
+        """
+        Finds the students in memory whose name, ID, or email contains the query, ignoring case.
+
+        Uses an n-gram index, so the cost depends on the number of matches rather
+        than on the number of students.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching students.
+        :rtype: list[Student]
+        """
+        return [datastore.students[key] for key in MemoryDataManager._search_index("students").search(query)]
+
     @staticmethod
     def add_instructor(**kwargs) -> None:
         """
@@ -114,7 +363,7 @@ class MemoryDataManager(BaseDataManager):
             raise DataError(e)
         if i.instructor_id in datastore.instructors:
             raise DataError(f"Instructor with ID '{i.instructor_id}' already exists.")
-        datastore.instructors[i.instructor_id] = i
+        MemoryDataManager._put("instructors", i.instructor_id, i)
 
     @staticmethod
     def edit_instructor(**kwargs) -> None:
@@ -133,10 +382,12 @@ class MemoryDataManager(BaseDataManager):
         if instructor_id not in datastore.instructors:
             raise DataError(f"Instructor with ID '{instructor_id}' not found.")
 
+        MemoryDataManager._save(datastore.instructors[instructor_id])
         try:
             datastore.instructors[instructor_id].update(**kwargs)
         except ValueError as e:
             raise DataError(e)
+        MemoryDataManager._reindex("instructors", instructor_id, datastore.instructors[instructor_id])
 
     @staticmethod
     def remove_instructor(instructor_id: str) -> None:
@@ -149,7 +400,7 @@ class MemoryDataManager(BaseDataManager):
         """
         if not datastore.instructors.get(instructor_id):
             raise DataError(f"Instructor with ID '{instructor_id}' does not exist.")
-        del datastore.instructors[instructor_id]
+        MemoryDataManager._put("instructors", instructor_id)
 
     @staticmethod
     def get_instructor(instructor_id: str) -> Instructor:
@@ -177,6 +428,38 @@ class MemoryDataManager(BaseDataManager):
         """
         return list(datastore.instructors.values())
 
+    @staticmethod
+    def iter_instructors(after_id: str = None, limit: int = PAGE_SIZE) -> list[Instructor]:
+        """
+        Retrieves one page of instructors from memory, ordered by ID.
+
+        The start of the page is found by binary search over a sorted list of IDs.
+
+        :param after_id: Only instructors with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of instructors to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` instructors, ordered by ID.
+        :rtype: list[Instructor]
+        """
+        return MemoryDataManager._page("instructors", after_id, limit)
+
+    @staticmethod
+    def search_instructors(query: str) -> list[Instructor]:
+        """
+        Finds the instructors in memory whose name, ID, or email contains the query, ignoring case.
+
+        Uses an n-gram index, so the cost depends on the number of matches rather
+        than on the number of instructors.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching instructors.
+        :rtype: list[Instructor]
+        """
+        return [datastore.instructors[key] for key in MemoryDataManager._search_index("instructors").search(query)]
+
     @staticmethod
     def add_course(**kwargs) -> None:
         """
@@ -185,13 +468,15 @@ class MemoryDataManager(BaseDataManager):
         :param kwargs: Keyword arguments representing course attributes.
         :raises DataError: If course data is invalid or a course with the same ID already exists.
         """
+        # the Course constructor assigns the course to its instructor
+        MemoryDataManager._save(kwargs.get("instructor"))
         try:
             c = Course(**kwargs)
         except ValueError as e:
             raise DataError(e)
         if c.course_id in datastore.courses:
             raise DataError(f"Course with ID '{c.course_id}' already exists.")
-        datastore.courses[c.course_id] = c
+        MemoryDataManager._put("courses", c.course_id, c)
 
     @staticmethod
     def edit_course(**kwargs) -> None:
@@ -210,10 +495,14 @@ class MemoryDataManager(BaseDataManager):
         if course_id not in datastore.courses:
             raise DataError(f"Course with ID '{course_id}' not found.")
 
+        course = datastore.courses[course_id]
+        # a new instructor moves the course from the old instructor's assignments
+        MemoryDataManager._save(course, course.instructor, kwargs.get("instructor"))
         try:
-            datastore.courses[course_id].update(**kwargs)
+            course.update(**kwargs)
         except ValueError as e:
             raise DataError(e)
+        MemoryDataManager._reindex("courses", course_id, course)
 
     @staticmethod
     def remove_course(course_id: str) -> None:
@@ -230,10 +519,11 @@ class MemoryDataManager(BaseDataManager):
         if not datastore.courses.get(course_id):
             raise DataError(f"Course with ID '{course_id}' does not exist.")
         c = datastore.courses[course_id]
+        MemoryDataManager._save(c.instructor, *c.enrolled_students)
         c.instructor.assigned_courses.remove(c)
         for student in c.enrolled_students:
             student.registered_courses.remove(c)
-        del datastore.courses[course_id]
+        MemoryDataManager._put("courses", course_id)
 
     @staticmethod
     def get_course(course_id: str) -> Course:
@@ -261,6 +551,38 @@ class MemoryDataManager(BaseDataManager):
         """
         return list(datastore.courses.values())
 
+    @staticmethod
+    def iter_courses(after_id: str = None, limit: int = PAGE_SIZE) -> list[Course]:
+        """
+        Retrieves one page of courses from memory, ordered by ID.
+
+        The start of the page is found by binary search over a sorted list of IDs.
+
+        :param after_id: Only courses with a greater ID are returned. None starts from the beginning.
+        :type after_id: str, optional
+        :param limit: The maximum number of courses to return. A negative value means no limit.
+                      Defaults to `PAGE_SIZE`.
+        :type limit: int, optional
+        :return: Up to `limit` courses, ordered by ID.
+        :rtype: list[Course]
+        """
+        return MemoryDataManager._page("courses", after_id, limit)
+
+    @staticmethod
+    def search_courses(query: str) -> list[Course]:
+        """
+        Finds the courses in memory whose name or ID contains the query, ignoring case.
+
+        Uses an n-gram index, so the cost depends on the number of matches rather
+        than on the number of courses.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The matching courses.
+        :rtype: list[Course]
+        """
+        return [datastore.courses[key] for key in MemoryDataManager._search_index("courses").search(query)]
+
     @staticmethod
     def enroll_student(student_id: str, course_id: str) -> None:
         """
@@ -278,8 +600,60 @@ class MemoryDataManager(BaseDataManager):
         c = datastore.courses.get(course_id)
         if not c:
             raise DataError(f"Course with ID '{course_id}' not found.")
+        MemoryDataManager._save(s, c)
         s.register_course(c)
 
+    @staticmethod
+    def enroll_many(pairs) -> int:
+        """
+        Enrolls students in courses in bulk, all or nothing.
+
+        Every ID is checked before any student is enrolled. Pairs that are
+        already enrolled (or repeated) are skipped.
+
+        :param pairs: The (student_id, course_id) pairs to enroll.
+        :type pairs: Iterable[tuple[str, str]]
+        :return: The number of new enrollments.
+        :rtype: int
+        :raises DataError: If any student or course is not found; nothing is enrolled then.
+        """
+        pairs = list(pairs)
+        missing_students = [student_id for student_id in dict.fromkeys(student_id for student_id, _ in pairs)
+                            if student_id not in datastore.students]
+        if missing_students:
+            raise DataError.not_found("Student", missing_students)
+        missing_courses = [course_id for course_id in dict.fromkeys(course_id for _, course_id in pairs)
+                           if course_id not in datastore.courses]
+        if missing_courses:
+            raise DataError.not_found("Course", missing_courses)
+
+        added = 0
+        for student_id, course_id in pairs:
+            s = datastore.students[student_id]
+            if course_id not in s.registered_courses:
+                c = datastore.courses[course_id]
+                MemoryDataManager._save(s, c)
+                s.register_course(c)
+                added += 1
+        return added
+
+    @staticmethod
+    def enroll_students(course_id: str, student_ids) -> int:
+        """
+        Enrolls several students in one course, all or nothing.
+
+        See `enroll_many`.
+
+        :param course_id: The ID of the course to enroll in.
+        :type course_id: str
+        :param student_ids: The IDs of the students to enroll.
+        :type student_ids: Iterable[str]
+        :return: The number of new enrollments.
+        :rtype: int
+        :raises DataError: If the course or any student is not found; nothing is enrolled then.
+        """
+        return MemoryDataManager.enroll_many((student_id, course_id) for student_id in student_ids)
+
     @staticmethod
     def data_to_json(filepath: str) -> None:
         """
@@ -291,14 +665,70 @@ class MemoryDataManager(BaseDataManager):
         datastore.save_to_json(filepath)
 
     @staticmethod
-    def data_from_json(filepath: str) -> None:
+    def data_from_json(filepath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
         """
-        Delegates loading all data from a JSON file into memory.
+        Loads all data from a JSON file into memory, or merges it into the datastore.
+
+        The file is read in full before the datastore is changed, so a file
+        that cannot be loaded leaves the current data in place.
 
         :param filepath: The path to the input JSON file.
         :type filepath: str
+        :param merge: If True, the data is merged with `_merge_file_manager`. Defaults to False.
+        :type merge: bool, optional
+        :param prune: If True and merging, records that were not loaded are removed. Defaults to False.
+        :type prune: bool, optional
+        :return: When merging, the number of records inserted, updated, and deleted; otherwise None.
+        :rtype: dict[str, int] | None
+        :raises DataError: If the data cannot be loaded, or a merged record is invalid; nothing is changed then.
+        """
+        try:
+            incoming = FileManager.from_json(filepath)
+        except (OSError, ValueError) as e:
+            raise DataError(f"Failed to load data from JSON: {e}")
+        if merge:
+            return MemoryDataManager._merge_file_manager(incoming, prune)
+        MemoryDataManager._replace_datastore(incoming)
+
+    @staticmethod
+    def data_to_snapshot(filepath: str) -> None:
+        """
+        Delegates saving all in-memory data to a binary snapshot file.
+
+        :param filepath: The path to the output snapshot file.
+        :type filepath: str
+        :raises DataError: If a course's instructor or a registered course is missing from the datastore.
         """
-        datastore.load_from_json(filepath)
+        try:
+            datastore.save_to_snapshot(filepath)
+        except SnapshotError as e:
+            raise DataError(f"Failed to save snapshot: {e}")
+
+    @staticmethod
+    def data_from_snapshot(filepath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
+        """
+        Loads all data from a binary snapshot file into memory, or merges it into the datastore.
+
+        The snapshot is read in full before the datastore is changed, so a file
+        that cannot be loaded leaves the current data in place.
+
+        :param filepath: The path to the input snapshot file.
+        :type filepath: str
+        :param merge: If True, the data is merged with `_merge_file_manager`. Defaults to False.
+        :type merge: bool, optional
+        :param prune: If True and merging, records that were not loaded are removed. Defaults to False.
+        :type prune: bool, optional
+        :return: When merging, the number of records inserted, updated, and deleted; otherwise None.
+        :rtype: dict[str, int] | None
+        :raises DataError: If the file cannot be read or is not a valid snapshot, or a merged record is invalid.
+        """
+        try:
+            incoming = FileManager.from_snapshot(filepath)
+        except (OSError, SnapshotError) as e:
+            raise DataError(f"Failed to load data from snapshot: {e}")
+        if merge:
+            return MemoryDataManager._merge_file_manager(incoming, prune)
+        MemoryDataManager._replace_datastore(incoming)
 
     @staticmethod
     def data_to_csv(dirpath: str) -> None:
@@ -311,11 +741,124 @@ class MemoryDataManager(BaseDataManager):
         datastore.save_to_csv(dirpath)
 
     @staticmethod
-    def data_from_csv(dirpath: str) -> None:
+    def data_from_csv(dirpath: str, merge: bool = False, prune: bool = False) -> dict[str, int] | None:
         """
-        Delegates loading all data from CSV files into memory.
+        Loads all data from CSV files into memory, or merges it into the datastore.
+
+        The files are read in full before the datastore is changed, so files
+        that cannot be loaded leave the current data in place.
 
         :param dirpath: The path to the input directory.
         :type dirpath: str
+        :param merge: If True, the data is merged with `_merge_file_manager`. Defaults to False.
+        :type merge: bool, optional
+        :param prune: If True and merging, records that were not loaded are removed. Defaults to False.
+        :type prune: bool, optional
+        :return: When merging, the number of records inserted, updated, and deleted; otherwise None.
+        :rtype: dict[str, int] | None
+        :raises DataError: If the data cannot be loaded, or a merged record is invalid; nothing is changed then.
         """
-        datastore.load_from_csv(dirpath)
+        try:
+            incoming = FileManager.from_csv(dirpath)
+        except (OSError, ValueError) as e:
+            raise DataError(f"Failed to load data from CSV: {e}")
+        if merge:
+            return MemoryDataManager._merge_file_manager(incoming, prune)
+        MemoryDataManager._replace_datastore(incoming)
+
+    @staticmethod
+    def _replace_datastore(incoming: FileManager):
+        """
+        Replaces all the data in memory with that of a loaded FileManager.
+
+        :param incoming: The FileManager holding the new data.
+        :type incoming: FileManager
+        """
+        if MemoryDataManager._transactions:
+            # log every entry replaced or added, so that an open transaction can undo the replacement
+            keys = MemoryDataManager._transactions[-1][0]
+            for kind in _COLLECTIONS:
+                for key, obj in getattr(datastore, kind).items():
+                    keys.setdefault((kind, key), obj)
+                for key in getattr(incoming, kind):
+                    keys.setdefault((kind, key), None)
+        for kind in _COLLECTIONS:
+            getattr(datastore, kind).clear()
+            getattr(datastore, kind).update(getattr(incoming, kind))
+        MemoryDataManager._search_indexes.clear()
+        MemoryDataManager._sorted_ids.clear()
+
+    @staticmethod
+    def _merge_file_manager(file_manager: FileManager, prune: bool = False) -> dict[str, int]:
+        """
+        Merges the records of a FileManager into the datastore, all or nothing.
+
+        New records are added and records whose fields differ are updated in
+        place, so existing objects (and references to them) are kept. Each
+        merged student's enrollments are replaced by those in the FileManager.
+        Enrollments are counted as records.
+
+        :param file_manager: A FileManager instance preloaded with data.
+        :type file_manager: FileManager
+        :param prune: If True, students, courses, and instructors the FileManager does not hold are removed.
+                      Defaults to False.
+        :type prune: bool, optional
+        :return: The number of records inserted, updated, and deleted, under those keys.
+        :rtype: dict[str, int]
+        :raises DataError: If a record is invalid; the transaction is rolled back.
+        """
+        counts = {"inserted": 0, "updated": 0, "deleted": 0}
+
+        def upsert(current, fields: dict, changed: bool, add, edit):
+            if current is None:
+                add(**fields)
+                counts["inserted"] += 1
+            elif changed:
+                edit(**fields)
+                counts["updated"] += 1
+
+        with MemoryDataManager.transaction():
+            for i in file_manager.instructors.values():
+                current = datastore.instructors.get(i.instructor_id)
+                upsert(current, dict(name=i.name, age=i.age, email=i._email, instructor_id=i.instructor_id),
+                       current is not None and (current.name, current.age, current._email) != (i.name, i.age, i._email),
+                       MemoryDataManager.add_instructor, MemoryDataManager.edit_instructor)
+            for c in file_manager.courses.values():
+                current = datastore.courses.get(c.course_id)
+                instructor = datastore.instructors[c.instructor.instructor_id]
+                upsert(current, dict(course_id=c.course_id, course_name=c.course_name, instructor=instructor),
+                       current is not None and (current.course_name != c.course_name
+                                                or current.instructor is not instructor),
+                       MemoryDataManager.add_course, MemoryDataManager.edit_course)
+            for s in file_manager.students.values():
+                current = datastore.students.get(s.student_id)
+                upsert(current, dict(name=s.name, age=s.age, email=s._email, student_id=s.student_id),
+                       current is not None and (current.name, current.age, current._email) != (s.name, s.age, s._email),
+                       MemoryDataManager.add_student, MemoryDataManager.edit_student)
+
+            for s in file_manager.students.values():
+                student = datastore.students[s.student_id]
+                wanted = set(s.registered_courses.ids())
+                enrolled = set(student.registered_courses.ids())
+                for course_id in enrolled - wanted:
+                    course = datastore.courses[course_id]
+                    MemoryDataManager._save(student, course)
+                    student.registered_courses.discard(course)
+                    course.enrolled_students.discard(student)
+                    counts["deleted"] += 1
+                for course_id in wanted - enrolled:
+                    course = datastore.courses[course_id]
+                    MemoryDataManager._save(student, course)
+                    student.register_course(course)
+                    counts["inserted"] += 1
+
+            if prune:
+                # students and courses first, so no instructor still has a course when it is removed
+                for kind, remove in (("students", MemoryDataManager.remove_student),
+                                     ("courses", MemoryDataManager.remove_course),
+                                     ("instructors", MemoryDataManager.remove_instructor)):
+                    kept = getattr(file_manager, kind)
+                    for record_id in [record_id for record_id in getattr(datastore, kind) if record_id not in kept]:
+                        remove(record_id)
+                        counts["deleted"] += 1
+        return counts
@@ -0,0 +1,349 @@
+"""
+Reads and writes the binary snapshot format.
+
+A snapshot holds the same data as a JSON or CSV export, but stores it in
+columns of length-prefixed strings and packed integers, so it is both smaller
+and much faster to load. Each table's ID column doubles as an index: courses
+refer to their instructor, and enrollments to their student and course, by
+position in those ID tables rather than by repeating the IDs. A snapshot is
+only ever written by the application from valid objects, so loading it does
+not revalidate any record; it is instead protected by a CRC-32 checksum.
+
+Layout, with every integer unsigned and little-endian:
+
+- header: the magic bytes `MAGIC`, the format version (16 bits), and 16 reserved bits
+- instructors: row count (32 bits), then ID, name, age, and email columns
+- courses: row count, then ID, name, and instructor index columns
+- students: row count, then ID, name, age, and email columns
+- enrollments: row count, then (student index, course index) pairs
+- trailer: the CRC-32 of everything before it (32 bits)
+
+A string column is the byte length of each value (32 bits each), followed by
+the values, encoded as UTF-8. Ages take 16 bits and indexes 32 bits.
+
+Attributes:
+    MAGIC (bytes): The bytes every snapshot starts with.
+    VERSION (int): The version of the format written by `write_snapshot`.
+"""
+import struct
+import sys
+import zlib
+from array import array
+from typing import BinaryIO, Iterable
+
+from ...models.course import Course
+from ...models.instructor import Instructor
+from ...models.relation import RelationSet
+from ...models.student import Student
+
+MAGIC = b"SMSS"
+
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")
+_U32 = struct.Struct("<I")
+# array item types of the integer columns; "I" is 32 bits on every supported platform
+_AGE = "H"
+_INDEX = "I"
+
+
+class SnapshotError(ValueError):
+    """Raised when a file is not a snapshot, is of an unsupported version, or is corrupt."""
+
+
+class _Writer:
+    """Writes the columns of a snapshot to a binary file, keeping a running checksum."""
+    __slots__ = ("file", "checksum", "size")
+
+    def __init__(self, file: BinaryIO):
+        """
+        Initializes a _Writer.
+
+        :param file: The open, writable binary file.
+        :type file: BinaryIO
+        """
+        self.file = file
+        self.checksum = 0
+        self.size = 0
+
+    def write(self, data: bytes):
+        """
+        Writes raw bytes and adds them to the checksum.
+
+        :param data: The bytes to write.
+        :type data: bytes
+        """
+        self.file.write(data)
+        self.checksum = zlib.crc32(data, self.checksum)
+        self.size += len(data)
+
+    def count(self, value: int):
+        """
+        Writes a row count.
+
+        :param value: The count.
+        :type value: int
+        """
+        self.write(_U32.pack(value))
+
+    def integers(self, typecode: str, values: Iterable[int]):
+        """
+        Writes a column of integers.
+
+        :param typecode: The `array` type code of the column.
+        :type typecode: str
+        :param values: The integers.
+        :type values: Iterable[int]
+        """
+        column = array(typecode, values)
+        if sys.byteorder == "big":
+            column.byteswap()
+        self.write(column.tobytes())
+
+    def strings(self, values: Iterable[str]):
+        """
+        Writes a column of strings, as their byte lengths followed by their UTF-8 bytes.
+
+        :param values: The strings.
+        :type values: Iterable[str]
+        """
+        encoded = [value.encode("utf-8") for value in values]
+        self.integers(_INDEX, map(len, encoded))
+        self.write(b"".join(encoded))
+
+
+class _Reader:
+    """Reads the columns of a snapshot from its bytes."""
+    __slots__ = ("data", "offset")
+
+    def __init__(self, data: bytes, offset: int):
+        """
+        Initializes a _Reader.
+
+        :param data: The snapshot, without its checksum.
+        :type data: bytes
+        :param offset: The position of the first column.
+        :type offset: int
+        """
+        self.data = data
+        self.offset = offset
+
+    def take(self, size: int) -> bytes:
+        """
+        Reads raw bytes.
+
+        :param size: The number of bytes.
+        :type size: int
+        :return: The bytes.
+        :rtype: bytes
+        :raises SnapshotError: If the snapshot ends first.
+        """
+        end = self.offset + size
+        if end > len(self.data):
+            raise SnapshotError("The snapshot is truncated.")
+        data = self.data[self.offset:end]
+        self.offset = end
+        return data
+
+    def count(self) -> int:
+        """
+        Reads a row count.
+
+        :return: The count.
+        :rtype: int
+        """
+        return _U32.unpack(self.take(_U32.size))[0]
+
+    def integers(self, typecode: str, count: int) -> array:
+        """
+        Reads a column of integers.
+
+        :param typecode: The `array` type code of the column.
+        :type typecode: str
+        :param count: The number of integers.
+        :type count: int
+        :return: The integers.
+        :rtype: array
+        """
+        column = array(typecode)
+        column.frombytes(self.take(column.itemsize * count))
+        if sys.byteorder == "big":
+            column.byteswap()
+        return column
+
+    def strings(self, count: int) -> list[str]:
+        """
+        Reads a column of strings.
+
+        :param count: The number of strings.
+        :type count: int
+        :return: The strings.
+        :rtype: list[str]
+        :raises SnapshotError: If a string is not valid UTF-8.
+        """
+        lengths = self.integers(_INDEX, count)
+        data = self.take(sum(lengths))
+        strings = []
+        start = 0
+        try:
+            for length in lengths:
+                end = start + length
+                strings.append(data[start:end].decode("utf-8"))
+                start = end
+        except UnicodeDecodeError as e:
+            raise SnapshotError(f"The snapshot holds an invalid string: {e}")
+        return strings
+
+
+def write_snapshot(file: BinaryIO, instructors: Iterable[Instructor], courses: Iterable[Course],
+                   students: Iterable[Student]) -> int:
+    """
+    Writes model objects to a binary file as a snapshot.
+
+    Every course's instructor and every registered course must be among the
+    objects written. The references are resolved before anything is written,
+    so a dangling one leaves the file untouched.
+
+    :param file: The open, writable binary file.
+    :type file: BinaryIO
+    :param instructors: The instructors.
+    :type instructors: Iterable[Instructor]
+    :param courses: The courses.
+    :type courses: Iterable[Course]
+    :param students: The students, with their registered courses.
+    :type students: Iterable[Student]
+    :return: The number of bytes written.
+    :rtype: int
+    :raises SnapshotError: If a course's instructor or a registered course is not among the objects written.
+    """
+    instructors, courses, students = list(instructors), list(courses), list(students)
+    instructor_index = {i.instructor_id: n for n, i in enumerate(instructors)}
+    course_index = {c.course_id: n for n, c in enumerate(courses)}
+
+    owners = array(_INDEX)
+    for c in courses:
+        n = instructor_index.get(c.instructor.instructor_id)
+        if n is None:
+            raise SnapshotError(f"Course '{c.course_id}' refers to instructor '{c.instructor.instructor_id}', "
+                                f"which is not in the snapshot.")
+        owners.append(n)
+    pairs = array(_INDEX)
+    for n, s in enumerate(students):
+        for course_id in s.registered_courses.ids():
+            c = course_index.get(course_id)
+            if c is None:
+                raise SnapshotError(f"Student '{s.student_id}' is registered in course '{course_id}', "
+                                    f"which is not in the snapshot.")
+            pairs.append(n)
+            pairs.append(c)
+
+    writer = _Writer(file)
+    writer.write(_HEADER.pack(MAGIC, VERSION, 0))
+
+    _write_people(writer, instructors, "instructor_id")
+    writer.count(len(courses))
+    writer.strings(c.course_id for c in courses)
+    writer.strings(c.course_name for c in courses)
+    writer.integers(_INDEX, owners)
+    _write_people(writer, students, "student_id")
+
+    writer.count(len(pairs) // 2)
+    writer.integers(_INDEX, pairs)
+
+    writer.write(_U32.pack(writer.checksum))
+    return writer.size
+
+
+def read_snapshot(file: BinaryIO) -> tuple[dict[str, Instructor], dict[str, Course], dict[str, Student]]:
+    """
+    Reads a snapshot and rebuilds the linked model objects it holds.
+
+    The checksum is verified before anything is decoded. The objects are
+    built without validation, and their relations are filled in bulk.
+
+    :param file: The open, readable binary file.
+    :type file: BinaryIO
+    :return: The instructors, courses, and students, each keyed by ID.
+    :rtype: tuple[dict[str, Instructor], dict[str, Course], dict[str, Student]]
+    :raises SnapshotError: If the file is not a valid snapshot of a supported version.
+    """
+    data = file.read()
+    if len(data) < _HEADER.size + _U32.size:
+        raise SnapshotError("The file is too short to be a snapshot.")
+    magic, version, _ = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("The file is not a snapshot.")
+    if version != VERSION:
+        raise SnapshotError(f"Snapshot version {version} is not supported (expected {VERSION}).")
+    body, (checksum,) = data[:-_U32.size], _U32.unpack(data[-_U32.size:])
+    if zlib.crc32(body) != checksum:
+        raise SnapshotError("The snapshot's checksum does not match; the file is corrupt.")
+
+    reader = _Reader(body, _HEADER.size)
+    try:
+        instructor_ids, names, ages, emails = _read_people(reader)
+        instructors = [Instructor.from_trusted(name, age, email, instructor_id)
+                       for instructor_id, name, age, email in zip(instructor_ids, names, ages, emails)]
+
+        count = reader.count()
+        course_ids, names, owners = reader.strings(count), reader.strings(count), reader.integers(_INDEX, count)
+        assigned = [{} for _ in instructors]
+        courses = []
+        for course_id, name, n in zip(course_ids, names, owners):
+            course = Course.from_trusted(course_id, name, instructors[n], assign=False)
+            assigned[n][course_id] = course
+            courses.append(course)
+
+        student_ids, names, ages, emails = _read_people(reader)
+        students = [Student.from_trusted(name, age, email, student_id)
+                    for student_id, name, age, email in zip(student_ids, names, ages, emails)]
+
+        pairs = reader.integers(_INDEX, 2 * reader.count())
+        registered = [{} for _ in students]
+        enrolled = [{} for _ in courses]
+        for s, c in zip(pairs[::2], pairs[1::2]):
+            registered[s][course_ids[c]] = courses[c]
+            enrolled[c][student_ids[s]] = students[s]
+    except IndexError:
+        raise SnapshotError("The snapshot refers to a record it does not hold.")
+    if reader.offset != len(body):
+        raise SnapshotError("The snapshot has unexpected data at its end.")
+
+    for instructor, items in zip(instructors, assigned):
+        instructor.assigned_courses = RelationSet.from_mapping("course_id", items)
+    for student, items in zip(students, registered):
+        student.registered_courses = RelationSet.from_mapping("course_id", items)
+    for course, items in zip(courses, enrolled):
+        course.enrolled_students = RelationSet.from_mapping("student_id", items)
+    return dict(zip(instructor_ids, instructors)), dict(zip(course_ids, courses)), dict(zip(student_ids, students))
+
+
+def _write_people(writer: _Writer, people: list, key: str):
+    """
+    Writes the instructors or students table.
+
+    :param writer: The snapshot writer.
+    :type writer: _Writer
+    :param people: The instructors or students.
+    :type people: list[Instructor] | list[Student]
+    :param key: The name of the attribute holding each person's ID.
+    :type key: str
+    """
+    writer.count(len(people))
+    writer.strings(getattr(p, key) for p in people)
+    writer.strings(p.name for p in people)
+    writer.integers(_AGE, (p.age for p in people))
+    writer.strings(p._email for p in people)
+
+
+def _read_people(reader: _Reader) -> tuple[list[str], list[str], array, list[str]]:
+    """
+    Reads the instructors or students table.
+
+    :param reader: The snapshot reader.
+    :type reader: _Reader
+    :return: The ID, name, age, and email columns.
+    :rtype: tuple[list[str], list[str], array, list[str]]
+    """
+    count = reader.count()
+    return reader.strings(count), reader.strings(count), reader.integers(_AGE, count), reader.strings(count)
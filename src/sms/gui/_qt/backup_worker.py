@@ -0,0 +1,60 @@
+"""
+Background database backup for the Qt GUI.
+
+This module contains the BackupWorker class, a QThread that runs a database
+backup off the GUI thread and reports its progress through signals, so the
+window stays responsive while a large database is copied.
+"""
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from ...data.db.backup import backup_database
+
+
+class BackupWorker(QThread):
+    """
+    Runs `backup_database` in a worker thread.
+
+    The signals are emitted from the worker thread and delivered to slots in
+    the GUI thread.
+
+    :cvar progress: Emitted after each backup step with the pages copied so far and the total.
+    :cvar succeeded: Emitted with the number of pages written when the backup completes.
+    :cvar failed: Emitted with an error message if the backup fails.
+    """
+    progress = pyqtSignal(int, int)
+    succeeded = pyqtSignal(int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, source_path: str, target_path: str, compress: bool = False, incremental: bool = False,
+                 parent=None):
+        """
+        Constructor for BackupWorker.
+
+        :param source_path: The path of the database to back up.
+        :type source_path: str
+        :param target_path: The path of the backup file.
+        :type target_path: str
+        :param compress: Whether to gzip the backup.
+        :type compress: bool, optional
+        :param incremental: Whether to update an existing backup with only the changed pages.
+        :type incremental: bool, optional
+        :param parent: The parent object.
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.source_path = source_path
+        self.target_path = target_path
+        self.compress = compress
+        self.incremental = incremental
+
+    def run(self):
+        """
+        Runs the backup. Called in the worker thread by `start()`.
+        """
+        try:
+            pages = backup_database(self.source_path, self.target_path, compress=self.compress,
+                                    incremental=self.incremental, progress=self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.succeeded.emit(pages)
@@ -8,9 +8,10 @@ enrolled in a selected course.
 
 """
 from PyQt5.QtWidgets import (QWidget, QGridLayout, QGroupBox, QLabel, QLineEdit,
-                             QPushButton, QTreeWidget, QTreeWidgetItem, QComboBox,
+                             QPushButton, QTreeView, QTreeWidget, QTreeWidgetItem, QComboBox,
                              QMessageBox, QVBoxLayout, QHBoxLayout, QHeaderView)
 
+from .table_model import EntityTableModel
 from ...data.data_manager import DataError
 from ...data.data_manager import data_manager as dm
 from ...utils.validator import check_course_name, check_course_id
@@ -59,13 +60,16 @@ class CourseFrame(QWidget):
         self.clear_search_button.clicked.connect(self.refresh_data)
         search_layout.addWidget(self.clear_search_button)
 
-        self.tree = QTreeWidget()
-        self.tree.setColumnCount(3)
-        self.tree.setHeaderLabels(["Course ID", "Course Name", "Instructor ID"])
+        self.model = EntityTableModel(["Course ID", "Course Name", "Instructor ID"], dm.iter_courses, "course_id",
+                                      lambda course: course.to_row(), self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setRootIsDecorated(False)
+        self.tree.setUniformRowHeights(True)
         self.tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
         self.tree.header().setStretchLastSection(False)
         main_layout.addWidget(self.tree)
-        self.tree.itemSelectionChanged.connect(self.on_course_select)
+        self.tree.selectionModel().selectionChanged.connect(self.on_course_select)
 
         details_container_layout = QHBoxLayout()
         main_layout.addLayout(details_container_layout)
@@ -119,8 +123,8 @@ class CourseFrame(QWidget):
 
         Clears and repopulates the course tree and the instructor dropdown.
         If a `course_list` is provided, it populates the tree with that list.
-        Otherwise, it fetches all courses from the data manager. Also clears
-        the search bar if no specific list is provided.
+        Otherwise, all courses are shown, fetched page by page as the tree is
+        scrolled. Also clears the search bar if no specific list is provided.
 
         :param course_list: An optional list of Course objects to display.
         :type course_list: list, optional
@@ -128,12 +132,7 @@ class CourseFrame(QWidget):
         if course_list is None:
             self.search_entry.clear()
 
-        self.tree.clear()
-        courses_to_display = course_list if course_list is not None else dm.get_courses()
-
-        for course in courses_to_display:
-            item = QTreeWidgetItem([str(val) for val in course.to_row()])
-            self.tree.addTopLevelItem(item)
+        self.model.reset(course_list)
 
         self.instructor_combobox.clear()
         self.instructor_map = {f"{inst.name} ({inst.instructor_id})": inst for inst in dm.get_instructors()}
@@ -148,14 +147,13 @@ class CourseFrame(QWidget):
         if not query:
             self.refresh_data()
             return
-        all_courses = dm.get_courses()
-        filtered = [c for c in all_courses if query in c.course_name.lower() or query in c.course_id.lower()]
+        filtered = dm.search_courses(query)
         if not filtered:
             QMessageBox.information(self, "No Results", "No courses found.")
         self.refresh_data(course_list=filtered)
         self.controller.update_status(f"Found {len(filtered)} courses matching '{query}'.")
 
-    def on_course_select(self):
+    def on_course_select(self, *_):
         """
         Handles the event when a user selects a course in the tree.
 
@@ -163,10 +161,9 @@ class CourseFrame(QWidget):
         Updates the UI to "edit mode" by disabling the ID field, enabling the
         delete button, and changing the action button to "Save Changes". 
         """
-        selected_items = self.tree.selectedItems()
-        if not selected_items: return
-        item = selected_items[0]
-        course_id, name, instructor_id = [item.text(i) for i in range(3)]
+        selected_rows = self.tree.selectionModel().selectedRows()
+        if not selected_rows: return
+        course_id, name, instructor_id = self.model.object_at(selected_rows[0].row()).to_row()
 
         self.clear_form()
         self.name_entry.setText(name)
@@ -230,7 +227,12 @@ class CourseFrame(QWidget):
 
         QMessageBox.information(self, "Success", f"Course with ID '{course_id}' added successfully.")
         self.controller.update_status(f"Course {course_name} added.")
-        self.refresh_data()
+        if self.model.filtered:
+            self.refresh_data()
+        else:
+            # course IDs are stored in upper case
+            self.model.insert_object(dm.get_course(course_id.upper()))
+            self.clear_form()
 
     def save_changes(self):
         """
@@ -260,7 +262,8 @@ class CourseFrame(QWidget):
 
         QMessageBox.information(self, "Success", f"Course with ID '{self.selected_course_id}' updated successfully.")
         self.controller.update_status(f"Course {course_name} updated.")
-        self.refresh_data()
+        self.model.update_object(self.selected_course_id)
+        self.clear_form()
 
     def delete_course(self):
         """
@@ -281,7 +284,8 @@ class CourseFrame(QWidget):
                 return
             self.controller.update_status(f"Course {self.selected_course_id} deleted successfully.")
             QMessageBox.information(self, "Success", "Course deleted.")
-            self.refresh_data()
+            self.model.remove_object(self.selected_course_id)
+            self.clear_form()
 
     def clear_form(self):
         """
@@ -7,9 +7,10 @@ delete instructors, and to see the courses assigned to a selected instructor.
 
 """
 from PyQt5.QtWidgets import (QWidget, QGridLayout, QGroupBox, QLabel, QLineEdit,
-                             QPushButton, QTreeWidget, QTreeWidgetItem, QMessageBox,
+                             QPushButton, QTreeView, QTreeWidget, QTreeWidgetItem, QMessageBox,
                              QVBoxLayout, QHBoxLayout, QHeaderView)
 
+from .table_model import EntityTableModel
 from ...data.data_manager import DataError
 from ...data.data_manager import data_manager as dm
 from ...utils.validator import check_name, check_age, check_email_r, check_id
@@ -54,13 +55,16 @@ class InstructorFrame(QWidget):
         self.clear_search_button.clicked.connect(self.refresh_data)
         search_layout.addWidget(self.clear_search_button)
 
-        self.tree = QTreeWidget()
-        self.tree.setColumnCount(4)
-        self.tree.setHeaderLabels(["Instructor ID", "Name", "Age", "Email"])
+        self.model = EntityTableModel(["Instructor ID", "Name", "Age", "Email"], dm.iter_instructors,
+                                      "instructor_id", lambda instructor: instructor.to_row(by_id=True), self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setRootIsDecorated(False)
+        self.tree.setUniformRowHeights(True)
         self.tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
         self.tree.header().setStretchLastSection(True)
         main_layout.addWidget(self.tree)
-        self.tree.itemSelectionChanged.connect(self.on_instructor_select)
+        self.tree.selectionModel().selectionChanged.connect(self.on_instructor_select)
 
         details_container_layout = QHBoxLayout()
         main_layout.addLayout(details_container_layout)
@@ -118,7 +122,7 @@ class InstructorFrame(QWidget):
 
         Clears and repopulates the instructor tree. If an `instructor_list`
         is provided (e.g., from a search), it displays that list. Otherwise,
-        it fetches all instructors from the data manager.
+        all instructors are shown, fetched page by page as the tree is scrolled.
 
         :param instructor_list: An optional list of Instructor objects to display.
         :type instructor_list: list, optional
@@ -126,33 +130,27 @@ class InstructorFrame(QWidget):
         if instructor_list is None:
             self.search_entry.clear()
 
-        self.tree.clear()
-        instructors_to_display = instructor_list if instructor_list is not None else dm.get_instructors()
-
-        for instructor in instructors_to_display:
-            item = QTreeWidgetItem([str(val) for val in instructor.to_row(by_id=True)])
-            self.tree.addTopLevelItem(item)
+        self.model.reset(instructor_list)
         self.clear_form()
 
     def search_instructors(self):
         """
         Filters the instructor tree based on the search query.
 
-        The search is case-insensitive and matches against instructor name and ID.
+        The search is case-insensitive and matches against instructor name, ID, and email.
         If the search query is empty, the full instructor list is restored.
         """
         query = self.search_entry.text().strip().lower()
         if not query:
             self.refresh_data()
             return
-        all_instructors = dm.get_instructors()
-        filtered = [inst for inst in all_instructors if query in inst.name.lower() or query in inst.instructor_id]
+        filtered = dm.search_instructors(query)
         if not filtered:
             QMessageBox.information(self, "No Results", "No instructors found.")
         self.refresh_data(instructor_list=filtered)
         self.controller.update_status(f"Found {len(filtered)} instructors matching '{query}'.")
 
-    def on_instructor_select(self):
+    def on_instructor_select(self, *_):
         """
         Handles the event of an instructor being selected in the tree.
 
@@ -160,13 +158,12 @@ class InstructorFrame(QWidget):
         switches the form to "edit mode". It also updates the assigned
         courses view.
         """
-        selected_items = self.tree.selectedItems()
-        if not selected_items: return
-        item = selected_items[0]
-        inst_id, name, age, email = [item.text(i) for i in range(4)]
+        selected_rows = self.tree.selectionModel().selectedRows()
+        if not selected_rows: return
+        inst_id, name, age, email = self.model.object_at(selected_rows[0].row()).to_row(by_id=True)
         self.clear_form()
         self.name_entry.setText(name)
-        self.age_entry.setText(age)
+        self.age_entry.setText(str(age))
         self.email_entry.setText(email)
         self.id_entry.setText(inst_id)
         self.id_entry.setEnabled(False)
@@ -236,7 +233,11 @@ class InstructorFrame(QWidget):
 
         QMessageBox.information(self, "Success", f"Instructor with ID '{instructor_id}' added successfully.")
         self.controller.update_status(f"Instructor {name} added.")
-        self.refresh_data()
+        if self.model.filtered:
+            self.refresh_data()
+        else:
+            self.model.insert_object(dm.get_instructor(instructor_id))
+            self.clear_form()
 
     def save_changes(self):
         """
@@ -282,7 +283,8 @@ class InstructorFrame(QWidget):
         QMessageBox.information(self, "Success",
                                 f"Instructor with ID '{self.selected_instructor_id}' updated successfully.")
         self.controller.update_status(f"Instructor {name} updated.")
-        self.refresh_data()
+        self.model.update_object(self.selected_instructor_id)
+        self.clear_form()
 
     def delete_instructor(self):
         """
@@ -302,7 +304,8 @@ class InstructorFrame(QWidget):
                 return
             self.controller.update_status(f"Instructor {self.selected_instructor_id} deleted successfully.")
             QMessageBox.information(self, "Success", "Instructor deleted.")
-            self.refresh_data()
+            self.model.remove_object(self.selected_instructor_id)
+            self.clear_form()
 
     def clear_form(self):
         """
@@ -6,16 +6,18 @@ from QMainWindow. It sets up the entire user interface, including the menu bar,
 a tabbed interface for managing students, instructors, and courses, and a
 status bar.
 """
-import shutil
+import os
 
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QTabWidget,
                              QAction, QMenu, QStatusBar, QFileDialog, QMessageBox)
 
+from .backup_worker import BackupWorker
 from .constants import LABEL_FONT
 from .course_frame import CourseFrame
 from .instructor_frame import InstructorFrame
 from .student_frame import StudentFrame
 from ...data.data_manager import data_manager as dm
+from ...data.db.backup import GZIP_SUFFIX
 from config import ENABLE_DATABASE
 
 
@@ -40,6 +42,7 @@ class SmsGUIQt(QMainWindow):
         self.central_widget = QWidget()
         self.main_layout = QVBoxLayout(self.central_widget)
         self.setCentralWidget(self.central_widget)
+        self.backup_worker = None
 
         self._create_actions()
         self._create_menu_bar()
@@ -133,27 +136,88 @@ class SmsGUIQt(QMainWindow):
         """
         Handles the database backup operation.
 
-        Opens a file dialog to ask the user for a destination path and copies
-        the current database file to that location.
+        Opens a file dialog to ask the user for a destination path and starts
+        a BackupWorker copying the live database to that location. Choosing a
+        `.gz` file writes a compressed backup; choosing an existing backup
+        updates it with only the changed pages. The window stays usable while
+        the backup runs, and its progress is shown on the status bar.
         """
         if not ENABLE_DATABASE: return
+        if self.backup_worker:
+            return
         source_db_path = dm.get_db_path()
         if not source_db_path:
             QMessageBox.critical(self, "Backup Error", "Could not determine the source database path.")
             return
-        backup_path, _ = QFileDialog.getSaveFileName(self, "Backup Database As", "",
-                                                     "SQLite Database (*.db);;All Files (*.*)")
+        backup_path, _ = QFileDialog.getSaveFileName(
+            self, "Backup Database As", "",
+            f"SQLite Database (*.db);;Compressed Database (*.db{GZIP_SUFFIX});;All Files (*.*)")
         if not backup_path:
             self.update_status("Database backup cancelled.")
             return
-        try:
-            shutil.copy(source_db_path, backup_path)
-            msg = f"Database successfully backed up to {backup_path}"
-            self.update_status(msg)
-            QMessageBox.information(self, "Backup Successful", msg)
-        except Exception as e:
-            self.update_status("Database backup failed.")
-            QMessageBox.critical(self, "Backup Error", f"An error occurred during backup:\n{e}")
+        compress = backup_path.endswith(GZIP_SUFFIX)
+        incremental = not compress and os.path.isfile(backup_path)
+        self.backup_worker = BackupWorker(source_db_path, backup_path, compress, incremental, self)
+        self.backup_worker.progress.connect(self.on_backup_progress)
+        self.backup_worker.succeeded.connect(self.on_backup_succeeded)
+        self.backup_worker.failed.connect(self.on_backup_failed)
+        self.backup_worker.finished.connect(self.on_backup_finished)
+        self.backup_db_action.setEnabled(False)
+        self.status_bar.showMessage("Backing up database...")
+        self.backup_worker.start()
+
+    def on_backup_progress(self, copied, total):
+        """
+        Slot that shows the progress of the running backup on the status bar.
+
+        :param copied: The number of pages copied so far.
+        :type copied: int
+        :param total: The total number of pages.
+        :type total: int
+        """
+        self.status_bar.showMessage(f"Backing up database... {copied * 100 // max(total, 1)}%")
+
+    def on_backup_succeeded(self, pages):
+        """
+        Slot that reports a completed backup.
+
+        :param pages: The number of pages written to the backup file.
+        :type pages: int
+        """
+        msg = f"Database successfully backed up to {self.backup_worker.target_path}"
+        if self.backup_worker.incremental:
+            msg += f" ({pages} changed pages written)"
+        self.update_status(msg)
+        QMessageBox.information(self, "Backup Successful", msg)
+
+    def on_backup_failed(self, error):
+        """
+        Slot that reports a failed backup.
+
+        :param error: The error message.
+        :type error: str
+        """
+        self.update_status("Database backup failed.")
+        QMessageBox.critical(self, "Backup Error", f"An error occurred during backup:\n{error}")
+
+    def on_backup_finished(self):
+        """
+        Slot that releases the finished BackupWorker and re-enables the backup action.
+        """
+        self.backup_worker.deleteLater()
+        self.backup_worker = None
+        self.backup_db_action.setEnabled(True)
+
+    def closeEvent(self, event):
+        """
+        Waits for a running backup to complete before the window closes.
+
+        :param event: The close event.
+        :type event: QCloseEvent
+        """
+        if self.backup_worker:
+            self.backup_worker.wait()
+        super().closeEvent(event)
 
     def save_to_json(self):
         """
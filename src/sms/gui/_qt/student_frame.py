@@ -7,12 +7,12 @@ and deleting students, as well as registering them for courses.
 
 """
 from PyQt5.QtWidgets import (QWidget, QGridLayout, QGroupBox, QLabel, QLineEdit,
-                             QPushButton, QTreeWidget, QTreeWidgetItem, QComboBox,
-                             QMessageBox, QVBoxLayout, QHBoxLayout, QHeaderView)
+                             QPushButton, QTreeView, QTreeWidget, QTreeWidgetItem, QComboBox,
+                             QMessageBox, QVBoxLayout, QHBoxLayout, QHeaderView, QAbstractItemView)
 
+from .table_model import EntityTableModel
 from ...data.data_manager import DataError
 from ...data.data_manager import data_manager as dm
-from ...models.student import Student
 from ...utils.validator import check_name, check_age, check_email_r, check_id
 
 
@@ -56,14 +56,18 @@ class StudentFrame(QWidget):
         self.clear_search_button.clicked.connect(self.refresh_data)
         search_layout.addWidget(self.clear_search_button)
 
-        columns = (*Student.row(by_id=True),)
-        self.tree = QTreeWidget()
-        self.tree.setColumnCount(len(columns))
-        self.tree.setHeaderLabels(["Student ID", "Name", "Age", "Email"])
+        self.model = EntityTableModel(["Student ID", "Name", "Age", "Email"], dm.iter_students, "student_id",
+                                      lambda student: student.to_row(by_id=True), self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setRootIsDecorated(False)
+        self.tree.setUniformRowHeights(True)
+        # several students can be selected to register them for a course together
+        self.tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
         self.tree.header().setStretchLastSection(True)
         main_layout.addWidget(self.tree)
-        self.tree.itemSelectionChanged.connect(self.on_student_select)
+        self.tree.selectionModel().selectionChanged.connect(self.on_student_select)
 
         details_container_layout = QHBoxLayout()
         main_layout.addLayout(details_container_layout)
@@ -131,19 +135,15 @@ class StudentFrame(QWidget):
 
         Populates the student tree and the course registration dropdown.
         If a `student_list` is provided (e.g., from a search), it uses
-        that list; otherwise, it fetches all students.
+        that list; otherwise, all students are shown, fetched page by page
+        as the tree is scrolled.
 
         :param student_list: An optional list of Student objects to display.
         :type student_list: list, optional
         """
         if student_list is None:
             self.search_entry.clear()
-        self.tree.clear()
-        students_to_display = student_list if student_list is not None else dm.get_students()
-
-        for student in students_to_display:
-            item = QTreeWidgetItem([str(val) for val in student.to_row(by_id=True)])
-            self.tree.addTopLevelItem(item)
+        self.model.reset(student_list)
 
         self.course_combobox.clear()
         self.course_map = {f"{c.course_name} ({c.course_id})": c for c in dm.get_courses()}
@@ -154,33 +154,31 @@ class StudentFrame(QWidget):
         """
         Filters the student tree based on the search query.
 
-        The search is case-insensitive and matches against student name and ID.
+        The search is case-insensitive and matches against student name, ID, and email.
         """
         query = self.search_entry.text().strip().lower()
         if not query:
             self.refresh_data()
             return
-        all_students = dm.get_students()
-        filtered = [s for s in all_students if query in s.name.lower() or query in s.student_id]
+        filtered = dm.search_students(query)
         if not filtered:
             QMessageBox.information(self, "No Results", "No students found matching search query.")
         self.refresh_data(student_list=filtered)
         self.controller.update_status(f"Found {len(filtered)} students matching '{query}'.")
 
-    def on_student_select(self):
+    def on_student_select(self, *_):
         """
         Handles the event of a student being selected in the tree.
 
         Populates the detail form with student data, switches to "edit mode",
         and updates the registered courses view.
         """
-        selected_items = self.tree.selectedItems()
-        if not selected_items: return
-        item = selected_items[0]
-        student_id, name, age, email = [item.text(i) for i in range(4)]
+        selected_rows = self.tree.selectionModel().selectedRows()
+        if not selected_rows: return
+        student_id, name, age, email = self.model.object_at(selected_rows[0].row()).to_row(by_id=True)
         self.clear_form()
         self.name_entry.setText(name)
-        self.age_entry.setText(age)
+        self.age_entry.setText(str(age))
         self.email_entry.setText(email)
         self.id_entry.setText(student_id)
         self.id_entry.setEnabled(False)
@@ -251,7 +249,11 @@ class StudentFrame(QWidget):
 
         QMessageBox.information(self, "Success", f"Student with ID '{student_id}' added successfully.")
         self.controller.update_status(f"Student {name} added.")
-        self.refresh_data()
+        if self.model.filtered:
+            self.refresh_data()
+        else:
+            self.model.insert_object(dm.get_student(student_id))
+            self.clear_form()
 
     def save_changes(self):
         """
@@ -295,7 +297,8 @@ class StudentFrame(QWidget):
 
         QMessageBox.information(self, "Success", f"Student with ID '{self.selected_student_id}' updated successfully.")
         self.controller.update_status(f"Student {name} updated.")
-        self.refresh_data()
+        self.model.update_object(self.selected_student_id)
+        self.clear_form()
 
     def delete_student(self):
         """
@@ -314,13 +317,19 @@ class StudentFrame(QWidget):
                 return
             self.controller.update_status(f"Student {self.selected_student_id} deleted successfully.")
             QMessageBox.information(self, "Success", "Student deleted.")
-            self.refresh_data()
+            self.model.remove_object(self.selected_student_id)
+            self.clear_form()
 
     def register_for_course(self):
         """
-        Registers the selected student for the selected course.
+        Registers the selected students for the selected course.
+
+        Every student selected in the tree is enrolled in one batch; students
+        already registered for the course are skipped.
         """
-        if not self.selected_student_id:
+        student_ids = [self.model.object_at(index.row()).student_id
+                       for index in self.tree.selectionModel().selectedRows()]
+        if not self.selected_student_id or not student_ids:
             QMessageBox.warning(self, "Selection Error", "Please select a student first.")
             return
         selected_course_str = self.course_combobox.currentText()
@@ -328,16 +337,28 @@ class StudentFrame(QWidget):
             QMessageBox.warning(self, "Selection Error", "Please select a course to register.")
             return
 
-        student = dm.get_student(self.selected_student_id)
         course = self.course_map.get(selected_course_str)
+        if len(student_ids) == 1:
+            student = dm.get_student(student_ids[0])
+            if course.course_id in student.registered_courses:
+                QMessageBox.warning(self, "Registration Error",
+                                    f"{student.name} is already registered for this course.")
+                return
 
-        if course.course_id in {c.course_id for c in student.registered_courses}:
-            QMessageBox.warning(self, "Registration Error", f"{student.name} is already registered for this course.")
+        try:
+            added = dm.enroll_students(course.course_id, student_ids)
+        except DataError as e:
+            QMessageBox.critical(self, "Registration Error", str(e))
             return
 
-        dm.enroll_student(student.student_id, course.course_id)
-        self.controller.update_status(f"Registered {student.name} for {course.course_name}.")
-        QMessageBox.information(self, "Success", "Student registered successfully.")
+        if len(student_ids) == 1:
+            self.controller.update_status(f"Registered {student.name} for {course.course_name}.")
+            QMessageBox.information(self, "Success", "Student registered successfully.")
+        else:
+            skipped = len(student_ids) - added
+            self.controller.update_status(f"Registered {added} students for {course.course_name}.")
+            QMessageBox.information(self, "Success", f"{added} students registered successfully."
+                                    + (f" {skipped} were already registered." if skipped else ""))
         self.course_combobox.setCurrentIndex(0)
         self.update_registered_courses_view()
 
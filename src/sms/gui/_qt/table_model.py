@@ -0,0 +1,214 @@
+"""
+Lazily loaded table model for the entity views.
+
+This module contains the EntityTableModel class, a QAbstractTableModel that
+presents students, instructors, or courses to a view. Rows are fetched from
+the data manager one page at a time as the view scrolls, and edits are
+applied as single-row insertions, removals, and updates instead of
+rebuilding the whole table.
+
+"""
+from bisect import bisect_left
+from typing import Callable
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from ...data.dm.interface import PAGE_SIZE
+
+
+class EntityTableModel(QAbstractTableModel):
+    """
+    A table model over the students, instructors, or courses of the data manager.
+
+    The model shows either every object, loaded page by page in ID order through
+    one of the data manager's `iter_*` methods, or a fixed list of objects (e.g.,
+    search results).
+    """
+
+    def __init__(self, headers: list[str], fetch_page: Callable, key: str, to_row: Callable, parent=None):
+        """
+        Constructor for EntityTableModel.
+
+        :param headers: The column headers.
+        :type headers: list[str]
+        :param fetch_page: The data manager's paginated getter (e.g., `dm.iter_students`).
+        :type fetch_page: Callable[[str | None, int], list]
+        :param key: The name of the attribute holding each object's ID.
+        :type key: str
+        :param to_row: Maps an object to its column values.
+        :type to_row: Callable[[object], list]
+        :param parent: The parent object.
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.headers = headers
+        self.fetch_page = fetch_page
+        self.key = key
+        self.to_row = to_row
+        self.filtered = False
+        self._objects = []
+        self._ids = []
+        self._exhausted = False
+
+    def reset(self, objects: list = None):
+        """
+        Discards the loaded rows and starts over.
+
+        :param objects: A fixed list of objects to show. If omitted, all objects are shown,
+                        fetched lazily as the view needs them.
+        :type objects: list, optional
+        """
+        self.beginResetModel()
+        self.filtered = objects is not None
+        self._objects = list(objects) if self.filtered else []
+        self._ids = [getattr(obj, self.key) for obj in self._objects]
+        self._exhausted = self.filtered
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """
+        Returns the number of loaded rows.
+
+        :param parent: The parent index; only the invalid root index has rows.
+        :type parent: QModelIndex
+        :return: The number of rows.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else len(self._objects)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """
+        Returns the number of columns.
+
+        :param parent: The parent index; only the invalid root index has columns.
+        :type parent: QModelIndex
+        :return: The number of columns.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        """
+        Returns the text of a cell.
+
+        :param index: The cell's index.
+        :type index: QModelIndex
+        :param role: The requested data role; only the display role is provided.
+        :return: The cell's text, or None.
+        """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return str(self.to_row(self._objects[index.row()])[index.column()])
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        """
+        Returns the text of a column header.
+
+        :param section: The column number.
+        :type section: int
+        :param orientation: The header's orientation; only horizontal headers are provided.
+        :param role: The requested data role; only the display role is provided.
+        :return: The header's text, or None.
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        """
+        Reports whether more rows can be loaded.
+
+        :param parent: The parent index.
+        :type parent: QModelIndex
+        :return: True if the last page has not been fetched yet.
+        :rtype: bool
+        """
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        """
+        Loads the next page of rows from the data manager.
+
+        :param parent: The parent index.
+        :type parent: QModelIndex
+        """
+        if parent.isValid() or self._exhausted:
+            return
+        page = self.fetch_page(self._ids[-1] if self._ids else None, PAGE_SIZE)
+        self._exhausted = len(page) < PAGE_SIZE
+        if not page:
+            return
+        first = len(self._objects)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._objects.extend(page)
+        self._ids.extend(getattr(obj, self.key) for obj in page)
+        self.endInsertRows()
+
+    def _row_of(self, key: str) -> int:
+        """
+        Finds the row of a loaded object.
+
+        :param key: The object's ID.
+        :type key: str
+        :return: The row number, or -1 if the object is not loaded.
+        :rtype: int
+        """
+        if self.filtered:
+            return self._ids.index(key) if key in self._ids else -1
+        row = bisect_left(self._ids, key)
+        return row if row < len(self._ids) and self._ids[row] == key else -1
+
+    def object_at(self, row: int):
+        """
+        Returns the object shown in a row.
+
+        :param row: The row number.
+        :type row: int
+        :return: The object.
+        """
+        return self._objects[row]
+
+    def insert_object(self, obj):
+        """
+        Shows a newly added object.
+
+        When all objects are shown, the object is inserted at its place in ID
+        order, unless that place is past the loaded rows, in which case it will
+        be loaded with its page. When a fixed list is shown, it is appended.
+
+        :param obj: The new object.
+        """
+        key = getattr(obj, self.key)
+        row = len(self._ids) if self.filtered else bisect_left(self._ids, key)
+        if row == len(self._ids) and not self._exhausted:
+            return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._objects.insert(row, obj)
+        self._ids.insert(row, key)
+        self.endInsertRows()
+
+    def update_object(self, key: str):
+        """
+        Redraws the row of an object whose fields have changed.
+
+        :param key: The object's ID.
+        :type key: str
+        """
+        row = self._row_of(key)
+        if row >= 0:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.headers) - 1))
+
+    def remove_object(self, key: str):
+        """
+        Removes the row of a deleted object.
+
+        :param key: The object's ID.
+        :type key: str
+        """
+        row = self._row_of(key)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._objects[row]
+        del self._ids[row]
+        self.endRemoveRows()
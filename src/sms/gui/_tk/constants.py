@@ -8,3 +8,7 @@ TITLE_FONT = ("Verdana", 20)
 """Font style for main titles or headers."""
 LABEL_FONT = ("Segoe UI", 12)
 """Default font style for labels, buttons, and other standard widgets."""
+INSERT_CHUNK_SIZE = 500
+"""Number of rows inserted into a treeview per pass of the event loop when filling it."""
+BACKUP_POLL_INTERVAL = 100
+"""Milliseconds between checks for progress of a database backup running in the background."""
@@ -8,6 +8,7 @@ for courses.
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from .tree_sync import TreeviewSync
 from ...data.data_manager import DataError
 from ...data.data_manager import data_manager as dm
 from ...models.course import Course
@@ -65,6 +66,7 @@ class CourseFrame(ttk.Frame):
         self.tree.column("instructor_id", width=120)
         self.tree.grid(row=0, column=0, sticky=tk.NSEW)
         self.tree.bind("<<TreeviewSelect>>", self.on_course_select)
+        self.tree_sync = TreeviewSync(self.tree, "course_id", lambda course: course.to_row())
         scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.tree.yview)
         self.tree.configure(yscroll=scrollbar.set)
         scrollbar.grid(row=0, column=1, sticky=tk.NS)
@@ -111,18 +113,17 @@ class CourseFrame(ttk.Frame):
         """
         Refreshes the course treeview with current data.
 
-        If a `course_list` is provided, it displays only those courses;
-        otherwise, it fetches all courses from the data manager. It also
-        refreshes the instructor dropdown list.
+        Only the rows that changed are touched. If a `course_list` is
+        provided, it displays only those courses; otherwise, it fetches all
+        courses from the data manager. It also refreshes the instructor
+        dropdown list.
 
         :param course_list: An optional list of courses to display.
         :type course_list: list[Course], optional
         """
         if course_list is None: self.search_entry.delete(0, tk.END)
-        for item in self.tree.get_children(): self.tree.delete(item)
         courses_to_display = course_list if course_list is not None else dm.get_courses()
-        for course in courses_to_display:
-            self.tree.insert("", tk.END, values=course.to_row())
+        self.tree_sync.render(courses_to_display)
 
         self.instructor_map = {f"{inst.name} ({inst.instructor_id})": inst for inst in dm.get_instructors()}
         self.instructor_combobox['values'] = list(self.instructor_map.keys())
@@ -135,8 +136,7 @@ class CourseFrame(ttk.Frame):
         if not query:
             self.refresh_data()
             return
-        all_courses = dm.get_courses()
-        filtered = [c for c in all_courses if query in c.course_name.lower() or query in c.course_id.lower()]
+        filtered = dm.search_courses(query)
         if not filtered: messagebox.showinfo("No Results", "No courses found.")
         self.refresh_data(course_list=filtered)
         self.controller.update_status(f"Found {len(filtered)} courses matching '{query}'.")
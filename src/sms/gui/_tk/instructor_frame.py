@@ -8,6 +8,7 @@ for instructors.
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from .tree_sync import TreeviewSync
 from ...data.data_manager import DataError
 from ...data.data_manager import data_manager as dm
 from ...models.instructor import Instructor
@@ -65,6 +66,7 @@ class InstructorFrame(ttk.Frame):
         self.tree.column("age", width=50, anchor=tk.CENTER)
         self.tree.grid(row=0, column=0, sticky=tk.NSEW)
         self.tree.bind("<<TreeviewSelect>>", self.on_instructor_select)
+        self.tree_sync = TreeviewSync(self.tree, "instructor_id", lambda instructor: instructor.to_row(by_id=True))
         scrollbar = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.tree.yview)
         self.tree.configure(yscroll=scrollbar.set)
         scrollbar.grid(row=0, column=1, sticky=tk.NS)
@@ -115,17 +117,16 @@ class InstructorFrame(ttk.Frame):
         """
         Refreshes the instructor treeview with current data.
 
-        If an `instructor_list` is provided, it displays only those instructors;
-        otherwise, it fetches all instructors from the data manager.
+        Only the rows that changed are touched. If an `instructor_list` is
+        provided, it displays only those instructors; otherwise, it fetches all
+        instructors from the data manager.
 
         :param instructor_list: An optional list of instructors to display.
         :type instructor_list: list[Instructor], optional
         """
         if instructor_list is None: self.search_entry.delete(0, tk.END)
-        for item in self.tree.get_children(): self.tree.delete(item)
         instructors_to_display = instructor_list if instructor_list is not None else dm.get_instructors()
-        for instructor in instructors_to_display:
-            self.tree.insert("", tk.END, values=instructor.to_row(by_id=True))
+        self.tree_sync.render(instructors_to_display)
 
     def search_instructors(self):
         """
@@ -135,8 +136,7 @@ class InstructorFrame(ttk.Frame):
         if not query:
             self.refresh_data()
             return
-        all_instructors = dm.get_instructors()
-        filtered = [inst for inst in all_instructors if query in inst.name.lower() or query in inst.instructor_id]
+        filtered = dm.search_instructors(query)
         if not filtered: messagebox.showinfo("No Results", "No instructors found.")
         self.refresh_data(instructor_list=filtered)
         self.controller.update_status(f"Found {len(filtered)} instructors matching '{query}'.")
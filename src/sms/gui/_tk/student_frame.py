@@ -8,6 +8,7 @@ for students, as well as handling course registrations.
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from .tree_sync import TreeviewSync
 from ...data.data_manager import DataError
 from ...data.data_manager import data_manager as dm
 from ...models.student import Student
@@ -73,6 +74,7 @@ class StudentFrame(ttk.Frame):
         scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
         self.tree.configure(yscroll=scrollbar.set)
         self.tree.bind("<<TreeviewSelect>>", self.on_student_select)
+        self.tree_sync = TreeviewSync(self.tree, "student_id", lambda student: student.to_row(by_id=True))
 
         details_container = ttk.Frame(self)
         details_container.grid(row=2, column=0, sticky=tk.EW, padx=10, pady=10)
@@ -137,9 +139,10 @@ class StudentFrame(ttk.Frame):
         """
         Refreshes the student treeview with current data.
 
-        Clears and repopulates the main student list. If a `student_list` is
-        provided, it displays only those students; otherwise, it fetches all
-        students from the data manager. It also refreshes the course dropdown.
+        Updates the main student list in place, touching only the rows that
+        changed. If a `student_list` is provided, it displays only those
+        students; otherwise, it fetches all students from the data manager.
+        It also refreshes the course dropdown.
 
         :param student_list: An optional list of students to display.
         :type student_list: list[Student], optional
@@ -147,13 +150,8 @@ class StudentFrame(ttk.Frame):
         if student_list is None:
             self.search_entry.delete(0, tk.END)
 
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
         students_to_display = student_list if student_list is not None else dm.get_students()
-
-        for student in students_to_display:
-            self.tree.insert("", tk.END, values=(*student.to_row(by_id=True),))
+        self.tree_sync.render(students_to_display)
 
         self.course_map = {f"{c.course_name} ({c.course_id})": c for c in dm.get_courses()}
         self.course_combobox['values'] = list(self.course_map.keys())
@@ -167,9 +165,7 @@ class StudentFrame(ttk.Frame):
             self.refresh_data()
             return
 
-        all_students = dm.get_students()
-        filtered_students = [student for student in all_students if
-                             query in student.name.lower() or query in student.student_id]
+        filtered_students = dm.search_students(query)
 
         if not filtered_students:
             messagebox.showinfo("No Results", "No students found matching search query.")
@@ -347,9 +343,13 @@ class StudentFrame(ttk.Frame):
         """
         Handles the "Register" button click.
 
-        Enrolls the selected student in the selected course from the dropdown.
+        Enrolls every student selected in the treeview in the selected course
+        from the dropdown, in one batch. Students already registered for the
+        course are skipped.
         """
-        if not self.selected_student_id:
+        # the item IDs of the treeview are the student IDs
+        student_ids = list(self.tree.selection())
+        if not self.selected_student_id or not student_ids:
             messagebox.showwarning("Selection Error", "Please select a student first.")
             return
 
@@ -358,16 +358,27 @@ class StudentFrame(ttk.Frame):
             messagebox.showwarning("Selection Error", "Please select a course to register.")
             return
 
-        student = dm.get_student(self.selected_student_id)
         course = self.course_map.get(selected_course_str)
+        if len(student_ids) == 1:
+            student = dm.get_student(student_ids[0])
+            if course.course_id in student.registered_courses:
+                messagebox.showwarning("Registration Error", f"{student.name} is already registered for this course.")
+                return
 
-        if course.course_id in {c.course_id for c in student.registered_courses}:
-            messagebox.showwarning("Registration Error", f"{student.name} is already registered for this course.")
+        try:
+            added = dm.enroll_students(course.course_id, student_ids)
+        except DataError as e:
+            messagebox.showerror("Registration Error", str(e))
             return
 
-        dm.enroll_student(student.student_id, course.course_id)
-        self.controller.update_status(f"Registered {student.name} for {course.course_name}.")
-        messagebox.showinfo("Success", "Student registered successfully.")
+        if len(student_ids) == 1:
+            self.controller.update_status(f"Registered {student.name} for {course.course_name}.")
+            messagebox.showinfo("Success", "Student registered successfully.")
+        else:
+            skipped = len(student_ids) - added
+            self.controller.update_status(f"Registered {added} students for {course.course_name}.")
+            messagebox.showinfo("Success", f"{added} students registered successfully."
+                                + (f" {skipped} were already registered." if skipped else ""))
         self.course_combobox.set('')
         self.update_registered_courses_view()
 
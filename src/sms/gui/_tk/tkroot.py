@@ -5,7 +5,9 @@ This module contains the `SmsGUITk` class, which constructs the root window,
 menu bar, status bar, and the tabbed notebook interface that holds the
 student, instructor, and course management frames.
 """
-import shutil
+import os
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
@@ -14,6 +16,7 @@ from .course_frame import CourseFrame
 from .instructor_frame import InstructorFrame
 from .student_frame import StudentFrame
 from ...data.data_manager import data_manager as dm
+from ...data.db.backup import GZIP_SUFFIX, backup_database
 from config import ENABLE_DATABASE
 
 class SmsGUITk:
@@ -30,6 +33,7 @@ class SmsGUITk:
     :ivar instructor_tab: The frame for instructor management.
     :ivar course_tab: The frame for course management.
     :ivar status_bar: The label at the bottom of the window for status messages.
+    :ivar backup_thread: The thread running a database backup, or None.
     """
     def __init__(self, root):
         """
@@ -50,6 +54,8 @@ class SmsGUITk:
 
         file_menu = tk.Menu(self.menu_bar, tearoff=0)
         self.menu_bar.add_cascade(label="File", menu=file_menu)
+        self.file_menu = file_menu
+        self.backup_thread = None
 
         load_menu = tk.Menu(file_menu, tearoff=0)
         save_menu = tk.Menu(file_menu, tearoff=0)
@@ -114,10 +120,13 @@ class SmsGUITk:
         """
         Handles the 'Backup Database' menu command.
 
-        Opens a save dialog to allow the user to copy the database file to a
-        new location. This menu option is only available if database mode is enabled.
+        Opens a save dialog and starts a thread copying the live database to the
+        chosen location. Choosing a `.gz` file writes a compressed backup;
+        choosing an existing backup updates it with only the changed pages. The
+        window stays usable while the backup runs, and its progress is shown on
+        the status bar. This menu option is only available if database mode is enabled.
         """
-        if ENABLE_DATABASE:
+        if ENABLE_DATABASE and not self.backup_thread:
             source_db_path = dm.get_db_path()
             if not source_db_path:
                 messagebox.showerror("Backup Error", "Could not determine the source database path.")
@@ -125,7 +134,8 @@ class SmsGUITk:
 
             backup_path = filedialog.asksaveasfilename(
                 defaultextension=".db",
-                filetypes=[("SQLite Database", "*.db"), ("All Files", "*.*")],
+                filetypes=[("SQLite Database", "*.db"), ("Compressed Database", f"*.db{GZIP_SUFFIX}"),
+                           ("All Files", "*.*")],
                 title="Backup Database As"
             )
 
@@ -133,13 +143,71 @@ class SmsGUITk:
                 self.update_status("Database backup cancelled.")
                 return
 
-            try:
-                shutil.copy(source_db_path, backup_path)
-                self.update_status(f"Database successfully backed up to {backup_path}")
-                messagebox.showinfo("Backup Successful", "The database has been backed up successfully.")
-            except Exception as e:
-                self.update_status("Database backup failed.")
-                messagebox.showerror("Backup Error", f"An error occurred during backup:\n{e}")
+            compress = backup_path.endswith(GZIP_SUFFIX)
+            incremental = not compress and os.path.isfile(backup_path)
+            events = queue.Queue()
+            self.backup_thread = threading.Thread(
+                target=self._run_backup, args=(source_db_path, backup_path, compress, incremental, events))
+            self.file_menu.entryconfig("Backup Database...", state=tk.DISABLED)
+            self.update_status("Backing up database...")
+            self.backup_thread.start()
+            self.root.after(BACKUP_POLL_INTERVAL, self._poll_backup, events, backup_path, incremental)
+
+    @staticmethod
+    def _run_backup(source_path, backup_path, compress, incremental, events):
+        """
+        Runs a database backup. Called in the backup thread.
+
+        Tkinter widgets must only be touched from the GUI thread, so the outcome
+        is posted to a queue for `_poll_backup` to pick up.
+
+        :param source_path: The path of the database to back up.
+        :param backup_path: The path of the backup file.
+        :param compress: Whether to gzip the backup.
+        :param incremental: Whether to update an existing backup with only the changed pages.
+        :param events: The queue receiving ("progress", copied, total), ("done", pages), or ("error", message).
+        :type events: queue.Queue
+        """
+        try:
+            pages = backup_database(source_path, backup_path, compress=compress, incremental=incremental,
+                                    progress=lambda copied, total: events.put(("progress", copied, total)))
+        except Exception as e:
+            events.put(("error", str(e)))
+            return
+        events.put(("done", pages))
+
+    def _poll_backup(self, events, backup_path, incremental):
+        """
+        Shows the progress of the running backup and reports its outcome once it ends.
+
+        Reschedules itself every `BACKUP_POLL_INTERVAL` milliseconds until the backup ends.
+
+        :param events: The queue the backup thread posts to.
+        :type events: queue.Queue
+        :param backup_path: The path of the backup file.
+        :param incremental: Whether the backup updates an existing one.
+        """
+        try:
+            while True:
+                event = events.get_nowait()
+                if event[0] == "progress":
+                    _, copied, total = event
+                    self.update_status(f"Backing up database... {copied * 100 // max(total, 1)}%")
+                    continue
+                self.backup_thread = None
+                self.file_menu.entryconfig("Backup Database...", state=tk.NORMAL)
+                if event[0] == "done":
+                    msg = f"Database successfully backed up to {backup_path}"
+                    if incremental:
+                        msg += f" ({event[1]} changed pages written)"
+                    self.update_status(msg)
+                    messagebox.showinfo("Backup Successful", "The database has been backed up successfully.")
+                else:
+                    self.update_status("Database backup failed.")
+                    messagebox.showerror("Backup Error", f"An error occurred during backup:\n{event[1]}")
+                return
+        except queue.Empty:
+            self.root.after(BACKUP_POLL_INTERVAL, self._poll_backup, events, backup_path, incremental)
 
 
     def save_to_json(self):
@@ -0,0 +1,130 @@
+"""
+Keeps a Treeview in sync with a list of objects.
+
+This module contains the `TreeviewSync` class, which renders students,
+instructors, or courses into a `ttk.Treeview` by applying only the
+differences from the previous render, so refreshing an unchanged list costs
+no widget operations at all.
+"""
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable
+
+from .constants import INSERT_CHUNK_SIZE
+
+
+class TreeviewSync:
+    """
+    Renders a list of objects into a Treeview, one row per object.
+
+    Each row's item ID is the object's ID, and the values last written to each
+    row are remembered, so a render only inserts, updates, deletes, and
+    reorders the rows that differ. Large batches of new rows are inserted in
+    chunks scheduled with `after`, keeping the window responsive while they
+    load.
+    """
+
+    def __init__(self, tree: ttk.Treeview, key: str, to_row: Callable, chunk_size: int = INSERT_CHUNK_SIZE):
+        """
+        Initializes the TreeviewSync.
+
+        :param tree: The treeview to render into.
+        :type tree: ttk.Treeview
+        :param key: The name of the attribute holding each object's ID.
+        :type key: str
+        :param to_row: Maps an object to its column values.
+        :type to_row: Callable[[object], list]
+        :param chunk_size: The number of rows inserted per pass of the event loop.
+        :type chunk_size: int, optional
+        """
+        self.tree = tree
+        self.key = key
+        self.to_row = to_row
+        self.chunk_size = chunk_size
+        self._rendered: dict[str, tuple] = {}
+        self._job = None
+
+    def render(self, objects):
+        """
+        Makes the treeview show exactly the given objects, in order.
+
+        Deletions and updates are applied immediately. New rows are inserted
+        right away if there are few of them, or otherwise in chunks; any chunks
+        still pending from a previous render are cancelled.
+
+        :param objects: The objects to show.
+        :type objects: Iterable
+        """
+        if self._job is not None:
+            self.tree.after_cancel(self._job)
+            self._job = None
+
+        rows = {getattr(obj, self.key): tuple(str(value) for value in self.to_row(obj)) for obj in objects}
+
+        removed = [iid for iid in self._rendered if iid not in rows]
+        if removed:
+            self.tree.delete(*removed)
+            for iid in removed:
+                del self._rendered[iid]
+
+        added = []
+        for iid, values in rows.items():
+            old = self._rendered.get(iid)
+            if old is None:
+                added.append(iid)
+            elif old != values:
+                self.tree.item(iid, values=values)
+                self._rendered[iid] = values
+
+        order = list(rows)
+        if len(added) > self.chunk_size:
+            self._insert_chunk(rows, added, 0, order)
+        else:
+            self._insert(rows, added)
+            self._reorder(order)
+
+    def _insert(self, rows: dict[str, tuple], iids: list[str]):
+        """
+        Appends rows to the treeview.
+
+        :param rows: The values of every row to show, by item ID.
+        :type rows: dict[str, tuple]
+        :param iids: The item IDs of the rows to append.
+        :type iids: list[str]
+        """
+        for iid in iids:
+            values = rows[iid]
+            self.tree.insert("", tk.END, iid=iid, values=values)
+            self._rendered[iid] = values
+
+    def _insert_chunk(self, rows: dict[str, tuple], iids: list[str], start: int, order: list[str]):
+        """
+        Appends one chunk of rows and schedules the next one.
+
+        :param rows: The values of every row to show, by item ID.
+        :type rows: dict[str, tuple]
+        :param iids: The item IDs of all the rows to append.
+        :type iids: list[str]
+        :param start: The position in `iids` of the first row of this chunk.
+        :type start: int
+        :param order: The final order of the rows.
+        :type order: list[str]
+        """
+        end = start + self.chunk_size
+        self._insert(rows, iids[start:end])
+        if end < len(iids):
+            self._job = self.tree.after(1, self._insert_chunk, rows, iids, end, order)
+        else:
+            self._job = None
+            self._reorder(order)
+
+    def _reorder(self, order: list[str]):
+        """
+        Puts the rows in the given order, if they are not in it already.
+
+        :param order: The item IDs of all the rows, in order.
+        :type order: list[str]
+        """
+        if list(self._rendered) != order:
+            self.tree.set_children("", *order)
+            self._rendered = {iid: self._rendered[iid] for iid in order}
@@ -8,6 +8,7 @@ and a list of enrolled students.
 from __future__ import annotations
 
 from .instructor import Instructor
+from .relation import RelationSet
 from .student import Student
 from ..utils.validator import check_course_id, check_course_name
 
@@ -25,9 +26,10 @@ class Course:
     :vartype course_name: str
     :ivar instructor: The `Instructor` object assigned to the course.
     :vartype instructor: Instructor
-    :ivar enrolled_students: A list of `Student` objects enrolled in the course.
-    :vartype enrolled_students: list[Student]
+    :ivar enrolled_students: The `Student` objects enrolled in the course, indexed by student ID.
+    :vartype enrolled_students: RelationSet[Student]
     """
+    __slots__ = ("course_id", "course_name", "instructor", "enrolled_students")
 
     def __init__(self, course_id: str, course_name: str, instructor: Instructor):
         """
@@ -44,21 +46,51 @@ class Course:
         :type instructor: Instructor
         :raises ValueError: If the course ID or name is invalid.
         """
-        if not check_course_id(course_id.strip()):
+        course_id = course_id.strip()
+        if not check_course_id(course_id):
             raise ValueError("Invalid Course ID.")
-        self.course_id: str = course_id.strip().upper()
+        self.course_id: str = course_id.upper()
         if not check_course_name(course_name.strip()):
             raise ValueError("Invalid Course Name.")
         self.course_name: str = course_name
         self.instructor: Instructor = instructor
-        self.enrolled_students: list[Student] = []
+        self.enrolled_students: RelationSet[Student] = RelationSet("student_id")
 
         # assign course to instructor after creation
         self.instructor.assign_course(self)
 
+    @classmethod
+    def from_trusted(cls, course_id: str, course_name: str, instructor: Instructor, assign: bool = True) -> Course:
+        """
+        Creates a Course from values that are known to be valid, skipping validation.
+
+        Intended for records read back from the application's own data store.
+        As with the constructor, the course is assigned to the instructor, unless
+        `assign` is False (e.g., when the instructor's courses are loaded separately).
+
+        :param course_id: The unique ID for the course.
+        :type course_id: str
+        :param course_name: The name of the course.
+        :type course_name: str
+        :param instructor: The `Instructor` object for the course.
+        :type instructor: Instructor
+        :param assign: Whether to add the course to the instructor's assigned courses. Defaults to True.
+        :type assign: bool, optional
+        :return: The new Course object.
+        :rtype: Course
+        """
+        course = cls.__new__(cls)
+        course.course_id = course_id
+        course.course_name = course_name
+        course.instructor = instructor
+        course.enrolled_students = RelationSet("student_id")
+        if assign:
+            instructor.assign_course(course)
+        return course
+
     def add_student(self, student: Student):
         """
-        Adds a student to the course's enrollment list.
+        Adds a student to the course's enrolled students.
 
         This method is idempotent; it will not add a student if they are
         already enrolled.
@@ -66,8 +98,7 @@ class Course:
         :param student: The `Student` object to enroll.
         :type student: Student
         """
-        if student.student_id not in {s.student_id for s in self.enrolled_students}:
-            self.enrolled_students.append(student)
+        self.enrolled_students.add(student)
 
     def update(self, **kwargs):
         """
@@ -82,12 +113,17 @@ class Course:
         instructor = kwargs.get("instructor")
 
         if course_name:
-            if not check_course_name(course_name.strip()):
+            course_name = course_name.strip()
+            if not check_course_name(course_name):
                 raise ValueError("Invalid Course Name.")
-            self.course_name = course_name.strip()
+            self.course_name = course_name
 
-        if instructor:
+        if instructor and instructor is not self.instructor:
+            # move the course over to the new instructor's assignments
+            if self in self.instructor.assigned_courses:
+                self.instructor.assigned_courses.remove(self)
             self.instructor = instructor
+            self.instructor.assign_course(self)
 
     def __repr__(self) -> str:
         """
@@ -140,3 +176,12 @@ class Course:
         :rtype: list[str]
         """
         return [self.course_id, self.course_name, self.instructor.instructor_id]
+
+    def search_fields(self) -> tuple[str, ...]:
+        """
+        Gets the text fields that searches for courses match against.
+
+        :return: The course's ID and name.
+        :rtype: tuple[str, ...]
+        """
+        return self.course_id, self.course_name
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .person import Person
+from .relation import RelationSet
 from ..utils.validator import check_id
 
 # prevent circular dependency loop by using
@@ -28,9 +29,11 @@ class Instructor(Person):
 
     :ivar instructor_id: The instructor's unique 9-digit ID.
     :vartype instructor_id: str
-    :ivar assigned_courses: A list of `Course` objects the instructor teaches.
-    :vartype assigned_courses: list[Course]
+    :ivar assigned_courses: The `Course` objects the instructor teaches, indexed by course ID.
+    :vartype assigned_courses: RelationSet[Course]
     """
+    __slots__ = ("instructor_id", "assigned_courses")
+
     def __init__(self, name: str, age: int, email: str, instructor_id: str):
         """
         Initializes an Instructor object.
@@ -52,7 +55,28 @@ class Instructor(Person):
         # manually annotating type between quotes
         # cool python feature btw
         # requires __future__ import
-        self.assigned_courses: list["Course"] = []
+        self.assigned_courses: RelationSet["Course"] = RelationSet("course_id")
+
+    @classmethod
+    def from_trusted(cls, name: str, age: int, email: str, instructor_id: str) -> Instructor:
+        """
+        Creates an Instructor from values that are known to be valid, skipping validation.
+
+        :param name: The instructor's full name.
+        :type name: str
+        :param age: The instructor's age in years.
+        :type age: int
+        :param email: The instructor's email address.
+        :type email: str
+        :param instructor_id: The instructor's unique 9-digit ID.
+        :type instructor_id: str
+        :return: The new Instructor object.
+        :rtype: Instructor
+        """
+        instructor = super().from_trusted(name, age, email)
+        instructor.instructor_id = instructor_id
+        instructor.assigned_courses = RelationSet("course_id")
+        return instructor
 
     def assign_course(self, course: "Course"):
         """
@@ -63,8 +87,7 @@ class Instructor(Person):
         :param course: The `Course` object to assign.
         :type course: Course
         """
-        if course.course_id not in {c.course_id for c in self.assigned_courses}:
-            self.assigned_courses.append(course)
+        self.assigned_courses.add(course)
 
     def __repr__(self) -> str:
         """
@@ -128,3 +151,12 @@ class Instructor(Person):
         if by_id:
             return [self.instructor_id, self.name, str(self.age), self._email]
         return [self.name, str(self.age), self._email, self.instructor_id]
+
+    def search_fields(self) -> tuple[str, ...]:
+        """
+        Gets the text fields that searches for instructors match against.
+
+        :return: The instructor's ID, name, and email.
+        :rtype: tuple[str, ...]
+        """
+        return self.instructor_id, self.name, self._email
@@ -25,6 +25,9 @@ class Person:
     :ivar _email: The private email address of the person.
     :vartype _email: str
     """
+    # fixed attribute layout instead of a per-instance __dict__;
+    # keeps large hydrated rosters compact in memory
+    __slots__ = ("name", "age", "_email")
 
     def __init__(self, name: str, age: int, email: str):
         """
@@ -38,15 +41,39 @@ class Person:
         :type email: str
         :raises ValueError: If any of the provided arguments are invalid.
         """
-        if not check_name(name.strip()):
+        name = name.strip()
+        if not check_name(name):
             raise ValueError("Invalid Name.")
-        self.name: str = name.strip()
+        self.name: str = name
         if not check_age(age):
             raise ValueError("Invalid Age.")
         self.age: int = age
-        if not (em := check_email_r(email.strip()))[0]:
+        email = email.strip()
+        if not (em := check_email_r(email))[0]:
             raise ValueError("Invalid Email Address" + (f": {em[1]}" if em[1] else "."))
-        self._email: str = email.strip()
+        self._email: str = email
+
+    @classmethod
+    def from_trusted(cls, name: str, age: int, email: str):
+        """
+        Creates an object from values that are known to be valid, skipping validation.
+
+        Intended for records read back from the application's own data store,
+        which were validated when they were first written. Values are used as-is.
+
+        :param name: The person's full name.
+        :type name: str
+        :param age: The person's age in years.
+        :type age: int
+        :param email: The person's email address.
+        :type email: str
+        :return: The new object.
+        """
+        person = cls.__new__(cls)
+        person.name = name
+        person.age = age
+        person._email = email
+        return person
 
     def introduce(self):
         """Prints a brief, randomized introduction message to the console."""
@@ -59,30 +86,37 @@ class Person:
         """
         Updates the person's attributes from keyword arguments.
 
-        This method allows for partial updates. Only provided fields are changed.
+        This method allows for partial updates. Only provided fields are changed,
+        and only once they have all been validated.
 
         :param kwargs: Keyword arguments for attributes to update (e.g., name, age, email).
-        :raises ValueError: If any of the provided values are invalid.
+        :raises ValueError: If any of the provided values are invalid; nothing is changed then.
         """
         name = kwargs.get("name")
         age = kwargs.get("age")
         email = kwargs.get("email")
 
         if name:
-            if not check_name(name.strip()):
+            name = name.strip()
+            if not check_name(name):
                 raise ValueError("Invalid Name.")
-            self.name = name.strip()
 
         if age:
             age = int(age)
             if not check_age(age):
                 raise ValueError("Invalid Age.")
-            self.age = age
 
         if email:
-            if not (em := check_email_r(email.strip()))[0]:
+            email = email.strip()
+            if not (em := check_email_r(email))[0]:
                 raise ValueError("Invalid Email Address" + (f": {em[1]}" if em[1] else "."))
-            self._email = email.strip()
+
+        if name:
+            self.name = name
+        if age:
+            self.age = age
+        if email:
+            self._email = email
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,327 @@
+"""
+Defines the container used for relationships between models.
+
+This module contains the `RelationSet` class, an insertion-ordered collection
+of model objects indexed by their ID. It backs the `registered_courses`,
+`enrolled_students`, and `assigned_courses` attributes so that membership
+checks, additions, and removals take constant time instead of scanning a list.
+
+It also contains `LazyRelation`, a `RelationSet` whose items are only fetched
+from the data store when the relation is first used.
+"""
+from __future__ import annotations
+
+from threading import RLock, get_ident
+from types import MappingProxyType
+from typing import Callable, Generic, Iterable, Iterator, Mapping, TypeVar
+
+T = TypeVar("T")
+
+_NO_ITEMS: Mapping = MappingProxyType({})
+"""Shared read-only mapping used until the first item is added, so empty collections cost no dict."""
+
+_DEFAULT_LOCK = RLock()
+"""The lock of the lazy relations created without their own."""
+
+
+class RelationSet(Generic[T]):
+    """
+    An ordered, ID-indexed collection of related model objects.
+
+    Items are keyed by one of their attributes (e.g., `course_id`) and keep the
+    order in which they were added. Membership can be tested with either an
+    object or its ID; tests with an object match only that exact instance.
+
+    :ivar _key: The name of the attribute holding each item's ID.
+    :vartype _key: str
+    :ivar _items: A mapping from ID to item, in insertion order.
+    :vartype _items: dict[str, T] | Mapping[str, T]
+    """
+    __slots__ = ("_key", "_items")
+
+    def __init__(self, key: str, items: Iterable[T] = ()):
+        """
+        Initializes a RelationSet.
+
+        :param key: The name of the attribute holding each item's ID.
+        :type key: str
+        :param items: Optional items to add initially.
+        :type items: Iterable[T], optional
+        """
+        self._key: str = key
+        self._items: dict[str, T] | Mapping[str, T] = _NO_ITEMS
+        for item in items:
+            self.add(item)
+
+    @classmethod
+    def from_mapping(cls, key: str, items: dict[str, T]) -> RelationSet[T]:
+        """
+        Creates a RelationSet that takes ownership of a dict of items keyed by their IDs.
+
+        The items are not checked; the dict must map each item's ID to the item.
+        Intended for building relations in bulk from trusted records.
+
+        :param key: The name of the attribute holding each item's ID.
+        :type key: str
+        :param items: A mapping from ID to item, in the desired order. It must not be used afterward.
+        :type items: dict[str, T]
+        :return: The new RelationSet.
+        :rtype: RelationSet[T]
+        """
+        relation = cls.__new__(cls)
+        relation._key = key
+        relation._items = items or _NO_ITEMS
+        return relation
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Whether the items are in memory. Always True for a plain RelationSet.
+
+        :return: True if using the relation will not fetch anything.
+        :rtype: bool
+        """
+        return True
+
+    def copy(self) -> RelationSet[T]:
+        """
+        Creates a shallow copy holding the same items in the same order.
+
+        :return: The new RelationSet.
+        :rtype: RelationSet[T]
+        """
+        return RelationSet.from_mapping(self._key, dict(self._items))
+
+    def _id_of(self, item) -> str:
+        """
+        Gets the ID of an item, or returns the argument if it is already an ID.
+
+        :param item: An item or an ID.
+        :return: The item's ID.
+        :rtype: str
+        """
+        return item if isinstance(item, str) else getattr(item, self._key)
+
+    def add(self, item: T) -> bool:
+        """
+        Adds an item if no item with the same ID is present.
+
+        :param item: The item to add.
+        :type item: T
+        :return: True if the item was added, False if its ID was already present.
+        :rtype: bool
+        """
+        item_id = getattr(item, self._key)
+        if item_id in self._items:
+            return False
+        if self._items is _NO_ITEMS:
+            self._items = {}
+        self._items[item_id] = item
+        return True
+
+    def remove(self, item):
+        """
+        Removes an item, given either the item itself or its ID.
+
+        :param item: The item or its ID.
+        :raises ValueError: If the item is not in the collection.
+        """
+        if not self.discard(item):
+            raise ValueError(f"{self._id_of(item)!r} is not in the collection.")
+
+    def discard(self, item) -> bool:
+        """
+        Removes an item if it is present, given either the item itself or its ID.
+
+        :param item: The item or its ID.
+        :return: True if an item was removed, False otherwise.
+        :rtype: bool
+        """
+        if item not in self:
+            return False
+        del self._items[self._id_of(item)]
+        return True
+
+    def get(self, item_id: str, default=None):
+        """
+        Retrieves an item by its ID.
+
+        :param item_id: The ID of the item.
+        :type item_id: str
+        :param default: The value returned if no item has this ID.
+        :return: The item, or `default` if not found.
+        """
+        return self._items.get(item_id, default)
+
+    def ids(self) -> list[str]:
+        """
+        Returns the IDs of all items, in insertion order.
+
+        :return: A list of item IDs.
+        :rtype: list[str]
+        """
+        return list(self._items)
+
+    def clear(self):
+        """Removes all items."""
+        self._items = _NO_ITEMS
+
+    def __contains__(self, item) -> bool:
+        """
+        Checks membership by ID, or by identity when given an object.
+
+        :param item: An item or an ID.
+        :return: True if the item (or an item with this ID) is present.
+        :rtype: bool
+        """
+        if isinstance(item, str):
+            return item in self._items
+        return self._items.get(getattr(item, self._key, None)) is item
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates over the items in insertion order.
+
+        :return: An iterator over the items.
+        :rtype: Iterator[T]
+        """
+        return iter(self._items.values())
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items.
+
+        :return: The number of items.
+        :rtype: int
+        """
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        """
+        Provides an unambiguous string representation of the collection.
+
+        :return: A string listing the IDs of the items.
+        :rtype: str
+        """
+        return f"RelationSet({self.ids()})"
+
+
+class LazyRelation(RelationSet[T]):
+    """
+    A RelationSet that fetches its items on first use.
+
+    Any operation other than `loaded` first calls the loader, once, and keeps
+    the items it returns; from then on the relation behaves exactly like a
+    RelationSet. Items added while the loader runs (e.g., by loaded objects
+    linking back to their owner) are kept.
+
+    :ivar _loader: Returns the items, or None once they have been loaded.
+    :vartype _loader: Callable[[], Iterable[T]] | None
+    :ivar _loading: The identifier of the thread running the loader, or None when it is not running.
+    :vartype _loading: int | None
+    :ivar _lock: Held while loading, so that concurrent loads and writes do not interleave.
+    """
+    __slots__ = ("_loader", "_loading", "_lock")
+
+    def __init__(self, key: str, loader: Callable[[], Iterable[T]], lock=None):
+        """
+        Initializes a LazyRelation whose items are not loaded yet.
+
+        :param key: The name of the attribute holding each item's ID.
+        :type key: str
+        :param loader: Returns the items of the relation.
+        :type loader: Callable[[], Iterable[T]]
+        :param lock: A lock held while loading. The owner's writes should hold it as well.
+                     Defaults to a lock shared by all relations created without one.
+        :type lock: threading.RLock, optional
+        """
+        super().__init__(key)
+        self._loader = loader
+        self._loading = None
+        self._lock = lock if lock is not None else _DEFAULT_LOCK
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Whether the items have been loaded.
+
+        :return: True if using the relation will not fetch anything.
+        :rtype: bool
+        """
+        return self._loader is None
+
+    def _load(self):
+        """
+        Fetches the items if they have not been fetched yet.
+
+        The relation only counts as loaded once its items are in place. Until
+        then, other threads wait for the lock, while the loading thread itself
+        uses the relation as it stands, so that objects built by the loader can
+        link back to their owner.
+
+        :raises Exception: Whatever the loader raises; the relation then stays unloaded.
+        """
+        if self._loader is None or self._loading == get_ident():
+            return
+        with self._lock:
+            loader = self._loader
+            if loader is None:
+                return
+            self._loading = get_ident()
+            try:
+                items = {getattr(item, self._key): item for item in loader()}
+                # keep anything added re-entrantly while the loader ran
+                items.update(self._items)
+                self._items = items or self._items
+                self._loader = None
+            finally:
+                self._loading = None
+
+    def add(self, item: T) -> bool:
+        self._load()
+        return super().add(item)
+
+    def discard(self, item) -> bool:
+        self._load()
+        return super().discard(item)
+
+    def get(self, item_id: str, default=None):
+        self._load()
+        return super().get(item_id, default)
+
+    def ids(self) -> list[str]:
+        self._load()
+        return super().ids()
+
+    def copy(self) -> RelationSet[T]:
+        self._load()
+        return super().copy()
+
+    def clear(self):
+        """Removes all items, without loading them."""
+        with self._lock:
+            self._loader = None
+            super().clear()
+
+    def __contains__(self, item) -> bool:
+        self._load()
+        return super().__contains__(item)
+
+    def __iter__(self) -> Iterator[T]:
+        self._load()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._load()
+        return super().__len__()
+
+    def __repr__(self) -> str:
+        """
+        Provides an unambiguous string representation of the collection, without loading it.
+
+        :return: A string listing the IDs of the items, or noting that they are not loaded.
+        :rtype: str
+        """
+        if not self.loaded:
+            return "LazyRelation(<not loaded>)"
+        return f"LazyRelation({self.ids()})"
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .person import Person
+from .relation import RelationSet
 from ..utils.validator import check_id
 
 # prevent circular dependency loop by using
@@ -28,9 +29,11 @@ class Student(Person):
 
     :ivar student_id: The student's unique 9-digit ID.
     :vartype student_id: str
-    :ivar registered_courses: A list of `Course` objects the student is enrolled in.
-    :vartype registered_courses: list[Course]
+    :ivar registered_courses: The `Course` objects the student is enrolled in, indexed by course ID.
+    :vartype registered_courses: RelationSet[Course]
     """
+    __slots__ = ("student_id", "registered_courses")
+
     def __init__(self, name: str, age: int, email: str, student_id: str):
         """
         Initializes a Student object.
@@ -47,13 +50,35 @@ class Student(Person):
         """
         # call parent class constructor
         super().__init__(name, age, email)
-        if not check_id(student_id.strip()):
+        student_id = student_id.strip()
+        if not check_id(student_id):
             raise ValueError("Invalid Student ID.")
-        self.student_id: str = student_id.strip()
+        self.student_id: str = student_id
         # manually annotating type between quotes
         # cool python feature btw
         # requires __future__ import
-        self.registered_courses: list["Course"] = []
+        self.registered_courses: RelationSet["Course"] = RelationSet("course_id")
+
+    @classmethod
+    def from_trusted(cls, name: str, age: int, email: str, student_id: str) -> Student:
+        """
+        Creates a Student from values that are known to be valid, skipping validation.
+
+        :param name: The student's full name.
+        :type name: str
+        :param age: The student's age in years.
+        :type age: int
+        :param email: The student's email address.
+        :type email: str
+        :param student_id: The student's unique 9-digit ID.
+        :type student_id: str
+        :return: The new Student object.
+        :rtype: Student
+        """
+        student = super().from_trusted(name, age, email)
+        student.student_id = student_id
+        student.registered_courses = RelationSet("course_id")
+        return student
 
     def register_course(self, course: "Course"):
         """
@@ -66,8 +91,7 @@ class Student(Person):
         :param course: The `Course` object to register for.
         :type course: Course
         """
-        if course.course_id not in {c.course_id for c in self.registered_courses}:
-            self.registered_courses.append(course)
+        if self.registered_courses.add(course):
             # register student in course
             course.add_student(self)
 
@@ -133,3 +157,12 @@ class Student(Person):
         if by_id:
             return [self.student_id, self.name, str(self.age), self._email]
         return [self.name, str(self.age), self._email, self.student_id]
+
+    def search_fields(self) -> tuple[str, ...]:
+        """
+        Gets the text fields that searches for students match against.
+
+        :return: The student's ID, name, and email.
+        :rtype: tuple[str, ...]
+        """
+        return self.student_id, self.name, self._email
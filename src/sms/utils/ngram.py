@@ -0,0 +1,138 @@
+"""
+Provides an in-memory n-gram index for substring search.
+
+This module contains the `NGramIndex` class, which maps every n-gram (by
+default, every trigram) of a set of indexed texts to the keys of the records
+containing it. A substring query is answered by intersecting the postings of
+the query's own n-grams, so the cost depends on the number of candidate
+records rather than on the total number of records.
+"""
+from typing import Hashable, Iterable
+
+SEARCH_GRAM_SIZE = 3
+"""The default length of the n-grams an index is built from."""
+
+_SEPARATOR = "\x00"
+"""Joins the fields of a record so that no n-gram spans two fields."""
+
+
+class NGramIndex:
+    """
+    A case-insensitive substring index over the text fields of keyed records.
+
+    Queries shorter than the n-gram size cannot be answered from the postings
+    and fall back to scanning the indexed texts.
+
+    :ivar n: The length of the indexed n-grams.
+    :vartype n: int
+    """
+
+    def __init__(self, n: int = SEARCH_GRAM_SIZE):
+        """
+        Initializes an empty NGramIndex.
+
+        :param n: The length of the indexed n-grams. Defaults to `SEARCH_GRAM_SIZE`.
+        :type n: int, optional
+        """
+        self.n: int = n
+        self._texts: dict[Hashable, str] = {}
+        self._order: dict[Hashable, int] = {}
+        self._postings: dict[str, set] = {}
+        self._next: int = 0
+
+    def _grams(self, text: str) -> set[str]:
+        """
+        Splits a text into its distinct n-grams.
+
+        :param text: The (already folded) text.
+        :type text: str
+        :return: The set of n-grams of the text.
+        :rtype: set[str]
+        """
+        n = self.n
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def add(self, key: Hashable, *fields: str):
+        """
+        Indexes a record, replacing its previous entry if the key is already indexed.
+
+        A replaced record keeps its original position in the result order.
+
+        :param key: The record's key (e.g., its ID).
+        :param fields: The text fields to index.
+        :type fields: str
+        """
+        text = _SEPARATOR.join(field.lower() for field in fields)
+        old = self._texts.get(key)
+        if old == text:
+            return
+        if old is not None:
+            self._unlink(key, self._grams(old) - self._grams(text))
+        else:
+            self._order[key] = self._next
+            self._next += 1
+        self._texts[key] = text
+        for gram in self._grams(text):
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: Hashable):
+        """
+        Removes a record from the index if it is indexed.
+
+        :param key: The record's key.
+        """
+        text = self._texts.pop(key, None)
+        if text is not None:
+            del self._order[key]
+            self._unlink(key, self._grams(text))
+
+    def _unlink(self, key: Hashable, grams: Iterable[str]):
+        """
+        Removes a key from the postings of the given n-grams.
+
+        :param key: The record's key.
+        :param grams: The n-grams to unlink the key from.
+        """
+        for gram in grams:
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def clear(self):
+        """Removes all records from the index."""
+        self._texts.clear()
+        self._order.clear()
+        self._postings.clear()
+
+    def search(self, query: str) -> list:
+        """
+        Finds the records with a field containing the query, ignoring case.
+
+        :param query: The substring to search for.
+        :type query: str
+        :return: The keys of the matching records, in the order they were first indexed.
+        :rtype: list
+        """
+        query = query.lower()
+        if len(query) < self.n:
+            return [key for key, text in self._texts.items() if query in text]
+
+        postings = sorted((self._postings.get(gram, ()) for gram in self._grams(query)), key=len)
+        if not postings[0]:
+            return []
+        candidates = set(postings[0]).intersection(*postings[1:])
+        # sharing every n-gram with the query does not guarantee containing it, so confirm each candidate
+        matches = [key for key in candidates if query in self._texts[key]]
+        matches.sort(key=self._order.__getitem__)
+        return matches
+
+    def __len__(self) -> int:
+        """
+        Returns the number of indexed records.
+
+        :return: The number of indexed records.
+        :rtype: int
+        """
+        return len(self._texts)
@@ -9,6 +9,7 @@ fallbacks to standard library implementations.
 """
 
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -30,22 +31,43 @@ except ImportError:
     logger.warning("The email-validator module is not installed. Falling back to basic email validation.")
 
 
+_NAME_PATTERN = re.compile(r"^[\p{L}\p{M}' -.]+$" if UNICODE_SUPPORT else r"^[a-zA-Z' .-]+$")
+"""Precompiled pattern for person names (regex adapted from https://stackoverflow.com/questions/2385701)."""
+_EMAIL_PATTERN = re.compile(r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)")
+"""Precompiled fallback pattern for email addresses (regex obtained from https://emailregex.com/)."""
+_ID_PATTERN = re.compile(r"^\d{9}$")
+"""Precompiled pattern for student and instructor IDs."""
+_COURSE_ID_PATTERN = re.compile(r"^[a-zA-Z]{4}\d{3}[a-zA-Z]?$")
+"""Precompiled pattern for course IDs."""
+_COURSE_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9 '.,:&()/-]+$")
+"""Precompiled pattern for course names."""
+
+EMAIL_CACHE_SIZE = 65536
+"""
+The maximum number of email verdicts remembered by `check_email_r`.
+
+Each entry costs about 75 bytes on top of the address string, which the cache
+keeps alive even after its owner is deleted, so a full cache holds roughly
+5 MB plus up to 65,536 address strings. Addresses are unique per person, so
+the cache rarely hits outside of revalidating the same records (e.g. reloading
+a file); this bound keeps it from growing with the roster.
+"""
+
+
 def check_name(name: str) -> bool:
     """
     Validates a person's name.
 
     Checks if the name contains valid characters (letters, apostrophes, hyphens, etc.).
-    Supports Unicode characters if the `regex` library is installed.
+    Supports Unicode characters if the `regex` library is installed. The name is
+    expected to be stripped of surrounding whitespace already.
 
     :param name: The name to validate.
     :type name: str
     :return: True if the name is valid, False otherwise.
     :rtype: bool
     """
-    # regex adapted from https://stackoverflow.com/questions/2385701/regular-expression-for-first-and-last-name
-    if not re.fullmatch("^[\p{L}\p{M}' -.]+$" if UNICODE_SUPPORT else r"^[a-zA-Z' .-]+$", name.strip()):
-        return False
-    return True
+    return _NAME_PATTERN.fullmatch(name) is not None
 
 
 def check_age(age: int) -> bool:
@@ -62,12 +84,15 @@ def check_age(age: int) -> bool:
     return 0 <= age <= 120
 
 
+@lru_cache(maxsize=EMAIL_CACHE_SIZE)
 def check_email_r(email: str) -> tuple[bool, str]:
     """
     Validates an email address and returns a reason for failure.
 
     Uses the `email_validator` library if available for robust, RFC-compliant
     validation. Falls back to a basic regular expression if the library is not installed.
+    Verdicts are memoized, so revalidating a known address is a dictionary lookup.
+    The address is expected to be stripped of surrounding whitespace already.
 
     :param email: The email address to validate.
     :type email: str
@@ -78,13 +103,12 @@ def check_email_r(email: str) -> tuple[bool, str]:
     # so instead, let's offer a fallback
     if validate_email and EmailNotValidError:
         try:
-            validate_email(email.strip())
+            validate_email(email)
             return True, ""
         except EmailNotValidError as e:
             return False, e.args[0]
 
-    # regex obtained from https://emailregex.com/
-    if not re.fullmatch(r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)", email.strip()):
+    if not _EMAIL_PATTERN.fullmatch(email):
         return False, ""
     return True, ""
 
@@ -115,9 +139,7 @@ def check_id(p_id: str) -> bool:
     :rtype: bool
     """
     # AUB id format: 9 digits (e.g. 202456789)
-    if not re.fullmatch(r"^\d{9}$", p_id.strip()):
-        return False
-    return True
+    return _ID_PATTERN.fullmatch(p_id) is not None
 
 
 def check_course_id(c_id: str) -> bool:
@@ -133,9 +155,7 @@ def check_course_id(c_id: str) -> bool:
     :rtype: bool
     """
     # AUB id format: 4 letters + 3 numbers + optional letter (e.g. EECE230 - MATH201 - EECE435L)
-    if not re.fullmatch(r"^[a-zA-Z]{4}\d{3}[a-zA-Z]?$", c_id.strip()):
-        return False
-    return True
+    return _COURSE_ID_PATTERN.fullmatch(c_id) is not None
 
 
 def check_course_name(name: str) -> bool:
@@ -151,8 +171,7 @@ def check_course_name(name: str) -> bool:
     :rtype: bool
     """
     # AUB course name format: words, numbers, some characters
-    if not (3 < len(name.strip()) <= 100):
+    if not (3 < len(name) <= 100):
         return False
-    if not re.fullmatch(r"^[a-zA-Z0-9 '.,:&()/-]+$", name.strip()):
-        return False
-    return True
+    return _COURSE_NAME_PATTERN.fullmatch(name) is not None
+
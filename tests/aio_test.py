@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.sms.data.dm.aio import AsyncDataManager
+from src.sms.data.dm.interface import DataError
+
+NEW_STUDENT = {"name": "Ada Four", "age": 21, "email": "s4@school.edu", "student_id": "000000004"}
+
+
+def run(coroutine_function, *args):
+    """Runs a coroutine function to completion on a new event loop."""
+    return asyncio.run(coroutine_function(*args))
+
+
+def student_ids(students) -> list[str]:
+    return [student.student_id for student in students]
+
+
+def test_methods_are_awaitable(school):
+    async def main():
+        async with AsyncDataManager(school) as adm:
+            await adm.add_student(**NEW_STUDENT)
+            await adm.enroll_many(pair for pair in [("000000004", "MATH201")])
+            students, page, found = await asyncio.gather(adm.get_students(), adm.iter_students("000000002", 5),
+                                                         adm.search_students("ada"))
+            return students, page, found, await adm.get_student("000000004")
+
+    students, page, found, student = run(main)
+    assert sorted(student_ids(students)) == ["000000001", "000000002", "000000003", "000000004"]
+    assert student_ids(page) == ["000000003", "000000004"]
+    assert student_ids(found) == ["000000004"]
+    assert [course.course_id for course in student.registered_courses] == ["MATH201"]
+
+
+def test_errors_are_raised_to_the_awaiting_task(school):
+    async def main():
+        async with AsyncDataManager(school) as adm:
+            await adm.get_student("999999999")
+
+    with pytest.raises(DataError):
+        run(main)
+
+
+def test_wrappers_of_a_manager_that_is_not_thread_safe_share_its_lock(memory_manager, database_manager):
+    first, second = AsyncDataManager(memory_manager), AsyncDataManager(memory_manager)
+    assert first._lock is second._lock
+    assert AsyncDataManager(database_manager)._lock is None
+    running, overlaps = [], []
+
+    def work():
+        running.append(1)
+        overlaps.append(len(running))
+        time.sleep(0.01)
+        running.pop()
+
+    async def main():
+        await asyncio.gather(*(adm._run(work) for adm in (first, second) for _ in range(4)))
+        await first.aclose()
+        await second.aclose()
+
+    run(main)
+    assert overlaps == [1] * 8
+
+
+def test_transaction_commits_its_calls_together(school):
+    async def main():
+        async with AsyncDataManager(school) as adm:
+            async with adm.transaction():
+                await adm.add_student(**NEW_STUDENT)
+                await adm.enroll_student("000000004", "EECE230")
+                # the block's own calls see its uncommitted writes
+                return await adm.get_student("000000004")
+
+    assert run(main).student_id == "000000004"
+    assert [s.student_id for s in school.get_course("EECE230").enrolled_students][-1] == "000000004"
+
+
+def test_failed_transaction_applies_nothing(school):
+    async def main():
+        async with AsyncDataManager(school) as adm:
+            async with adm.transaction():
+                await adm.add_student(**NEW_STUDENT)
+                await adm.enroll_student("000000004", "NOPE999")
+
+    with pytest.raises(DataError):
+        run(main)
+    with pytest.raises(DataError):
+        school.get_student("000000004")
+
+
+def test_failed_nested_transaction_undoes_only_its_own_calls(school):
+    async def main():
+        async with AsyncDataManager(school) as adm:
+            async with adm.transaction():
+                await adm.add_student(**NEW_STUDENT)
+                with pytest.raises(ValueError):
+                    async with adm.transaction():
+                        await adm.remove_student("000000001")
+                        raise ValueError("undo the removal")
+
+    run(main)
+    assert school.get_student("000000004").name == "Ada Four"
+    assert school.get_student("000000001").name == "Sam One"
+
+
+def test_transaction_runs_its_calls_on_one_thread(school):
+    threads = set()
+
+    def record():
+        threads.add(threading.get_ident())
+
+    async def main():
+        async with AsyncDataManager(school) as adm:
+            async with adm.transaction():
+                await asyncio.gather(*(adm._run(record) for _ in range(8)))
+
+    run(main)
+    assert len(threads) == 1
+
+
+def test_other_tasks_wait_for_a_transaction(school):
+    async def main():
+        async with AsyncDataManager(school) as adm, AsyncDataManager(school) as other:
+            async with adm.transaction():
+                await adm.add_student(**NEW_STUDENT)
+                waiting = asyncio.create_task(other.add_student(**{**NEW_STUDENT, "student_id": "000000005"}))
+                await asyncio.sleep(0.05)
+                assert not waiting.done()
+            await waiting
+
+    run(main)
+    assert school.get_student("000000005").student_id == "000000005"
@@ -0,0 +1,84 @@
+import gzip
+import os
+import shutil
+import sqlite3
+
+import pytest
+
+from src.sms.data.db import backup
+from src.sms.data.db.backup import backup_database
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = str(tmp_path / "live.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE t (n INTEGER PRIMARY KEY, text TEXT)")
+    connection.executemany("INSERT INTO t VALUES (?, ?)", ((n, "x" * 200) for n in range(2000)))
+    connection.commit()
+    connection.close()
+    return path
+
+
+def rows(path: str) -> list:
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT n, text FROM t ORDER BY n").fetchall()
+    finally:
+        connection.close()
+
+
+def leftovers(directory) -> list:
+    return sorted(name for name in os.listdir(directory) if name.endswith((".tmp", ".db", ".gz"))
+                  and name not in ("live.db", "backup.db", "backup.db.gz"))
+
+
+def test_full_backup(source, tmp_path):
+    target = str(tmp_path / "backup.db")
+    backup_database(source, target)
+    assert rows(target) == rows(source)
+    assert leftovers(tmp_path) == []
+
+
+def test_compressed_backup(source, tmp_path):
+    target = str(tmp_path / "backup.db.gz")
+    backup_database(source, target, compress=True)
+    restored = str(tmp_path / "restored")
+    with gzip.open(target, "rb") as src, open(restored, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    assert rows(restored) == rows(source)
+
+
+def test_failed_compressed_backup_keeps_the_previous_one(source, tmp_path, monkeypatch):
+    target = tmp_path / "backup.db.gz"
+    backup_database(source, str(target), compress=True)
+    previous = target.read_bytes()
+
+    def fail(src, dst, *args):
+        dst.write(src.read(4096))
+        raise OSError("disk full")
+
+    monkeypatch.setattr(backup.shutil, "copyfileobj", fail)
+    with pytest.raises(OSError):
+        backup_database(source, str(target), compress=True)
+    assert target.read_bytes() == previous
+    assert leftovers(tmp_path) == []
+
+
+def test_incremental_backup_writes_only_changed_pages(source, tmp_path):
+    target = str(tmp_path / "backup.db")
+    backup_database(source, target)
+    connection = sqlite3.connect(source)
+    connection.execute("UPDATE t SET text = 'changed' WHERE n = 7")
+    connection.commit()
+    connection.close()
+
+    pages = backup_database(source, target, incremental=True)
+    assert 0 < pages < 10
+    assert rows(target) == rows(source)
+    assert backup_database(source, target, incremental=True) == 0
+
+
+def test_compressed_backups_cannot_be_incremental(source, tmp_path):
+    with pytest.raises(ValueError):
+        backup_database(source, str(tmp_path / "backup.db.gz"), compress=True, incremental=True)
@@ -0,0 +1,184 @@
+import struct
+
+import pytest
+
+from src.sms.data.dm import columnar
+from src.sms.data.dm.columnar import ColumnarDataManager, ColumnarError, ColumnarStore, write_columnar_store
+from src.sms.data.dm.interface import DataError
+
+
+def state(data_manager) -> tuple:
+    """Summarizes everything a data manager holds, with every relation."""
+    return ([(i.instructor_id, i.name, i.age, i.to_dict()["email"], tuple(i.assigned_courses.ids()))
+             for i in data_manager.get_instructors()],
+            [(c.course_id, c.course_name, c.instructor.instructor_id, tuple(c.enrolled_students.ids()))
+             for c in data_manager.get_courses()],
+            [(s.student_id, s.name, s.age, s.to_dict()["email"], tuple(s.registered_courses.ids()))
+             for s in data_manager.get_students()])
+
+
+def ordered(summary: tuple) -> tuple:
+    return tuple(sorted((*record[:-1], tuple(sorted(record[-1]))) for record in table) for table in summary)
+
+
+@pytest.fixture
+def store(school, tmp_path):
+    """The `school` fixture, built into a columnar store and opened."""
+    path = str(tmp_path / "school.col")
+    ColumnarDataManager.build(path, school)
+    ColumnarDataManager.open(path)
+    yield path
+    ColumnarDataManager.close()
+
+
+def test_build_round_trip(school, store):
+    assert ordered(state(ColumnarDataManager)) == ordered(state(school))
+    # tables and relations come back ordered by ID
+    assert [s.student_id for s in ColumnarDataManager.get_students()] == ["000000001", "000000002", "000000003"]
+    assert ColumnarDataManager.get_course("EECE230").enrolled_students.ids() == ["000000001", "000000002"]
+
+
+def test_objects_and_relations_are_built_once(store):
+    student = ColumnarDataManager.get_student("000000002")
+    assert ColumnarDataManager.get_student("000000002") is student
+    course = ColumnarDataManager.get_course("MATH201")
+    assert course.instructor is ColumnarDataManager.get_instructor("111111111")
+    assert student in course.enrolled_students
+    assert course in student.registered_courses
+    assert next(iter(course.enrolled_students)) is student
+
+
+@pytest.mark.parametrize("record_id", ["000000000", "000000004", "00000000", "0000000010", "", "a\0b", "é"])
+def test_missing_ids_are_not_found(store, record_id):
+    with pytest.raises(DataError):
+        ColumnarDataManager.get_student(record_id)
+
+
+@pytest.mark.parametrize("after_id, limit, expected", [
+    (None, 2, ["000000001", "000000002"]),
+    ("000000001", 10, ["000000002", "000000003"]),
+    ("0000000015", 10, ["000000002", "000000003"]),
+    ("000000003", 10, []),
+    ("999999999", 10, []),
+    ("", -1, ["000000001", "000000002", "000000003"]),
+    (None, 0, []),
+])
+def test_iter_students(store, after_id, limit, expected):
+    assert [s.student_id for s in ColumnarDataManager.iter_students(after_id, limit)] == expected
+
+
+@pytest.mark.parametrize("query, expected", [("", ["000000001", "000000002", "000000003"]), ("kim", ["000000002"]),
+                                             ("S3@SCHOOL", ["000000003"]), ("00000000", ["000000001", "000000002",
+                                                                                          "000000003"]),
+                                             ("one\0", []), ("0s1", []), ("nobody", [])])
+def test_search_students(store, query, expected):
+    assert [s.student_id for s in ColumnarDataManager.search_students(query)] == expected
+
+
+def test_search_courses_and_instructors(store):
+    assert [c.course_id for c in ColumnarDataManager.search_courses("calc")] == ["MATH201"]
+    assert [c.course_id for c in ColumnarDataManager.search_courses("0")] == ["EECE230", "MATH201"]
+    assert [i.instructor_id for i in ColumnarDataManager.search_instructors("ANN")] == ["111111111"]
+
+
+def test_empty_store(tmp_path):
+    path = str(tmp_path / "empty.col")
+    write_columnar_store(path, [], [], [])
+    ColumnarDataManager.open(path)
+    try:
+        assert state(ColumnarDataManager) == ([], [], [])
+        assert ColumnarDataManager.iter_students() == []
+        assert ColumnarDataManager.search_courses("") == []
+        with pytest.raises(DataError):
+            ColumnarDataManager.get_student("000000001")
+    finally:
+        ColumnarDataManager.close()
+
+
+def test_exports_round_trip(school, store, tmp_path, memory_manager):
+    path = str(tmp_path / "export.json")
+    ColumnarDataManager.data_to_json(path)
+    memory_manager.data_from_json(path)
+    assert ordered(state(memory_manager)) == ordered(state(school))
+
+
+def test_store_is_read_only(store):
+    with pytest.raises(DataError):
+        ColumnarDataManager.add_student(name="New Four", age=20, email="s4@school.edu", student_id="000000004")
+    with pytest.raises(DataError):
+        ColumnarDataManager.enroll_many([("000000003", "EECE230")])
+    with pytest.raises(DataError):
+        ColumnarDataManager.data_from_json("data.json")
+
+
+def test_reads_without_a_store_raise_data_error():
+    ColumnarDataManager.close()
+    with pytest.raises(DataError):
+        ColumnarDataManager.get_students()
+
+
+def test_reopening_keeps_earlier_readers_on_their_store(school, store, tmp_path):
+    table = ColumnarDataManager._table("students")
+    row = table.find("000000002")
+    student = ColumnarDataManager.get_student("000000001")
+    school.edit_student(student_id="000000002", name="Kim Renamed")
+    school.remove_student("000000001")
+    newer = str(tmp_path / "newer.col")
+    ColumnarDataManager.build(newer, school)
+    ColumnarDataManager.open(newer)
+
+    # the old table, its row numbers, and the relations of its objects still read the old store
+    assert ColumnarDataManager._object(table, row).name == "Kim Two"
+    assert student.registered_courses.ids() == ["EECE230"]
+    assert student.registered_courses.ids()[0] in [c.course_id for c in ColumnarDataManager.get_courses()]
+    assert [s.name for s in ColumnarDataManager.get_students()] == ["Kim Renamed", "Lou Three"]
+    ColumnarDataManager.close()
+    assert table.id(row) == "000000002"
+
+
+def corrupt(path: str, offset: int, data: bytes):
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        f.write(data)
+
+
+def truncate(path: str, size: int):
+    with open(path, "r+b") as f:
+        f.truncate(size)
+
+
+@pytest.mark.parametrize("damage", [
+    lambda path: corrupt(path, 0, b"XXXX"),
+    lambda path: corrupt(path, 4, struct.pack("<H", columnar.VERSION + 1)),
+    lambda path: corrupt(path, 8, struct.pack("<I", 3)),
+    lambda path: corrupt(path, columnar._HEADER.size, struct.pack("<Q", 1 << 40)),
+    lambda path: corrupt(path, columnar._HEADER.size + 16, struct.pack("<I", 3)),
+    lambda path: truncate(path, 6),
+    lambda path: truncate(path, 0),
+], ids=["magic", "version", "section count", "section offset", "section item size", "truncated header", "empty"])
+def test_corrupt_stores_are_rejected(store, tmp_path, damage):
+    path = str(tmp_path / "damaged.col")
+    with open(store, "rb") as src, open(path, "wb") as dst:
+        dst.write(src.read())
+    damage(path)
+    with pytest.raises(ColumnarError):
+        ColumnarStore(path)
+    with pytest.raises(DataError):
+        ColumnarDataManager.open(path)
+    # the store that was open stays open
+    assert ColumnarDataManager.get_student("000000001").name == "Sam One"
+
+
+def test_mismatched_section_is_rejected(store, tmp_path):
+    path = str(tmp_path / "damaged.col")
+    with open(store, "rb") as src, open(path, "wb") as dst:
+        dst.write(src.read())
+    # make the students' ages section one item shorter than the table
+    index = columnar._SECTIONS.index("students.ages")
+    entry = columnar._HEADER.size + index * columnar._ENTRY.size
+    with open(path, "rb") as f:
+        f.seek(entry)
+        offset, length, item_size = columnar._ENTRY.unpack(f.read(columnar._ENTRY.size))
+    corrupt(path, entry, columnar._ENTRY.pack(offset, length - item_size, item_size))
+    with pytest.raises(ColumnarError, match="students.ages"):
+        ColumnarStore(path)
@@ -0,0 +1,63 @@
+import os
+import tempfile
+
+import pytest
+
+# importing the database module opens the application database, so point it at a scratch file first
+_SCRATCH_DIR = tempfile.TemporaryDirectory(prefix="sms-test-")
+os.environ["SMS_DB_PATH"] = os.path.join(_SCRATCH_DIR.name, "sms.db")
+
+from src.sms.data.db.manager import DatabaseManager  # noqa: E402
+from src.sms.data.dm import database, memory  # noqa: E402
+from src.sms.data.dm.database import DatabaseDataManager  # noqa: E402
+from src.sms.data.dm.memory import MemoryDataManager  # noqa: E402
+
+
+@pytest.fixture
+def memory_manager():
+    """The MemoryDataManager, over an empty datastore."""
+    for kind in ("students", "instructors", "courses"):
+        getattr(memory.datastore, kind).clear()
+    MemoryDataManager._search_indexes.clear()
+    MemoryDataManager._sorted_ids.clear()
+    yield MemoryDataManager
+    for kind in ("students", "instructors", "courses"):
+        getattr(memory.datastore, kind).clear()
+
+
+@pytest.fixture
+def database_manager(tmp_path):
+    """The DatabaseDataManager, over an empty database of its own."""
+    original = database.dbm
+    dbm = DatabaseManager(str(tmp_path / "test.db"))
+    dbm.create_tables()
+    database.dbm = dbm
+    DatabaseDataManager._clear_cache()
+    yield DatabaseDataManager
+    DatabaseDataManager._clear_cache()
+    database.dbm = original
+    dbm.close()
+
+
+@pytest.fixture(params=["memory", "database"])
+def data_manager(request):
+    """Each data manager in turn, over empty data."""
+    return request.getfixturevalue(f"{request.param}_manager")
+
+
+@pytest.fixture
+def school(data_manager):
+    """
+    A data manager holding one instructor, two courses, and three students.
+
+    Student 000000001 is enrolled in EECE230, 000000002 in EECE230 and
+    MATH201, and 000000003 in nothing.
+    """
+    data_manager.add_instructor(name="Ann Lee", age=40, email="ann@school.edu", instructor_id="111111111")
+    instructor = data_manager.get_instructor("111111111")
+    data_manager.add_course(course_id="EECE230", course_name="Programming", instructor=instructor)
+    data_manager.add_course(course_id="MATH201", course_name="Calculus", instructor=instructor)
+    for n, name in enumerate(("Sam One", "Kim Two", "Lou Three"), start=1):
+        data_manager.add_student(name=name, age=20, email=f"s{n}@school.edu", student_id=f"00000000{n}")
+    data_manager.enroll_many([("000000001", "EECE230"), ("000000002", "EECE230"), ("000000002", "MATH201")])
+    return data_manager
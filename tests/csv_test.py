@@ -0,0 +1,72 @@
+import pytest
+
+from src.sms.data.dm.file import FileManager
+from src.sms.models.course import Course
+from src.sms.models.instructor import Instructor
+from src.sms.models.student import Student
+
+
+def school() -> FileManager:
+    fm = FileManager()
+    instructor = Instructor.from_trusted("Ann Lee", 40, "ann@school.edu", "111111111")
+    fm.instructors[instructor.instructor_id] = instructor
+    for course_id, name in (("EECE230", "Programming, Part I"), ("MATH201", "Calculus")):
+        fm.courses[course_id] = Course.from_trusted(course_id, name, instructor)
+    for n, name in enumerate(("Sam One", "Kim Two", "Lou Three"), start=1):
+        student = Student.from_trusted(name, 20 + n, f"s{n}@school.edu", f"00000000{n}")
+        for course in list(fm.courses.values())[:n - 1]:
+            student.register_course(course)
+        fm.students[student.student_id] = student
+    return fm
+
+
+def summary(fm: FileManager) -> tuple:
+    return ([i.to_dict() for i in fm.instructors.values()], [c.to_dict() for c in fm.courses.values()],
+            [s.to_dict() for s in fm.students.values()])
+
+
+def test_csv_round_trip(tmp_path):
+    fm = school()
+    fm.save_to_csv(str(tmp_path))
+    loaded = FileManager.from_csv(str(tmp_path))
+    assert summary(loaded) == summary(fm)
+    student = loaded.students["000000003"]
+    assert [c.course_id for c in student.registered_courses] == ["EECE230", "MATH201"]
+    assert student in loaded.courses["MATH201"].enrolled_students
+
+
+def test_csv_round_trip_of_no_data(tmp_path):
+    FileManager().save_to_csv(str(tmp_path))
+    assert summary(FileManager.from_csv(str(tmp_path))) == ([], [], [])
+
+
+def test_csv_rows_referring_to_missing_records_are_skipped(tmp_path):
+    school().save_to_csv(str(tmp_path))
+    with open(tmp_path / "courses.csv", "a", newline="") as file:
+        file.write("PHYS101,Physics,999999999\r\n")
+    with open(tmp_path / "enrollments.csv", "a", newline="") as file:
+        file.write("000000009,EECE230\r\nPHYS101,000000001\r\n")
+    assert summary(FileManager.from_csv(str(tmp_path))) == summary(school())
+
+
+def test_invalid_csv_record_is_rejected(tmp_path):
+    school().save_to_csv(str(tmp_path))
+    students = tmp_path / "students.csv"
+    students.write_text(students.read_text().replace("s1@school.edu", "not an email"))
+    with pytest.raises(ValueError):
+        FileManager.from_csv(str(tmp_path))
+
+
+@pytest.mark.parametrize("text", ["name,age,email\nOnly Name,20,x@school.edu\n",
+                                  "name,age,email,student_id\nShort Row,20\n"])
+def test_malformed_csv_file_raises_value_error(tmp_path, text):
+    school().save_to_csv(str(tmp_path))
+    (tmp_path / "students.csv").write_text(text)
+    with pytest.raises(ValueError):
+        FileManager.from_csv(str(tmp_path))
+
+
+def test_load_from_csv_logs_missing_files_and_leaves_no_data(tmp_path):
+    fm = school()
+    fm.load_from_csv(str(tmp_path / "missing"))
+    assert summary(fm) == ([], [], [])
@@ -0,0 +1,61 @@
+import pytest
+
+from src.sms.data.dm.database import DatabaseDataManager
+from src.sms.data.dm.interface import DataError
+
+
+def forget_cache(data_manager):
+    """Drops the database manager's cache, so the next reads go to the database."""
+    if data_manager is DatabaseDataManager:
+        data_manager._clear_cache()
+
+
+@pytest.mark.parametrize("cached", [True, False], ids=["cached", "uncached"])
+@pytest.mark.parametrize("fields", [dict(email="bad"), dict(name="Sam 1"), dict(age=200), dict(age="old"),
+                                    dict(name="Sam Renamed", email="bad")])
+def test_invalid_student_edit_writes_nothing(school, cached, fields):
+    if cached:
+        school.get_student("000000001")
+    else:
+        forget_cache(school)
+    with pytest.raises(DataError):
+        school.edit_student(student_id="000000001", **fields)
+    forget_cache(school)
+    student = school.get_student("000000001")
+    assert (student.name, student.age, student.to_dict()["email"]) == ("Sam One", 20, "s1@school.edu")
+
+
+@pytest.mark.parametrize("cached", [True, False], ids=["cached", "uncached"])
+def test_invalid_instructor_and_course_edits_write_nothing(school, cached):
+    if not cached:
+        forget_cache(school)
+    with pytest.raises(DataError):
+        school.edit_instructor(instructor_id="111111111", email="not an email")
+    with pytest.raises(DataError):
+        school.edit_course(course_id="EECE230", course_name="Bad <name>")
+    forget_cache(school)
+    assert school.get_instructor("111111111").to_dict()["email"] == "ann@school.edu"
+    assert school.get_course("EECE230").course_name == "Programming"
+
+
+def test_edit_writes_normalized_values(school):
+    school.edit_student(student_id="000000001", name="  Sam Renamed ", age="21", email=" sam@school.edu ")
+    school.edit_course(course_id="EECE230", course_name=" Programming I ")
+    for _ in range(2):
+        student = school.get_student("000000001")
+        assert (student.name, student.age, student.to_dict()["email"]) == ("Sam Renamed", 21, "sam@school.edu")
+        assert school.get_course("EECE230").course_name == "Programming I"
+        forget_cache(school)
+
+
+def test_empty_edit_values_are_ignored(school):
+    school.edit_student(student_id="000000001", name="", email=None)
+    forget_cache(school)
+    assert school.get_student("000000001").name == "Sam One"
+
+
+def test_edit_of_a_missing_record(school):
+    with pytest.raises(DataError):
+        school.edit_student(student_id="000000009", name="Nobody Here")
+    with pytest.raises(DataError):
+        school.edit_course(course_id="PHYS101", course_name="Physics")
@@ -0,0 +1,113 @@
+import pytest
+
+from src.sms.data.dm.file import FileManager
+from src.sms.data.dm.interface import DataError
+from src.sms.models.course import Course
+from src.sms.models.instructor import Instructor
+from src.sms.models.student import Student
+
+IMPORT_MODES = [dict(), dict(merge=True), dict(merge=True, prune=True)]
+
+
+def state(data_manager) -> tuple:
+    """Summarizes everything a data manager holds."""
+    return (sorted((i.instructor_id, i.name, i.age) for i in data_manager.get_instructors()),
+            sorted((c.course_id, c.course_name, c.instructor.instructor_id) for c in data_manager.get_courses()),
+            sorted((s.student_id, s.name, s.age, tuple(sorted(s.registered_courses.ids())))
+                   for s in data_manager.get_students()))
+
+
+def correction() -> FileManager:
+    """
+    A file's worth of data changing the `school` fixture.
+
+    It renames EECE230 and student 000000001, enrolls 000000001 in MATH201
+    as well, adds student 000000004 in MATH201, and leaves out students
+    000000002 and 000000003.
+    """
+    fm = FileManager()
+    instructor = Instructor.from_trusted("Ann Lee", 40, "ann@school.edu", "111111111")
+    fm.instructors[instructor.instructor_id] = instructor
+    for course_id, name in (("EECE230", "Programming I"), ("MATH201", "Calculus")):
+        fm.courses[course_id] = Course.from_trusted(course_id, name, instructor)
+    for student_id, name, courses in (("000000001", "Sam Renamed", ("EECE230", "MATH201")),
+                                      ("000000004", "New Four", ("MATH201",))):
+        student = Student.from_trusted(name, 20, f"s{student_id[-1]}@school.edu", student_id)
+        for course_id in courses:
+            student.register_course(fm.courses[course_id])
+        fm.students[student_id] = student
+    return fm
+
+
+@pytest.fixture(params=["json", "csv"])
+def export(request, tmp_path):
+    """Writes a FileManager in one of the import formats, returning the import method's name and the path."""
+    def write(fm: FileManager) -> tuple[str, str]:
+        if request.param == "json":
+            path = str(tmp_path / "data.json")
+            fm.save_to_json(path)
+        else:
+            path = str(tmp_path)
+            fm.save_to_csv(path)
+        return f"data_from_{request.param}", path
+    return write
+
+
+@pytest.mark.parametrize("prune", [False, True])
+def test_merge_counts_and_result(school, export, prune):
+    method, path = export(correction())
+    counts = getattr(school, method)(path, merge=True, prune=prune)
+    # inserted: student 000000004 and two enrollments; updated: EECE230 and student 000000001
+    assert counts == {"inserted": 3, "updated": 2, "deleted": 2 if prune else 0}
+    instructors, courses, students = state(school)
+    assert courses == [("EECE230", "Programming I", "111111111"), ("MATH201", "Calculus", "111111111")]
+    expected = [("000000001", "Sam Renamed", 20, ("EECE230", "MATH201"))]
+    if not prune:
+        expected += [("000000002", "Kim Two", 20, ("EECE230", "MATH201")), ("000000003", "Lou Three", 20, ())]
+    expected.append(("000000004", "New Four", 20, ("MATH201",)))
+    assert students == expected
+
+
+def test_merging_the_same_data_changes_nothing(school, export):
+    method, path = export(correction())
+    getattr(school, method)(path, merge=True)
+    before = state(school)
+    assert getattr(school, method)(path, merge=True) == {"inserted": 0, "updated": 0, "deleted": 0}
+    assert state(school) == before
+
+
+@pytest.mark.parametrize("mode", IMPORT_MODES, ids=["replace", "merge", "merge-prune"])
+@pytest.mark.parametrize("method", ["data_from_json", "data_from_csv"])
+def test_missing_file_leaves_data_untouched(school, tmp_path, method, mode):
+    before = state(school)
+    with pytest.raises(DataError):
+        getattr(school, method)(str(tmp_path / "missing"), **mode)
+    assert state(school) == before
+
+
+@pytest.mark.parametrize("mode", IMPORT_MODES, ids=["replace", "merge", "merge-prune"])
+def test_corrupt_json_leaves_data_untouched(school, tmp_path, mode):
+    path = tmp_path / "data.json"
+    correction().save_to_json(str(path))
+    path.write_text(path.read_text()[:-40])
+    before = state(school)
+    with pytest.raises(DataError):
+        school.data_from_json(str(path), **mode)
+    assert state(school) == before
+
+
+@pytest.mark.parametrize("mode", IMPORT_MODES, ids=["replace", "merge", "merge-prune"])
+def test_corrupt_csv_leaves_data_untouched(school, tmp_path, mode):
+    correction().save_to_csv(str(tmp_path))
+    students = tmp_path / "students.csv"
+    students.write_text(students.read_text().replace(",20,", ",twenty,", 1))
+    before = state(school)
+    with pytest.raises(DataError):
+        school.data_from_csv(str(tmp_path), **mode)
+    assert state(school) == before
+
+
+def test_replace_import_loads_the_file(school, export):
+    method, path = export(correction())
+    assert getattr(school, method)(path) is None
+    assert [s[0] for s in state(school)[2]] == ["000000001", "000000004"]
@@ -0,0 +1,139 @@
+import io
+import json
+
+import pytest
+
+from src.sms.data.dm.file import FileManager, _iter_json_sections
+from src.sms.models.course import Course
+from src.sms.models.instructor import Instructor
+from src.sms.models.student import Student
+
+DOCUMENTS = [
+    "{}",
+    '{"s": []}',
+    '{"s": [-1.5e10]}',
+    '{"n": [0, -0, 1, -12, 3.25, 1e5, 2E-3, -7.125e+2, 12345678901234567890]}',
+    '{"a": [true, false, null], "skipped": {"x": [1, 2]}, "b": ["after"]}',
+    '{"t": ["plain", "quote \\" and backslash \\\\", "tab\\t newline\\n", "\\u00e9\\ud83d\\ude00", "café"]}',
+    '{"nested": [{"k": [1, {"deep": -0.5}]}, [[], {}]], "scalar": 5, "last": [1e-7]}',
+    ' \n{ "spaced" :\n [ 1 ,\t2 ] , "empty" : [ ] }\n',
+]
+
+
+def sections(document: str) -> list:
+    return [(key, item) for key, value in json.loads(document).items() if isinstance(value, list) for item in value]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("chunk_size", list(range(1, 13)) + [64, 1 << 16])
+def test_iter_json_sections_matches_json_loads(document, chunk_size):
+    assert list(_iter_json_sections(io.StringIO(document), chunk_size)) == sections(document)
+
+
+@pytest.mark.parametrize("document", ['{"s": [1, 2', '{"s": [-1.5e]}', '{"s": [1,]}', '{"s" [1]}', '[1]', ''])
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_iter_json_sections_rejects_malformed_documents(document, chunk_size):
+    with pytest.raises(json.JSONDecodeError):
+        list(_iter_json_sections(io.StringIO(document), chunk_size))
+
+
+def school() -> FileManager:
+    fm = FileManager()
+    instructor = Instructor.from_trusted('Ann "Q" Lee', 40, "ann@school.edu", "111111111")
+    fm.instructors[instructor.instructor_id] = instructor
+    for course_id, name in (("EECE230", "Programming\\Intro"), ("MATH201", "Calculus\tI")):
+        fm.courses[course_id] = Course.from_trusted(course_id, name, instructor)
+    for n in range(1, 4):
+        student = Student.from_trusted(f"Student {n}", 20 + n, f"s{n}@school.edu", f"00000000{n}")
+        for course in list(fm.courses.values())[:n - 1]:
+            student.register_course(course)
+        fm.students[student.student_id] = student
+    return fm
+
+
+def valid_school() -> FileManager:
+    """A school whose records all pass validation, unlike `school`."""
+    fm = FileManager()
+    instructor = Instructor.from_trusted("Ann Lee", 40, "ann@school.edu", "111111111")
+    fm.instructors[instructor.instructor_id] = instructor
+    fm.courses["EECE230"] = Course.from_trusted("EECE230", "Programming", instructor)
+    for n, name in enumerate(("Sam One", "Kim Two"), start=1):
+        student = Student.from_trusted(name, 20, f"s{n}@school.edu", f"00000000{n}")
+        student.register_course(fm.courses["EECE230"])
+        fm.students[student.student_id] = student
+    return fm
+
+
+def summary(fm: FileManager) -> tuple:
+    return ([i.to_dict() for i in fm.instructors.values()], [c.to_dict() for c in fm.courses.values()],
+            [s.to_dict() for s in fm.students.values()])
+
+
+def test_save_to_json_matches_json_dump(tmp_path):
+    fm = school()
+    path = tmp_path / "data.json"
+    fm.save_to_json(str(path))
+    expected = {"students": summary(fm)[2], "instructors": summary(fm)[0], "courses": summary(fm)[1]}
+    assert path.read_text(encoding="utf-8") == json.dumps(expected, indent=4)
+
+
+def test_json_round_trip(tmp_path):
+    fm = valid_school()
+    path = str(tmp_path / "data.json")
+    fm.save_to_json(path)
+    assert summary(FileManager.from_json(path)) == summary(fm)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 7, 1 << 16])
+def test_saved_json_streams_at_any_chunk_size(tmp_path, chunk_size):
+    path = tmp_path / "data.json"
+    school().save_to_json(str(path))
+    document = path.read_text(encoding="utf-8")
+    with open(path, encoding="utf-8") as f:
+        assert list(_iter_json_sections(f, chunk_size)) == sections(document)
+
+
+def test_json_round_trip_of_no_data(tmp_path):
+    path = str(tmp_path / "data.json")
+    FileManager().save_to_json(path)
+    assert summary(FileManager.from_json(path)) == ([], [], [])
+
+
+def test_jsonl_round_trip(tmp_path):
+    fm = valid_school()
+    path = str(tmp_path / "data.jsonl")
+    fm.save_to_jsonl(path)
+    loaded = FileManager()
+    loaded.load_from_jsonl(path)
+    assert summary(loaded) == summary(fm)
+
+
+def test_jsonl_round_trip_of_no_data(tmp_path):
+    path = tmp_path / "data.jsonl"
+    FileManager().save_to_jsonl(str(path))
+    assert path.read_text() == ""
+    loaded = FileManager()
+    loaded.load_from_jsonl(str(path))
+    assert summary(loaded) == ([], [], [])
+
+
+@pytest.mark.parametrize("bad_line, error", [
+    ('{"name": "No Type", "age": 30, "email": "n@school.edu", "instructor_id": "222222222"}', ValueError),
+    ('{"type": "student", "name": "Bad Email", "age": 20, "email": "bad", "student_id": "000000009"}', ValueError),
+    ('{"type": "student", "name": "No Age", "email": "n@school.edu", "student_id": "000000009"}', ValueError),
+    ('{"type": "student", ', None),
+])
+def test_failed_jsonl_load_holds_no_partial_data(tmp_path, bad_line, error):
+    path = tmp_path / "data.jsonl"
+    valid_school().save_to_jsonl(str(path))
+    assert summary(FileManager.from_jsonl(str(path))) == summary(valid_school())
+    path.write_text(path.read_text() + bad_line + "\n")
+    with pytest.raises(error or json.JSONDecodeError):
+        FileManager.from_jsonl(str(path))
+    loaded = valid_school()
+    if error:
+        with pytest.raises(error):
+            loaded.load_from_jsonl(str(path))
+    else:
+        loaded.load_from_jsonl(str(path))
+    assert summary(loaded) == ([], [], [])
@@ -0,0 +1,93 @@
+import logging
+import sqlite3
+
+import pytest
+
+from src.sms.data.db import migrations
+from src.sms.data.db.contract import COURSE_SCHEMA, ENROLLMENT_SCHEMA, INSTRUCTOR_SCHEMA, STUDENT_SCHEMA
+from src.sms.data.db.manager import DatabaseManager
+from src.sms.data.db.migrations import SCHEMA_VERSION, get_version, migrate
+
+
+@pytest.fixture
+def cursor(tmp_path):
+    """A cursor on a database with the tables and data of a release that predates migrations."""
+    conn = sqlite3.connect(str(tmp_path / "old.db"))
+    for schema in (STUDENT_SCHEMA, INSTRUCTOR_SCHEMA, COURSE_SCHEMA, ENROLLMENT_SCHEMA):
+        conn.execute(schema)
+    conn.execute("INSERT INTO instructors VALUES ('Ann Lee', 40, 'ann@school.edu', '111111111')")
+    conn.execute("INSERT INTO courses VALUES ('EECE230', 'Programming', '111111111')")
+    conn.execute("INSERT INTO students VALUES ('Sam One', 20, 's1@school.edu', '000000001')")
+    conn.execute("INSERT INTO enrollments VALUES ('000000001', 'EECE230')")
+    conn.commit()
+    cursor = conn.cursor()
+    yield cursor
+    conn.close()
+
+
+def names(cursor: sqlite3.Cursor, kind: str) -> set[str]:
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = ?", (kind,))
+    return {row[0] for row in cursor.fetchall()}
+
+
+def test_migrates_a_database_from_version_0(cursor):
+    assert get_version(cursor) == 0
+    assert migrate(cursor) == SCHEMA_VERSION == len(migrations.MIGRATIONS)
+    assert get_version(cursor) == SCHEMA_VERSION
+    assert {"idx_enrollments_course_id", "idx_courses_instructor_id"} <= names(cursor, "index")
+    assert {"students_search", "instructors_search", "courses_search"} <= names(cursor, "table")
+    assert cursor.execute("SELECT * FROM enrollments").fetchall() == [("000000001", "EECE230")]
+    assert not cursor.connection.in_transaction
+
+
+def test_migrating_again_changes_nothing(cursor):
+    migrate(cursor)
+    schema = cursor.execute("SELECT sql FROM sqlite_master ORDER BY name").fetchall()
+    assert migrate(cursor) == SCHEMA_VERSION
+    assert cursor.execute("SELECT sql FROM sqlite_master ORDER BY name").fetchall() == schema
+
+
+def test_resumes_from_the_last_applied_migration(cursor, monkeypatch):
+    applied = []
+    steps = [(f"Step {n}", (lambda c, n=n: applied.append(n),)) for n in range(1, 4)]
+    monkeypatch.setattr(migrations, "MIGRATIONS", tuple(steps))
+    monkeypatch.setattr(migrations, "SCHEMA_VERSION", len(steps))
+    cursor.execute("PRAGMA user_version = 1")
+    assert migrate(cursor) == 3
+    assert applied == [2, 3]
+
+
+def test_failed_migration_is_rolled_back_and_retried(cursor, monkeypatch):
+    steps = (("Add a table", ("CREATE TABLE first (n INTEGER)",)),
+             ("Add a table, then fail", ("CREATE TABLE second (n INTEGER)", "SELECT * FROM missing")))
+    monkeypatch.setattr(migrations, "MIGRATIONS", steps)
+    monkeypatch.setattr(migrations, "SCHEMA_VERSION", len(steps))
+    with pytest.raises(sqlite3.OperationalError):
+        migrate(cursor)
+    assert get_version(cursor) == 1
+    assert "first" in names(cursor, "table")
+    assert "second" not in names(cursor, "table")
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", (steps[0], ("Add a table", ("CREATE TABLE second (n INTEGER)",))))
+    assert migrate(cursor) == 2
+    assert "second" in names(cursor, "table")
+
+
+def test_newer_database_is_left_unchanged(cursor, caplog):
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    with caplog.at_level(logging.WARNING, logger=migrations.__name__):
+        assert migrate(cursor) == SCHEMA_VERSION + 1
+    assert "newer" in caplog.text
+    assert "idx_courses_instructor_id" not in names(cursor, "index")
+
+
+def test_create_tables_migrates_an_existing_database(cursor):
+    path = cursor.connection.execute("PRAGMA database_list").fetchone()[2]
+    cursor.connection.close()
+    manager = DatabaseManager(path)
+    try:
+        assert manager.create_tables()
+        assert manager._query_one("PRAGMA user_version")[0] == SCHEMA_VERSION
+        assert manager.get_student("000000001") == ("Sam One", 20, "s1@school.edu", "000000001")
+    finally:
+        manager.close()
@@ -0,0 +1,59 @@
+import pytest
+
+STUDENTS = ["000000001", "000000002", "000000003"]
+
+
+def ids(records) -> list[str]:
+    return [record.search_fields()[0] for record in records]
+
+
+@pytest.mark.parametrize("after_id, limit, expected", [
+    (None, 2, STUDENTS[:2]),
+    ("000000002", 2, STUDENTS[2:]),
+    ("000000003", 2, []),  # after the last ID
+    ("999999999", 2, []),  # past the end
+    ("000000001x", 5, STUDENTS[1:]),  # between two IDs
+    ("", 5, STUDENTS),  # before the first ID
+    (None, 0, []),
+    ("000000001", 0, []),
+    (None, -1, STUDENTS),  # negative limits mean no limit
+    ("000000001", -1, STUDENTS[1:]),
+])
+def test_iter_students_boundaries(school, after_id, limit, expected):
+    assert ids(school.iter_students(after_id, limit)) == expected
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 4])
+def test_paging_visits_every_record_once(school, limit):
+    for kind, expected in (("students", STUDENTS), ("instructors", ["111111111"]),
+                           ("courses", ["EECE230", "MATH201"])):
+        iterate = getattr(school, f"iter_{kind}")
+        seen, page = [], iterate(None, limit)
+        while page:
+            assert len(page) <= limit
+            seen += ids(page)
+            page = iterate(seen[-1], limit)
+        assert seen == expected
+
+
+def test_iter_instructors_and_courses_boundaries(school):
+    assert ids(school.iter_instructors("111111111")) == []
+    assert ids(school.iter_instructors(None, 0)) == []
+    assert ids(school.iter_instructors(None, -1)) == ["111111111"]
+    assert ids(school.iter_courses("EECE230")) == ["MATH201"]
+    assert ids(school.iter_courses("ZZZZ999")) == []
+    assert ids(school.iter_courses(None, 0)) == []
+    assert ids(school.iter_courses("A", -1)) == ["EECE230", "MATH201"]
+
+
+def test_iter_over_no_records(data_manager):
+    assert data_manager.iter_students() == []
+    assert data_manager.iter_students("000000001", -1) == []
+    assert data_manager.iter_courses(None, 0) == []
+
+
+def test_iter_follows_additions_and_removals(school):
+    school.remove_student("000000002")
+    assert ids(school.iter_students("000000001", 1)) == ["000000003"]
+    school.add_student(name="Ada Zero", age=21, email="s0@school.edu", student_id="000000000")
+    assert ids(school.iter_students(None, 2)) == ["000000000", "000000001"]
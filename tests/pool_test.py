@@ -0,0 +1,109 @@
+import gc
+import sqlite3
+import threading
+
+import pytest
+
+from src.sms.data.db.pool import ConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"))
+    with pool.write() as conn:
+        conn.execute("CREATE TABLE t (n INTEGER PRIMARY KEY)")
+        conn.commit()
+    yield pool
+    pool.close()
+
+
+def in_thread(function):
+    """Runs a function in a new thread, waits for it, and returns its result."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(function()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def count(pool: ConnectionPool) -> int:
+    return pool.cursor().execute("SELECT count(*) FROM t").fetchone()[0]
+
+
+def test_database_is_in_wal_mode(pool):
+    assert pool.journal_mode == "wal"
+    assert pool.reader().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_each_thread_reads_through_its_own_connection(pool):
+    conn = pool.reader()
+    assert pool.reader() is conn
+    assert pool.cursor() is pool.cursor()
+    assert conn is not pool.writer
+    assert in_thread(pool.reader) is not conn
+
+
+def test_reads_inside_write_see_uncommitted_changes(pool):
+    with pool.write() as conn:
+        assert pool.reader() is conn
+        conn.execute("INSERT INTO t VALUES (1)")
+        assert count(pool) == 1
+        # other threads keep reading the last committed state, without waiting for the writer
+        assert in_thread(lambda: count(pool)) == 0
+        conn.commit()
+    assert pool.reader() is not pool.writer
+    assert count(pool) == 1
+
+
+def test_writes_are_serialized(pool):
+    entered = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.write():
+            entered.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    entered.wait()
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool._write_lock.acquire(timeout=0.05)))
+    waiter.start()
+    waiter.join()
+    release.set()
+    holder.join()
+    assert acquired == [False]
+
+
+def test_reader_connections_are_closed_when_their_threads_exit(pool):
+    readers = [in_thread(pool.reader) for _ in range(20)]
+    gc.collect()
+    assert pool._connections == [pool.writer]
+    for conn in readers:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_close_closes_every_connection(pool):
+    started = threading.Event()
+    stop = threading.Event()
+    readers = []
+
+    def read():
+        readers.append(pool.reader())
+        started.set()
+        stop.wait()
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    started.wait()
+    main_reader = pool.reader()
+    pool.close()
+    stop.set()
+    thread.join()
+    gc.collect()
+    for conn in (pool.writer, main_reader, *readers):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    assert pool._connections == []
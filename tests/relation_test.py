@@ -0,0 +1,96 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from src.sms.models.relation import LazyRelation, RelationSet
+
+
+def item(item_id: str) -> SimpleNamespace:
+    return SimpleNamespace(item_id=item_id)
+
+
+def test_lazy_relation_loads_once_on_first_use():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [item("a"), item("b")]
+
+    relation = LazyRelation("item_id", loader)
+    assert not relation.loaded
+    assert relation.ids() == ["a", "b"]
+    assert relation.loaded
+    assert len(relation) == 2
+    assert calls == [1]
+
+
+def test_lazy_relation_stays_unloaded_when_the_loader_fails():
+    attempts = []
+
+    def loader():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("unavailable")
+        return [item("a")]
+
+    relation = LazyRelation("item_id", loader)
+    try:
+        relation.ids()
+    except RuntimeError:
+        pass
+    assert not relation.loaded
+    assert relation.ids() == ["a"]
+
+
+def test_lazy_relation_keeps_items_linked_back_while_loading():
+    relation = None
+
+    def loader():
+        # as a loaded object linking back to its owner does
+        relation.add(item("c"))
+        assert "c" in relation
+        return [item("a")]
+
+    relation = LazyRelation("item_id", loader)
+    assert relation.ids() == ["a", "c"]
+
+
+def test_lazy_relation_makes_other_threads_wait_for_the_load():
+    started = threading.Event()
+
+    def loader():
+        started.set()
+        time.sleep(0.2)
+        return [item("a"), item("b")]
+
+    relation = LazyRelation("item_id", loader, threading.RLock())
+    results = {}
+
+    def first():
+        results["first"] = relation.ids()
+
+    def second():
+        started.wait()
+        results["loaded while loading"] = relation.loaded
+        results["second"] = relation.ids()
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {"first": ["a", "b"], "loaded while loading": False, "second": ["a", "b"]}
+
+
+def test_lazy_relation_clear_skips_the_loader():
+    relation = LazyRelation("item_id", lambda: [item("a")])
+    relation.clear()
+    assert relation.loaded
+    assert relation.ids() == []
+
+
+def test_relation_set_from_mapping():
+    a = item("a")
+    relation = RelationSet.from_mapping("item_id", {"a": a})
+    assert a in relation and "a" in relation
+    assert relation.copy().ids() == ["a"]
@@ -0,0 +1,171 @@
+import sqlite3
+
+import pytest
+
+from src.sms.data.db.manager import DatabaseManager
+from src.sms.data.db.migrations import SCHEMA_VERSION
+from src.sms.utils.ngram import NGramIndex
+
+
+def ids(records) -> list[str]:
+    return [record.search_fields()[0] for record in records]
+
+
+@pytest.fixture
+def dbm(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "search.db"))
+    manager.create_tables()
+    manager.add_instructor("111111111", "Ann Lee", 40, "ann@school.edu")
+    for n, name in enumerate(("Sam One", "Kim Two", "Lou Three"), start=1):
+        manager.add_student(f"00000000{n}", name, 20, f"s{n}@school.edu")
+    yield manager
+    manager.close()
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("three", ["000000003"]),  # full-text index, ignoring case
+    ("@SCHOOL.edu", ["000000001", "000000002", "000000003"]),
+    ("000000002", ["000000002"]),
+    ("o", ["000000001", "000000002", "000000003"]),  # shorter than a trigram: scanned
+    ("Tw", ["000000002"]),
+    ("", ["000000001", "000000002", "000000003"]),
+    ("nobody", []),
+    ("%", []),  # LIKE wildcards are matched literally
+    ("_", []),
+    ('"Sam"', []),  # so are FTS5 query operators
+])
+def test_search_students(school, query, expected):
+    assert ids(school.search_students(query)) == expected
+
+
+def test_search_instructors_and_courses(school):
+    assert ids(school.search_instructors("lee")) == ["111111111"]
+    assert ids(school.search_instructors("11")) == ["111111111"]
+    assert ids(school.search_courses("eece")) == ["EECE230"]
+    assert ids(school.search_courses("calc")) == ["MATH201"]
+    assert ids(school.search_courses("2")) == ["EECE230", "MATH201"]
+    assert school.search_courses("math201")[0].instructor.instructor_id == "111111111"
+
+
+def test_search_follows_edits_and_removals(school):
+    school.edit_student(student_id="000000001", name="Zed Zulu")
+    school.remove_student("000000002")
+    assert ids(school.search_students("zulu")) == ["000000001"]
+    assert school.search_students("sam") == []
+    assert school.search_students("kim") == []
+
+
+def test_database_search_uses_its_full_text_index(dbm):
+    assert dbm.search_enabled
+    plan = dbm._query("EXPLAIN QUERY PLAN " + "SELECT 1 FROM students_search WHERE students_search MATCH 'one'")
+    assert any("VIRTUAL TABLE INDEX" in row[-1] for row in plan)
+
+
+def test_database_search_without_full_text_index_scans(dbm):
+    dbm.search_enabled = False
+    assert [row[3] for row in dbm.search_students("three")] == ["000000003"]
+    assert [row[3] for row in dbm.search_students("SCHOOL")] == ["000000001", "000000002", "000000003"]
+
+
+def test_database_search_survives_vacuum(dbm):
+    # VACUUM may renumber the implicit rowids of the TEXT-keyed tables, most likely once rows were deleted
+    dbm.delete_student("000000001")
+    with dbm.pool.write() as conn:
+        conn.execute("VACUUM")
+    assert [row[3] for row in dbm.search_students("three")] == ["000000003"]
+    assert [row[3] for row in dbm.search_students("two")] == ["000000002"]
+    assert dbm.search_students("one") == []
+
+
+def test_database_search_after_deferred_bulk_load(dbm):
+    dbm.bulk_load(students=[("000000004", "New Four", 20, "s4@school.edu")], defer_indexes=True)
+    assert [row[3] for row in dbm.search_students("four")] == ["000000004"]
+    dbm.bulk_load(students=[("000000005", "New Five", 20, "s5@school.edu")], replace=True, defer_indexes=True)
+    assert [row[3] for row in dbm.search_students("school")] == ["000000005"]
+
+
+def test_search_indexes_are_created_by_a_migration_and_populated(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE students (name TEXT NOT NULL, age INTEGER NOT NULL, email TEXT NOT NULL, "
+                 "student_id TEXT PRIMARY KEY)")
+    conn.execute("INSERT INTO students VALUES ('Old Timer', 30, 'old@school.edu', '000000009')")
+    conn.commit()
+    conn.close()
+
+    manager = DatabaseManager(path)
+    try:
+        assert manager.create_tables()
+        assert manager.search_enabled
+        assert manager._query_one("PRAGMA user_version")[0] == SCHEMA_VERSION
+        assert [row[3] for row in manager.search_students("timer")] == ["000000009"]
+    finally:
+        manager.close()
+
+
+def test_search_migration_replaces_rowid_keyed_indexes(tmp_path):
+    path = str(tmp_path / "v1.db")
+    manager = DatabaseManager(path)
+    manager.create_tables()
+    manager.add_student("000000001", "Sam One", 20, "s1@school.edu")
+    with manager.pool.write() as conn:
+        # the index an older release kept in sync through the students' implicit rowids
+        conn.execute("DROP TRIGGER students_search_insert")
+        conn.execute("DROP TABLE students_search")
+        conn.execute("CREATE VIRTUAL TABLE students_search USING fts5 (student_id, name, email, "
+                     "content = 'students', content_rowid = 'rowid', tokenize = 'trigram')")
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+    manager.close()
+
+    manager = DatabaseManager(path)
+    try:
+        assert manager.create_tables()
+        assert manager._query_one("PRAGMA user_version")[0] == SCHEMA_VERSION
+        manager.add_student("000000002", "Kim Two", 20, "s2@school.edu")
+        assert [row[3] for row in manager.search_students("school")] == ["000000001", "000000002"]
+    finally:
+        manager.close()
+
+
+def test_ngram_index_search():
+    index = NGramIndex()
+    index.add("a", "Sam One", "s1@school.edu")
+    index.add("b", "Kim Two", "s2@school.edu")
+    index.add("c", "Lou Three", "s3@school.edu")
+    assert index.search("THREE") == ["c"]
+    assert index.search("school") == ["a", "b", "c"]
+    assert index.search("o") == ["a", "b", "c"]
+    assert index.search("") == ["a", "b", "c"]
+    assert index.search("nes") == []  # "Sam One" + "s1@..." would only match across fields
+    assert index.search("one two") == []
+    assert len(index) == 3
+
+
+def test_ngram_index_replaces_and_removes():
+    index = NGramIndex()
+    index.add("a", "Sam One")
+    index.add("b", "Kim Two")
+    index.add("a", "Zed Zulu")
+    assert index.search("zulu") == ["a"]
+    assert index.search("one") == []
+    assert index.search("z") == ["a"]
+    # a replaced record keeps its position
+    index.add("b", "Zoe Zulu")
+    assert index.search("zulu") == ["a", "b"]
+    index.remove("a")
+    index.remove("missing")
+    assert index.search("zulu") == ["b"]
+    assert index._postings.get("zed") is None
+    index.clear()
+    assert len(index) == 0
+    assert index.search("zoe") == []
+
+
+def test_ngram_index_of_other_gram_sizes():
+    index = NGramIndex(n=2)
+    index.add(1, "abc")
+    index.add(2, "bcd")
+    assert index.search("bc") == [1, 2]
+    assert index.search("b") == [1, 2]
+    assert index.search("cd") == [2]
@@ -0,0 +1,136 @@
+import io
+import os
+import struct
+import zlib
+
+import pytest
+
+from src.sms.data.dm import snapshot
+from src.sms.data.dm.columnar import ColumnarDataManager
+from src.sms.data.dm.file import FileManager
+from src.sms.data.dm.interface import DataError
+from src.sms.data.dm.snapshot import SnapshotError, read_snapshot, write_snapshot
+from src.sms.models.course import Course
+from src.sms.models.instructor import Instructor
+from src.sms.models.student import Student
+
+
+def school() -> FileManager:
+    fm = FileManager()
+    for n, name in enumerate(("Ann Lee", "Zoë Müller"), start=1):
+        instructor = Instructor.from_trusted(name, 40 + n, f"i{n}@school.edu", f"11111111{n}")
+        fm.instructors[instructor.instructor_id] = instructor
+    instructors = list(fm.instructors.values())
+    for n, (course_id, name) in enumerate((("EECE230", "Programming"), ("MATH201", "Calculus"),
+                                           ("PHYS101", "Physics"))):
+        fm.courses[course_id] = Course.from_trusted(course_id, name, instructors[n % 2])
+    for n, name in enumerate(("Sam One", "Kim Two", "Lou Three"), start=1):
+        student = Student.from_trusted(name, 20 + n, f"s{n}@school.edu", f"00000000{n}")
+        for course in list(fm.courses.values())[:n - 1]:
+            student.register_course(course)
+        fm.students[student.student_id] = student
+    return fm
+
+
+def summary(fm: FileManager) -> tuple:
+    return ([(i.to_dict(), i.assigned_courses.ids()) for i in fm.instructors.values()],
+            [(c.to_dict(), c.enrolled_students.ids()) for c in fm.courses.values()],
+            [s.to_dict() for s in fm.students.values()])
+
+
+def snapshot_bytes(fm: FileManager) -> bytes:
+    buffer = io.BytesIO()
+    size = write_snapshot(buffer, fm.instructors.values(), fm.courses.values(), fm.students.values())
+    assert size == len(buffer.getvalue())
+    return buffer.getvalue()
+
+
+def with_checksum(body: bytes) -> bytes:
+    return body + struct.pack("<I", zlib.crc32(body))
+
+
+def test_round_trip(tmp_path):
+    fm = school()
+    path = str(tmp_path / "data.snap")
+    fm.save_to_snapshot(path)
+    loaded = FileManager.from_snapshot(path)
+    assert summary(loaded) == summary(fm)
+    course = loaded.courses["MATH201"]
+    assert course.instructor is loaded.instructors["111111112"]
+    assert loaded.students["000000003"] in course.enrolled_students
+
+
+def test_round_trip_of_no_data():
+    data = snapshot_bytes(FileManager())
+    assert read_snapshot(io.BytesIO(data)) == ({}, {}, {})
+
+
+@pytest.mark.parametrize("position", [snapshot._HEADER.size, 20, -5])
+def test_checksum_mismatch_is_rejected(position):
+    data = bytearray(snapshot_bytes(school()))
+    data[position] ^= 0x01
+    with pytest.raises(SnapshotError, match="checksum"):
+        read_snapshot(io.BytesIO(bytes(data)))
+
+
+def test_wrong_magic_is_rejected():
+    data = snapshot_bytes(school())
+    with pytest.raises(SnapshotError, match="not a snapshot"):
+        read_snapshot(io.BytesIO(b"SMSC" + data[4:]))
+
+
+def test_wrong_version_is_rejected():
+    data = snapshot_bytes(school())
+    body = data[:4] + struct.pack("<H", snapshot.VERSION + 1) + data[6:-4]
+    with pytest.raises(SnapshotError, match="version"):
+        read_snapshot(io.BytesIO(with_checksum(body)))
+
+
+@pytest.mark.parametrize("body_end", [snapshot._HEADER.size + 2, -9])
+def test_truncated_snapshot_is_rejected(body_end):
+    body = snapshot_bytes(school())[:-4]
+    with pytest.raises(SnapshotError):
+        read_snapshot(io.BytesIO(with_checksum(body[:body_end])))
+
+
+def test_short_file_and_trailing_data_are_rejected():
+    with pytest.raises(SnapshotError, match="too short"):
+        read_snapshot(io.BytesIO(b"SMSS"))
+    body = snapshot_bytes(school())[:-4]
+    with pytest.raises(SnapshotError, match="unexpected data"):
+        read_snapshot(io.BytesIO(with_checksum(body + b"\0")))
+
+
+def dangling_instructor() -> FileManager:
+    fm = school()
+    del fm.instructors["111111112"]
+    return fm
+
+
+def dangling_course() -> FileManager:
+    fm = school()
+    del fm.courses["EECE230"]
+    return fm
+
+
+@pytest.mark.parametrize("make", [dangling_instructor, dangling_course], ids=["instructor", "course"])
+def test_dangling_reference_keeps_the_previous_snapshot(tmp_path, make):
+    path = tmp_path / "data.snap"
+    school().save_to_snapshot(str(path))
+    previous = path.read_bytes()
+    with pytest.raises(SnapshotError):
+        make().save_to_snapshot(str(path))
+    assert path.read_bytes() == previous
+    assert os.listdir(tmp_path) == ["data.snap"]
+
+
+def test_removed_instructor_with_courses_fails_the_export(memory_manager, tmp_path):
+    memory_manager.add_instructor(name="Ann Lee", age=40, email="ann@school.edu", instructor_id="111111111")
+    memory_manager.add_course(course_id="EECE230", course_name="Programming",
+                              instructor=memory_manager.get_instructor("111111111"))
+    memory_manager.remove_instructor("111111111")
+    with pytest.raises(DataError):
+        memory_manager.data_to_snapshot(str(tmp_path / "data.snap"))
+    with pytest.raises(DataError):
+        ColumnarDataManager.build(str(tmp_path / "data.col"), memory_manager)
+    assert os.listdir(tmp_path) == []
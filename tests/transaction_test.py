@@ -0,0 +1,156 @@
+import pytest
+
+from src.sms.data.dm import memory
+from src.sms.data.dm.interface import DataError
+
+
+class Abort(Exception):
+    pass
+
+
+def state(data_manager) -> tuple:
+    """Summarizes everything a data manager holds, with both sides of each enrollment."""
+    return (sorted((i.instructor_id, i.name, i.age) for i in data_manager.get_instructors()),
+            sorted((c.course_id, c.course_name, tuple(sorted(c.enrolled_students.ids())))
+                   for c in data_manager.get_courses()),
+            sorted((s.student_id, s.name, s.age, tuple(sorted(s.registered_courses.ids())))
+                   for s in data_manager.get_students()))
+
+
+def change_everything(data_manager):
+    data_manager.edit_student(student_id="000000001", name="Sam Renamed")
+    data_manager.remove_student("000000002")
+    data_manager.add_student(name="New Four", age=20, email="s4@school.edu", student_id="000000004")
+    data_manager.edit_course(course_id="EECE230", course_name="Programming I")
+    data_manager.enroll_many([("000000003", "MATH201"), ("000000004", "EECE230")])
+
+
+def test_transaction_commits_its_writes(school):
+    with school.transaction():
+        change_everything(school)
+    expected = state(school)
+    assert [s[0] for s in expected[2]] == ["000000001", "000000003", "000000004"]
+    assert ("EECE230", "Programming I", ("000000001", "000000004")) in expected[1]
+
+
+def test_failed_transaction_restores_everything(school):
+    before = state(school)
+    with pytest.raises(Abort):
+        with school.transaction():
+            change_everything(school)
+            raise Abort()
+    assert state(school) == before
+
+
+def test_failed_transaction_restores_relations(school):
+    # load both sides of the enrollments first, so the block changes loaded relations
+    state(school)
+    with pytest.raises(Abort):
+        with school.transaction():
+            school.remove_student("000000002")
+            school.enroll_student("000000003", "EECE230")
+            raise Abort()
+    assert sorted(school.get_course("EECE230").enrolled_students.ids()) == ["000000001", "000000002"]
+    assert sorted(school.get_course("MATH201").enrolled_students.ids()) == ["000000002"]
+    assert sorted(school.get_student("000000002").registered_courses.ids()) == ["EECE230", "MATH201"]
+    assert school.get_student("000000003").registered_courses.ids() == []
+
+
+def test_failed_transaction_leaves_no_stale_reads(school):
+    assert [s.student_id for s in school.search_students("Sam")] == ["000000001"]
+    with pytest.raises(Abort):
+        with school.transaction():
+            school.edit_student(student_id="000000001", name="Pat Renamed")
+            school.edit_instructor(instructor_id="111111111", age=41)
+            assert school.get_student("000000001").name == "Pat Renamed"
+            raise Abort()
+    assert school.get_student("000000001").name == "Sam One"
+    assert school.get_instructor("111111111").age == 40
+    assert [s.student_id for s in school.search_students("Sam")] == ["000000001"]
+    assert school.search_students("Pat") == []
+
+
+def test_failed_nested_transaction_only_undoes_its_own_writes(school):
+    with school.transaction():
+        school.edit_student(student_id="000000001", name="Sam Outer")
+        with pytest.raises(Abort):
+            with school.transaction():
+                school.edit_student(student_id="000000001", name="Sam Inner")
+                school.remove_student("000000003")
+                school.enroll_student("000000001", "MATH201")
+                raise Abort()
+        assert school.get_student("000000001").name == "Sam Outer"
+    students = state(school)[2]
+    assert ("000000001", "Sam Outer", 20, ("EECE230",)) in students
+    assert ("000000003", "Lou Three", 20, ()) in students
+
+
+def test_failed_outer_transaction_undoes_committed_inner_writes(school):
+    before = state(school)
+    with pytest.raises(Abort):
+        with school.transaction():
+            with school.transaction():
+                school.edit_student(student_id="000000001", name="Sam Inner")
+                school.enroll_student("000000003", "MATH201")
+            raise Abort()
+    assert state(school) == before
+
+
+def test_enroll_many_counts_new_enrollments_only(school):
+    pairs = [("000000003", "EECE230"), ("000000003", "EECE230"), ("000000001", "EECE230"), ("000000001", "MATH201")]
+    assert school.enroll_many(pairs) == 2
+    assert sorted(school.get_student("000000001").registered_courses.ids()) == ["EECE230", "MATH201"]
+    assert sorted(school.get_course("EECE230").enrolled_students.ids()) == ["000000001", "000000002", "000000003"]
+    assert school.enroll_many(pairs) == 0
+    assert school.enroll_many([]) == 0
+
+
+@pytest.mark.parametrize("pairs", [[("000000003", "EECE230"), ("000000009", "MATH201")],
+                                   [("000000003", "EECE230"), ("000000001", "PHYS101")]],
+                         ids=["missing student", "missing course"])
+def test_enroll_many_is_all_or_nothing(school, pairs):
+    before = state(school)
+    with pytest.raises(DataError):
+        school.enroll_many(pairs)
+    assert state(school) == before
+
+
+def test_enroll_students_in_one_course(school):
+    assert school.enroll_students("MATH201", ["000000001", "000000003", "000000002"]) == 2
+    assert sorted(school.get_course("MATH201").enrolled_students.ids()) == ["000000001", "000000002", "000000003"]
+    with pytest.raises(DataError):
+        school.enroll_students("PHYS101", ["000000001"])
+
+
+def test_memory_transaction_logs_only_what_it_changes(memory_manager):
+    for n, name in enumerate(("Sam One", "Kim Two", "Lou Three"), start=1):
+        memory_manager.add_student(name=name, age=20, email=f"s{n}@school.edu", student_id=f"00000000{n}")
+    students = memory.datastore.students
+    with pytest.raises(Abort):
+        with memory_manager.transaction():
+            keys, changed = memory_manager._transactions[-1]
+            assert (keys, changed) == ({}, {})
+            memory_manager.remove_student("000000003")
+            memory_manager.edit_student(student_id="000000001", name="Sam Renamed")
+            assert set(keys) == {("students", "000000003")}
+            assert len(changed) == 1
+            raise Abort()
+    assert memory.datastore.students is students
+    assert [s.student_id for s in memory_manager.search_students("Lou")] == ["000000003"]
+    assert [s.student_id for s in memory_manager.search_students("Sam")] == ["000000001"]
+    assert [s.student_id for s in memory_manager.iter_students("000000002")] == ["000000003"]
+
+
+def test_failed_transaction_undoes_a_replacing_import(school, tmp_path):
+    path = str(tmp_path / "data.json")
+    school.data_to_json(path)
+    school.remove_student("000000003")
+    school.data_to_json(str(tmp_path / "smaller.json"))
+    school.data_from_json(path)
+    before = state(school)
+    with pytest.raises(Abort):
+        with school.transaction():
+            school.data_from_json(str(tmp_path / "smaller.json"))
+            assert len(school.get_students()) == 2
+            raise Abort()
+    assert state(school) == before